@@ -0,0 +1,42 @@
+"""
+算法事件流
+
+MazeGenerator 与 PathFinder 的每个算法都实现为 iter_* 生成器方法，依次产出 (x, y, state) 事件，
+生成器的返回值（StopIteration.value）为算法结果（寻路为路径，生成为None）。
+iter_* 方法带有 emit 参数：为False时不产出任何事件，整个算法在第一次 next() 中一次跑完，
+无界面运行没有逐事件的开销。阻塞的 generate_* / find_path_* 方法用 run_events 驱动它们。
+
+使用方可以自行决定消费节奏：逐个回调（界面动画）、批量合并、丢弃、录制或直接跳过。
+"""
+
+
+def run_events(events, update=None):
+    """
+    驱动事件生成器直到结束
+
+    参数:
+        events: iter_* 方法返回的生成器
+        update: 事件回调 update(x, y, state)，为None时丢弃事件
+
+    返回:
+        生成器的返回值
+    """
+    while True:
+        try:
+            event = next(events)
+        except StopIteration as stop:
+            return stop.value
+        if update is not None:
+            update(*event)
+
+
+def record_events(events):
+    """
+    录制事件流
+
+    返回:
+        (事件列表, 生成器的返回值) 元组
+    """
+    recorded = []
+    result = run_events(events, lambda x, y, state: recorded.append((x, y, state)))
+    return recorded, result
@@ -0,0 +1,125 @@
+"""
+批量生成迷宫（多进程，无界面运行，不依赖tkinter）
+
+用法:
+    python batch_generate.py --algo DFS --size 101 --count 50000 --output mazes.txt
+    python batch_generate.py --algo Prim Kruskal --width 201 --height 101 --seed-start 1000 --count 200 -o out.txt
+
+输出文件每行一个迷宫：种子编码与Base64编码，以制表符分隔，例如
+    DFS:101x101:0<TAB>101,101,....
+种子编码可以单独用于重新生成同一个迷宫（见 maze_codec.decode_maze_code）。
+"""
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import os
+import sys
+import time
+from maze_grid import MazeGrid
+from maze_generator import MazeGenerator
+from maze_codec import encode_maze_to_base64, encode_maze_to_seed
+
+
+def generate_one(task):
+    """
+    生成单个迷宫（在工作进程中执行）
+
+    参数:
+        task: (algo, width, height, seed) 元组
+
+    返回:
+        输出文件中的一行（不含换行符）
+    """
+    algo, width, height, seed = task
+    grid = MazeGrid.bordered(width, height)
+    MazeGenerator(grid, width, height, seed=seed).generate(algo)
+    return f"{encode_maze_to_seed(algo, width, height, seed)}\t{encode_maze_to_base64(grid)}"
+
+
+def iter_tasks(algos, width, height, seed_start, count):
+    """按 种子 -> 算法 的顺序产出任务"""
+    for seed in range(seed_start, seed_start + count):
+        for algo in algos:
+            yield algo, width, height, seed
+
+
+def run_batch(algos, width, height, seed_start, count, output, workers=None, chunksize=16, progress=None):
+    """
+    用进程池批量生成迷宫，按任务顺序逐行写入output
+
+    参数:
+        algos: 生成算法名列表（见 MazeGenerator.ALGORITHMS）
+        width, height: 迷宫尺寸
+        seed_start, count: 使用的种子为 seed_start .. seed_start + count - 1
+        output: 文本文件对象
+        workers: 工作进程数，None表示CPU核心数；为1时在当前进程中生成
+        chunksize: 每次分派给工作进程的任务数
+        progress: 进度回调 progress(done, total)
+
+    返回:
+        写入的行数
+    """
+    for algo in algos:
+        if algo not in MazeGenerator.ALGORITHMS:
+            raise ValueError(f"未知的生成算法: {algo}")
+    if width % 2 == 0 or height % 2 == 0 or width < 5 or height < 5:
+        raise ValueError("迷宫尺寸必须为不小于5的奇数")
+
+    total = len(algos) * count
+    tasks = iter_tasks(algos, width, height, seed_start, count)
+    done = 0
+
+    if workers == 1:
+        lines = map(generate_one, tasks)
+        executor = None
+    else:
+        executor = ProcessPoolExecutor(max_workers=workers)
+        lines = executor.map(generate_one, tasks, chunksize=chunksize)
+    try:
+        for line in lines:
+            output.write(line)
+            output.write('\n')
+            done += 1
+            if progress is not None:
+                progress(done, total)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+    return done
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="多进程批量生成迷宫")
+    parser.add_argument('--algo', nargs='+', default=["DFS"], choices=list(MazeGenerator.ALGORITHMS),
+                        help="生成算法（可指定多个，每个种子对每个算法各生成一个迷宫）")
+    parser.add_argument('--size', type=int, default=None, help="迷宫边长（奇数），同时设置宽度和高度")
+    parser.add_argument('--width', type=int, default=101, help="迷宫宽度（奇数）")
+    parser.add_argument('--height', type=int, default=101, help="迷宫高度（奇数）")
+    parser.add_argument('--seed-start', type=int, default=0, help="起始种子")
+    parser.add_argument('--count', type=int, default=100, help="种子数量")
+    parser.add_argument('--workers', type=int, default=None, help="工作进程数（默认CPU核心数）")
+    parser.add_argument('--chunksize', type=int, default=16, help="每次分派给工作进程的任务数")
+    parser.add_argument('-o', '--output', required=True, help="输出文件路径")
+    args = parser.parse_args(argv)
+
+    width = height = args.size
+    if args.size is None:
+        width, height = args.width, args.height
+
+    total = len(args.algo) * args.count
+    step = max(1, total // 20)
+
+    def progress(done, total):
+        if done % step == 0 or done == total:
+            print(f"\r已生成 {done}/{total}", end='', file=sys.stderr, flush=True)
+
+    start_time = time.time()
+    with open(args.output, 'w', encoding='ascii') as f:
+        written = run_batch(args.algo, width, height, args.seed_start, args.count, f,
+                            workers=args.workers, chunksize=args.chunksize, progress=progress)
+    elapsed = time.time() - start_time
+    print(f"\n完成：{written} 个迷宫写入 {args.output}，耗时 {elapsed:.2f}s "
+          f"（{os.cpu_count() if args.workers is None else args.workers} 个进程）", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
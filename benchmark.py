@@ -0,0 +1,410 @@
+"""
+算法性能基准测试（无界面运行，不依赖tkinter）
+
+用法:
+    python benchmark.py solvers [--size 201] [--seeds 0 1 2] [--algos AStar D-AStar JPS] [--open-ratio 0.3]
+                              [--queues heap bucket radix]
+    python benchmark.py junction [--size 1001] [--seeds 0] [--algo Dijkstra]
+    python benchmark.py incremental [--size 301] [--seeds 0] [--edits 50] [--open-ratio 0.3]
+    python benchmark.py tree [--size 1001] [--seeds 0] [--queries 1000]
+    python benchmark.py generators [--sizes 51 101 201 501 1001 2001] [--seeds 0 1 2] [--algos DFS Prim]
+                                 [--no-memory] [--json result.json] [--baseline baseline.json]
+"""
+import argparse
+import json
+import platform
+import random
+import time
+import tracemalloc
+from maze_grid import MazeGrid
+from maze_generator import MazeGenerator
+from path_finder import PathFinder
+from junction_graph import JunctionGraph
+from priority_queue import QUEUES
+from incremental_planner import IncrementalPlanner
+from tree_index import TreeIndex
+
+try:
+    import numpy as np
+except ImportError:  # NumPy为可选依赖，只用于在结果中记录运行环境
+    np = None
+
+
+def make_maze(algo, size, seed, open_ratio=0.0):
+    """
+    生成测试迷宫
+
+    参数:
+        algo: 生成算法名（见 MazeGenerator.ALGORITHMS）
+        size: 迷宫边长（奇数）
+        seed: 随机种子
+        open_ratio: 挖空为矩形房间的面积比例，模拟拖拽编辑后的开阔区域
+    """
+    grid = MazeGrid.bordered(size, size)
+    generator = MazeGenerator(grid, size, size, seed=seed)
+    generator.generate(algo)
+    rng = generator.rng
+
+    # 随机挖出矩形房间，直到累计面积达到目标（房间之间允许重叠）
+    cells = grid.cells
+    target = int((size - 2) ** 2 * open_ratio)
+    max_side = max(3, size // 5)
+    cleared = 0
+    while cleared < target:
+        room_w = rng.randint(3, max_side)
+        room_h = rng.randint(3, max_side)
+        x0 = rng.randint(1, size - 1 - room_w)
+        y0 = rng.randint(1, size - 1 - room_h)
+        for y in range(y0, y0 + room_h):
+            row = y * size + x0
+            cells[row:row + room_w] = bytes(room_w)
+        cleared += room_w * room_h
+    return grid
+
+
+def bench_solvers(size, seeds, algos, open_ratio, queues=("heap",)):
+    """在多个场景下对比寻路算法（及优先队列实现），返回结果行列表"""
+    scenarios = [
+        ("Recursive", 0.0),
+        ("DFS", open_ratio),
+    ]
+    rows = []
+    for gen_algo, ratio in scenarios:
+        scenario = gen_algo if ratio == 0 else f"{gen_algo}+open{ratio:g}"
+        mazes = [make_maze(gen_algo, size, seed, ratio) for seed in seeds]
+        for algo in algos:
+            # 不使用优先队列的算法只跑一次；GBFS的优先级不单调，跳过基数堆
+            algo_queues = queues if algo in PathFinder.QUEUE_ALGORITHMS else queues[:1]
+            for queue in algo_queues:
+                if queue == "radix" and algo == "GBFS":
+                    continue
+                totals = {'length': 0, 'expanded': 0, 'pushes': 0, 'peak_frontier': 0, 'time': 0.0}
+                for grid in mazes:
+                    finder = PathFinder(grid, size, size, (1, 1), (size - 2, size - 2))
+
+                    t0 = time.perf_counter()
+                    path, stats = finder.solve(algo, queue)
+                    totals['time'] += time.perf_counter() - t0
+
+                    totals['length'] += len(path) if path else 0
+                    for key in ('expanded', 'pushes', 'peak_frontier'):
+                        totals[key] += stats[key]
+
+                n = len(seeds)
+                rows.append({
+                    'scenario': scenario,
+                    'algo': algo,
+                    'queue': queue if algo in PathFinder.QUEUE_ALGORITHMS else '-',
+                    'length': totals['length'] / n,
+                    'expanded': totals['expanded'] / n,
+                    'pushes': totals['pushes'] / n,
+                    'peak_frontier': totals['peak_frontier'] / n,
+                    'time_ms': totals['time'] / n * 1000,
+                })
+    return rows
+
+
+def print_solver_table(rows):
+    header = (f"{'scenario':<16}{'algo':<10}{'queue':<8}{'length':>10}{'expanded':>12}{'pushes':>12}"
+              f"{'peak':>10}{'time(ms)':>12}")
+    print(header)
+    print('-' * len(header))
+    for r in rows:
+        print(f"{r['scenario']:<16}{r['algo']:<10}{r['queue']:<8}{r['length']:>10.0f}{r['expanded']:>12.0f}"
+              f"{r['pushes']:>12.0f}{r['peak_frontier']:>10.0f}{r['time_ms']:>12.2f}")
+
+
+def bench_junction(size, seeds, algo):
+    """对比通道压缩图与原网格上的寻路，返回结果行列表"""
+    rows = []
+    for gen_algo in ("DFS", "Prim", "Kruskal"):
+        for seed in seeds:
+            grid = make_maze(gen_algo, size, seed)
+            open_cells = grid.size - sum(grid.cells)
+            start, end = (1, 1), (size - 2, size - 2)
+
+            t0 = time.perf_counter()
+            graph = JunctionGraph(grid)
+            build_time = time.perf_counter() - t0
+
+            t0 = time.perf_counter()
+            _, graph_stats = graph.solve(start, end, algo)
+            graph_time = time.perf_counter() - t0
+
+            t0 = time.perf_counter()
+            _, grid_stats = PathFinder(grid, size, size, start, end).solve(algo)
+            grid_time = time.perf_counter() - t0
+
+            rows.append({
+                'generator': gen_algo,
+                'seed': seed,
+                'cells': open_cells,
+                'nodes': graph.node_count,
+                'edges': graph.edge_count,
+                'build_ms': build_time * 1000,
+                'grid_expanded': grid_stats['expanded'],
+                'graph_expanded': graph_stats['expanded'],
+                'grid_ms': grid_time * 1000,
+                'graph_ms': graph_time * 1000,
+            })
+    return rows
+
+
+def print_junction_table(rows):
+    header = (f"{'generator':<10}{'seed':>6}{'cells':>10}{'nodes':>10}{'shrink':>8}{'build(ms)':>11}"
+              f"{'grid exp':>10}{'graph exp':>11}{'grid(ms)':>10}{'graph(ms)':>11}")
+    print(header)
+    print('-' * len(header))
+    for r in rows:
+        print(f"{r['generator']:<10}{r['seed']:>6}{r['cells']:>10}{r['nodes']:>10}{r['cells'] / r['nodes']:>8.2f}"
+              f"{r['build_ms']:>11.1f}{r['grid_expanded']:>10}{r['graph_expanded']:>11}"
+              f"{r['grid_ms']:>10.1f}{r['graph_ms']:>11.1f}")
+
+
+def bench_incremental(size, seeds, edits, open_ratio):
+    """随机切换墙壁后，对比LPA*增量修复与A*重新搜索，返回结果行列表"""
+    rows = []
+    for seed in seeds:
+        grid = make_maze("DFS", size, seed, open_ratio)
+        start, end = (1, 1), (size - 2, size - 2)
+        planner = IncrementalPlanner(grid, start, end)
+
+        t0 = time.perf_counter()
+        planner.solve()
+        initial_time = time.perf_counter() - t0
+
+        rng = random.Random(seed)
+        replan_times = []
+        full_times = []
+        for _ in range(edits):
+            x, y = rng.randrange(1, size - 1), rng.randrange(1, size - 1)
+            if (x, y) in (start, end):
+                continue
+            grid.set(x, y, 1 - grid.get(x, y))
+            planner.notify_changed(x, y)
+
+            t0 = time.perf_counter()
+            path, _ = planner.solve()
+            replan_times.append(time.perf_counter() - t0)
+
+            t0 = time.perf_counter()
+            full_path, _ = PathFinder(grid, size, size, start, end).solve("AStar")
+            full_times.append(time.perf_counter() - t0)
+
+            if (path is None) != (full_path is None) or (path and len(path) != len(full_path)):
+                raise AssertionError(f"增量修复结果与A*不一致 (seed={seed}, cell={(x, y)})")
+
+        replan_times.sort()
+        full_times.sort()
+        rows.append({
+            'seed': seed,
+            'edits': len(replan_times),
+            'initial_ms': initial_time * 1000,
+            'replan_median_ms': replan_times[len(replan_times) // 2] * 1000,
+            'replan_max_ms': replan_times[-1] * 1000,
+            'astar_median_ms': full_times[len(full_times) // 2] * 1000,
+        })
+    return rows
+
+
+def print_incremental_table(rows):
+    header = f"{'seed':>6}{'edits':>8}{'initial(ms)':>13}{'replan med':>12}{'replan max':>12}{'A* med':>10}"
+    print(header)
+    print('-' * len(header))
+    for r in rows:
+        print(f"{r['seed']:>6}{r['edits']:>8}{r['initial_ms']:>13.1f}{r['replan_median_ms']:>12.2f}"
+              f"{r['replan_max_ms']:>12.2f}{r['astar_median_ms']:>10.2f}")
+
+
+def bench_tree(size, seeds, queries):
+    """完美迷宫上随机起终点查询：树索引与BFS对比，返回结果行列表"""
+    rows = []
+    for gen_algo in ("DFS", "Prim", "Kruskal", "Recursive"):
+        for seed in seeds:
+            grid = make_maze(gen_algo, size, seed)
+
+            t0 = time.perf_counter()
+            index = TreeIndex(grid)
+            build_time = time.perf_counter() - t0
+
+            rng = random.Random(seed)
+            cells = [(x, y) for y in range(1, size, 2) for x in range(1, size, 2)]
+            pairs = [(rng.choice(cells), rng.choice(cells)) for _ in range(queries)]
+
+            t0 = time.perf_counter()
+            for a, b in pairs:
+                index.distance(a, b)
+            query_time = time.perf_counter() - t0
+
+            # BFS只抽样少量查询估算单次耗时
+            sample = pairs[:max(1, min(queries, 5))]
+            t0 = time.perf_counter()
+            for a, b in sample:
+                PathFinder(grid, size, size, a, b).solve("BFS")
+            bfs_time = time.perf_counter() - t0
+
+            rows.append({
+                'generator': gen_algo,
+                'seed': seed,
+                'build_ms': build_time * 1000,
+                'query_us': query_time / queries * 1e6,
+                'bfs_us': bfs_time / len(sample) * 1e6,
+            })
+    return rows
+
+
+def print_tree_table(rows):
+    header = f"{'generator':<10}{'seed':>6}{'build(ms)':>11}{'query(us)':>11}{'BFS(us)':>12}"
+    print(header)
+    print('-' * len(header))
+    for r in rows:
+        print(f"{r['generator']:<10}{r['seed']:>6}{r['build_ms']:>11.1f}{r['query_us']:>11.2f}{r['bfs_us']:>12.0f}")
+
+
+def bench_generators(sizes, seeds, algos, memory=True):
+    """
+    无界面生成迷宫的尺寸扫描（生长树按每种选择策略分别计时），返回结果行列表
+
+    每个 (算法, 尺寸) 对每个种子计时一次，记录平均耗时与吞吐量（格点/秒）；
+    memory为True时用第一个种子在tracemalloc下另跑一次，记录生成过程的峰值内存
+    （不含迷宫网格本身；tracemalloc会显著拖慢运行，因此不与计时混在一起）。
+    """
+    rows = []
+    for algo in algos:
+        policies = MazeGenerator.GROWING_TREE_POLICIES if algo == "GrowingTree" else ("",)
+        for policy in policies:
+            for size in sizes:
+                def make_generator(seed):
+                    generator = MazeGenerator(MazeGrid.bordered(size, size), size, size, seed=seed)
+                    if policy:
+                        generator.growing_tree_policy = policy
+                    return generator
+
+                times = []
+                for seed in seeds:
+                    generator = make_generator(seed)
+                    t0 = time.perf_counter()
+                    generator.generate(algo)
+                    times.append(time.perf_counter() - t0)
+
+                peak = None
+                if memory:
+                    generator = make_generator(seeds[0])
+                    tracemalloc.start()
+                    generator.generate(algo)
+                    peak = tracemalloc.get_traced_memory()[1]
+                    tracemalloc.stop()
+
+                elapsed = sum(times) / len(times)
+                rows.append({
+                    'algo': algo,
+                    'policy': policy,
+                    'size': size,
+                    'time_ms': elapsed * 1000,
+                    'min_ms': min(times) * 1000,
+                    'cells_per_s': ((size - 1) // 2) ** 2 / elapsed if elapsed else float('inf'),
+                    'peak_kib': peak / 1024 if peak is not None else None,
+                })
+    return rows
+
+
+def compare_with_baseline(rows, baseline):
+    """按 (算法, 策略, 尺寸) 与基线结果对照，为每行加上耗时与内存相对基线的比值"""
+    base = {(r['algo'], r['policy'], r['size']): r for r in baseline['results']}
+    for r in rows:
+        b = base.get((r['algo'], r['policy'], r['size']))
+        r['time_ratio'] = r['time_ms'] / b['time_ms'] if b and b['time_ms'] else None
+        r['mem_ratio'] = (r['peak_kib'] / b['peak_kib']
+                          if b and r['peak_kib'] is not None and b.get('peak_kib') else None)
+    return rows
+
+
+def print_generator_table(rows):
+    with_baseline = any('time_ratio' in r for r in rows)
+    header = f"{'algo':<13}{'policy':<9}{'size':>6}{'time(ms)':>12}{'min(ms)':>12}{'cells/s':>14}{'peak(KiB)':>12}"
+    if with_baseline:
+        header += f"{'time/base':>11}{'mem/base':>10}"
+    print(header)
+    print('-' * len(header))
+
+    def ratio(value):
+        return f"{value:.2f}x" if value is not None else '-'
+
+    for r in rows:
+        peak = f"{r['peak_kib']:.0f}" if r['peak_kib'] is not None else '-'
+        line = (f"{r['algo']:<13}{r['policy']:<9}{r['size']:>6}{r['time_ms']:>12.1f}{r['min_ms']:>12.1f}"
+                f"{r['cells_per_s']:>14,.0f}{peak:>12}")
+        if with_baseline:
+            line += f"{ratio(r['time_ratio']):>11}{ratio(r['mem_ratio']):>10}"
+        print(line)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="迷宫算法性能基准测试")
+    sub = parser.add_subparsers(dest='command')
+    sub.required = True
+
+    solvers = sub.add_parser('solvers', help="对比寻路算法")
+    solvers.add_argument('--size', type=int, default=201, help="迷宫边长（奇数）")
+    solvers.add_argument('--seeds', type=int, nargs='+', default=[0, 1, 2], help="随机种子")
+    solvers.add_argument('--algos', nargs='+', default=["AStar", "D-AStar", "JPS"],
+                         choices=list(PathFinder.ALGORITHMS), help="参与对比的寻路算法")
+    solvers.add_argument('--open-ratio', type=float, default=0.3, help="挖空为房间的面积比例")
+    solvers.add_argument('--queues', nargs='+', default=["heap"], choices=list(QUEUES),
+                         help="Dijkstra/GBFS/A*使用的优先队列实现")
+
+    junction = sub.add_parser('junction', help="通道压缩图与原网格寻路对比")
+    junction.add_argument('--size', type=int, default=1001, help="迷宫边长（奇数）")
+    junction.add_argument('--seeds', type=int, nargs='+', default=[0], help="随机种子")
+    junction.add_argument('--algo', default="Dijkstra", choices=list(JunctionGraph.ALGORITHMS), help="寻路算法")
+
+    incremental = sub.add_parser('incremental', help="增量重规划与重新搜索对比")
+    incremental.add_argument('--size', type=int, default=301, help="迷宫边长（奇数）")
+    incremental.add_argument('--seeds', type=int, nargs='+', default=[0], help="随机种子")
+    incremental.add_argument('--edits', type=int, default=50, help="每个迷宫的随机编辑次数")
+    incremental.add_argument('--open-ratio', type=float, default=0.3, help="挖空为房间的面积比例")
+
+    tree = sub.add_parser('tree', help="树索引距离查询与BFS对比")
+    tree.add_argument('--size', type=int, default=1001, help="迷宫边长（奇数）")
+    tree.add_argument('--seeds', type=int, nargs='+', default=[0], help="随机种子")
+    tree.add_argument('--queries', type=int, default=1000, help="每个迷宫的随机查询次数")
+
+    generators = sub.add_parser('generators', help="生成算法的尺寸扫描（耗时、吞吐量、峰值内存）")
+    generators.add_argument('--sizes', type=int, nargs='+', default=[51, 101, 201, 501, 1001, 2001],
+                            help="迷宫边长（奇数）")
+    generators.add_argument('--seeds', type=int, nargs='+', default=[0, 1, 2], help="随机种子")
+    generators.add_argument('--algos', nargs='+', default=list(MazeGenerator.ALGORITHMS),
+                            choices=list(MazeGenerator.ALGORITHMS), help="参与对比的生成算法")
+    generators.add_argument('--no-memory', action='store_true', help="不测量峰值内存（tracemalloc）")
+    generators.add_argument('--json', help="把结果写入JSON文件，可作为之后的基线")
+    generators.add_argument('--baseline', help="与之前保存的JSON结果对比")
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'solvers':
+        print_solver_table(bench_solvers(args.size, args.seeds, args.algos, args.open_ratio, args.queues))
+    elif args.command == 'junction':
+        print_junction_table(bench_junction(args.size, args.seeds, args.algo))
+    elif args.command == 'incremental':
+        print_incremental_table(bench_incremental(args.size, args.seeds, args.edits, args.open_ratio))
+    elif args.command == 'tree':
+        print_tree_table(bench_tree(args.size, args.seeds, args.queries))
+    elif args.command == 'generators':
+        rows = bench_generators(args.sizes, args.seeds, args.algos, memory=not args.no_memory)
+        if args.json:
+            result = {
+                'python': platform.python_version(),
+                'numpy': np is not None,
+                'seeds': args.seeds,
+                'results': rows,
+            }
+            with open(args.json, 'w', encoding='utf-8') as f:
+                json.dump(result, f, indent=2)
+        if args.baseline:
+            with open(args.baseline, encoding='utf-8') as f:
+                compare_with_baseline(rows, json.load(f))
+        print_generator_table(rows)
+
+
+if __name__ == "__main__":
+    main()
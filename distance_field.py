@@ -0,0 +1,126 @@
+"""
+BFS距离场：一次计算出某个格点到所有可达格点的最短步数
+"""
+from array import array
+from maze_grid import as_grid
+
+try:
+    import numpy as np
+except ImportError:  # NumPy为可选依赖，缺失时使用纯Python实现
+    np = None
+
+# 波前小于该规模时逐格扩展（Python循环），否则整体向量化扩展
+VECTORIZE_THRESHOLD = 256
+
+
+def distance_field(maze, source, use_numpy=True):
+    """
+    计算source到迷宫中每个格点的BFS距离
+
+    参数:
+        maze: MazeGrid或二维列表，0（地面），1（墙壁）
+        source: 源点坐标 (x, y)
+        use_numpy: 是否使用NumPy向量化扩展波前（NumPy不可用时自动退回纯Python）
+
+    返回:
+        长度为 width * height 的 array('i')，下标为 y * width + x，
+        墙壁与不可达格点为 -1
+
+    实现:
+        在四周补一圈墙壁的网格上逐层扩展波前，邻居下标为 i ± 1、i ± (width + 2)，无需边界判断。
+        波前较大时（开阔、多环路迷宫）整层用NumPy数组运算扩展；
+        波前较小时（狭长通道）逐格扩展，避免每层都付出数组调用的固定开销。
+    """
+    grid = as_grid(maze)
+    w, h = grid.width, grid.height
+    sx, sy = source
+    pw = w + 2
+    padded_size = pw * (h + 2)
+
+    # 未访问的地面格点标记为1，外圈与墙壁为0
+    unvisited = bytearray(padded_size)
+    flipped = grid.cells.translate(bytes.maketrans(b'\x00\x01', b'\x01\x00'))
+    for y in range(h):
+        row = (y + 1) * pw + 1
+        unvisited[row:row + w] = flipped[y * w:(y + 1) * w]
+
+    dist = array('i', [-1]) * padded_size
+
+    s = (sy + 1) * pw + sx + 1
+    if 0 <= sx < w and 0 <= sy < h and unvisited[s]:
+        unvisited[s] = 0
+        dist[s] = 0
+        _expand_wavefront(unvisited, dist, s, pw, use_numpy and np is not None)
+
+    # 去掉外圈
+    result = array('i')
+    for y in range(h):
+        row = (y + 1) * pw + 1
+        result.extend(dist[row:row + w])
+    return result
+
+
+def _expand_wavefront(unvisited, dist, source, pw, vectorize):
+    """从source开始逐层扩展波前，原地写入dist"""
+    offsets = (-1, -pw, 1, pw)
+    frontier = [source]
+    d = 0
+
+    if vectorize:
+        # 与bytearray/array共享内存的NumPy视图，两种扩展方式可以随时切换
+        unvisited_np = np.frombuffer(unvisited, dtype=np.uint8)
+        dist_np = np.frombuffer(dist, dtype=np.int32)
+        offsets_np = np.array(offsets, dtype=np.int64)
+        stamp = np.empty(len(unvisited), dtype=np.int32)
+
+    while len(frontier):
+        d += 1
+        if vectorize and len(frontier) >= VECTORIZE_THRESHOLD:
+            nbrs = (np.asarray(frontier, dtype=np.int64)[:, None] + offsets_np).ravel()
+            nbrs = nbrs[unvisited_np[nbrs] == 1]
+            # 去重：同一格点被多次写入时只保留最后写入的那一份（避免排序）
+            order = np.arange(len(nbrs), dtype=np.int32)
+            stamp[nbrs] = order
+            nbrs = nbrs[stamp[nbrs] == order]
+            unvisited_np[nbrs] = 0
+            dist_np[nbrs] = d
+            frontier = nbrs if len(nbrs) >= VECTORIZE_THRESHOLD else nbrs.tolist()
+        else:
+            next_frontier = []
+            for i in frontier:
+                for o in offsets:
+                    j = i + o
+                    if unvisited[j]:
+                        unvisited[j] = 0
+                        dist[j] = d
+                        next_frontier.append(j)
+            frontier = next_frontier
+
+
+def path_from_field(maze, field, target):
+    """
+    沿距离场下降回溯从源点到target的最短路径
+
+    参数:
+        maze: MazeGrid或二维列表
+        field: distance_field 的返回值
+        target: 目标坐标 (x, y)
+
+    返回:
+        坐标元组列表（源点在前），不可达返回None
+    """
+    grid = as_grid(maze)
+    w = grid.width
+    cur = grid.index(*target)
+    if field[cur] < 0:
+        return None
+
+    path = [cur]
+    while field[cur] > 0:
+        for nxt in grid.neighbors(cur):
+            if field[nxt] == field[cur] - 1:
+                cur = nxt
+                break
+        path.append(cur)
+    path.reverse()
+    return [(i % w, i // w) for i in path]
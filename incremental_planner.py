@@ -0,0 +1,162 @@
+"""
+增量寻路：编辑墙壁后修复已有的最短路径（LPA*）
+"""
+from array import array
+import heapq
+from maze_grid import as_grid
+
+INF = 1 << 30
+
+
+class IncrementalPlanner:
+    """
+    Lifelong Planning A*（LPA*）
+
+    与A*一样从起点向终点搜索，但在两次求解之间保留每个格点的 g（当前估计距离）
+    与 rhs（由邻居推出的一步前瞻距离）。编辑墙壁后只需调用 notify_changed，
+    下一次 solve 只会重新扩展 g 与 rhs 不一致、且可能影响最短路径的格点，
+    通常远少于重新完整搜索。
+
+    规划器直接引用传入的 MazeGrid（不做拷贝），迷宫被原地修改后由调用方通知；
+    起点、终点或迷宫尺寸变化时需要新建规划器。
+    """
+
+    def __init__(self, maze, start, end):
+        grid = as_grid(maze)
+        self.maze = grid
+        self.start = start
+        self.end = end
+        self._start = grid.index(*start)
+        self._goal = grid.index(*end)
+        self._goal_x, self._goal_y = end
+
+        self.g = array('i', [INF]) * grid.size
+        self.rhs = array('i', [INF]) * grid.size
+        self._queued = {}  # 格点 -> 最近一次入队的键（用于识别堆中过期的条目）
+        self._open = []
+        self.pushes = 0
+        self.stats = {'expanded': 0, 'pushes': 0, 'peak_frontier': 0}
+
+        if not grid.cells[self._start]:
+            self.rhs[self._start] = 0
+            self._push(self._start)
+
+    def _heuristic(self, i):
+        y, x = divmod(i, self.maze.width)
+        return abs(x - self._goal_x) + abs(y - self._goal_y)
+
+    def _key(self, i):
+        m = min(self.g[i], self.rhs[i])
+        return (m + self._heuristic(i), m) if m < INF else (INF, INF)
+
+    def _push(self, i):
+        key = self._key(i)
+        if self._queued.get(i) != key:
+            self._queued[i] = key
+            heapq.heappush(self._open, (key[0], key[1], i))
+            self.pushes += 1
+
+    def _update_vertex(self, i):
+        """重新计算i的rhs，不一致时（重新）入队"""
+        g, rhs = self.g, self.rhs
+        if i != self._start:
+            best = INF
+            if not self.maze.cells[i]:
+                for j in self.maze.neighbors(i):
+                    if g[j] + 1 < best:
+                        best = g[j] + 1
+            rhs[i] = best
+        if g[i] != rhs[i]:
+            self._push(i)
+        else:
+            self._queued.pop(i, None)
+
+    def _top(self):
+        """丢弃堆顶的过期条目，返回有效的堆顶 (k1, k2, i)，堆空返回None"""
+        open_set = self._open
+        queued = self._queued
+        while open_set:
+            k1, k2, i = open_set[0]
+            if queued.get(i) == (k1, k2):
+                return open_set[0]
+            heapq.heappop(open_set)
+        return None
+
+    def notify_changed(self, x, y):
+        """格点 (x, y) 在墙壁/地面之间切换后调用"""
+        grid = self.maze
+        i = grid.index(x, y)
+        w = grid.width
+        self._update_vertex(i)
+        # 邻居的rhs可能依赖i（墙壁邻居的rhs恒为INF，也一并重新计算）
+        if i % w > 0:
+            self._update_vertex(i - 1)
+        if i >= w:
+            self._update_vertex(i - w)
+        if i % w < w - 1:
+            self._update_vertex(i + 1)
+        if i + w < grid.size:
+            self._update_vertex(i + w)
+
+    def solve(self):
+        """
+        修复（首次调用时为计算）起点到终点的最短路径
+
+        返回:
+            (path, stats) 元组，path为坐标元组列表，不可达为None；
+            stats只统计本次调用的扩展量
+        """
+        g, rhs = self.g, self.rhs
+        goal = self._goal
+        neighbors = self.maze.neighbors
+        queued = self._queued
+        self.pushes = 0
+        expanded = peak = 0
+
+        while True:
+            top = self._top()
+            if top is None:
+                break
+            if (top[0], top[1]) >= self._key(goal) and g[goal] == rhs[goal]:
+                break
+            peak = max(peak, len(queued))
+            heapq.heappop(self._open)
+            i = top[2]
+            del queued[i]
+            expanded += 1
+            if g[i] > rhs[i]:
+                # 过一致：g下降，邻居的rhs只可能随之下降，无需重新遍历邻居的邻居
+                g[i] = rhs[i]
+                through = g[i] + 1
+                for j in neighbors(i):
+                    if through < rhs[j] and j != self._start:
+                        rhs[j] = through
+                        if g[j] != through:
+                            self._push(j)
+                        else:
+                            queued.pop(j, None)
+            else:
+                g[i] = INF
+                self._update_vertex(i)
+                for j in neighbors(i):
+                    self._update_vertex(j)
+
+        self.stats = {'expanded': expanded, 'pushes': self.pushes, 'peak_frontier': peak}
+        return self._extract_path(), dict(self.stats)
+
+    def _extract_path(self):
+        """从终点沿 g 值递减的邻居回溯到起点"""
+        g = self.g
+        cur = self._goal
+        if g[cur] >= INF:
+            return None
+        path = [cur]
+        while cur != self._start:
+            nxt = min(self.maze.neighbors(cur), key=g.__getitem__, default=-1)
+            if nxt == -1 or g[nxt] >= g[cur]:
+                return None
+            cur = nxt
+            path.append(cur)
+        path.reverse()
+        w = self.maze.width
+        return [(i % w, i // w) for i in path]
@@ -0,0 +1,259 @@
+"""
+通道压缩图：将迷宫中的通道压缩为路口/死路之间的带权边
+"""
+from array import array
+import heapq
+from maze_grid import as_grid
+
+
+class JunctionGraph:
+    """
+    只保留路口（度≥3）、死路（度≤1）等关键格点作为节点，
+    度为2的通道格点压缩为节点之间的带权边（权重为通道长度）。
+
+    图构建一次即可反复查询；每次查询时把不在节点上的起点/终点临时接入图中，
+    在压缩图上搜索后再展开为逐格路径。
+    边以CSR形式存储：节点u的边为 [edge_start[u], edge_start[u + 1]) 区间，
+    edge_to / edge_weight / edge_first 分别为邻接节点、通道长度、离开u后的第一个格点。
+    """
+
+    # PathFinder算法名 -> 压缩图上的搜索方式
+    # 压缩图是带权图，BFS类算法按边数搜索不再保证最短，统一由Dijkstra代替；JPS退化为A*
+    ALGORITHMS = {
+        "DFS": "dfs",
+        "D-DFS": "dfs",
+        "BFS": "dijkstra",
+        "D-BFS": "dijkstra",
+        "D-AStar": "astar",
+        "Dijkstra": "dijkstra",
+        "GBFS": "gbfs",
+        "AStar": "astar",
+        "JPS": "astar",
+    }
+
+    def __init__(self, maze):
+        grid = as_grid(maze)
+        self.maze = grid
+        cells = grid.cells
+        neighbors = grid.neighbors
+
+        # 找出所有节点（度不为2的可通行格点）
+        node_id = array('i', [-1]) * grid.size
+        node_cells = array('i')
+        for i in range(grid.size):
+            if not cells[i] and len(neighbors(i)) != 2:
+                node_id[i] = len(node_cells)
+                node_cells.append(i)
+
+        # 从每个节点出发沿各个方向走完通道，得到CSR邻接表
+        edge_start = array('i', [0])
+        edge_to = array('i')
+        edge_weight = array('i')
+        edge_first = array('i')
+        for u in node_cells:
+            for first in neighbors(u):
+                end, length, _ = self._walk_corridor(node_id, u, first)
+                if end != u:  # 忽略回到自身的环
+                    edge_to.append(node_id[end])
+                    edge_weight.append(length)
+                    edge_first.append(first)
+            edge_start.append(len(edge_to))
+
+        self.node_id = node_id
+        self.node_cells = node_cells
+        self.edge_start = edge_start
+        self.edge_to = edge_to
+        self.edge_weight = edge_weight
+        self.edge_first = edge_first
+        self.stats = {'expanded': 0, 'pushes': 0, 'peak_frontier': 0}
+
+    @property
+    def node_count(self):
+        return len(self.node_cells)
+
+    @property
+    def edge_count(self):
+        """无向边数"""
+        return len(self.edge_to) // 2
+
+    def _walk_corridor(self, node_id, origin, first, stop=-1):
+        """
+        从origin经first沿通道前进，直到遇到节点、stop格点或回到origin
+
+        返回:
+            (终点下标, 步数, 终点前一个格点下标)
+        """
+        neighbors = self.maze.neighbors
+        prev, cur, length = origin, first, 1
+        while node_id[cur] == -1 and cur != stop and cur != origin:
+            a, b = neighbors(cur)
+            prev, cur = cur, (b if a == prev else a)
+            length += 1
+        return cur, length, prev
+
+    def _expand_edge(self, origin, first, target):
+        """展开一条边：返回origin（不含）到target（含）之间的逐格下标"""
+        neighbors = self.maze.neighbors
+        cells = [first]
+        prev, cur = origin, first
+        while cur != target:
+            a, b = neighbors(cur)
+            prev, cur = cur, (b if a == prev else a)
+            cells.append(cur)
+        return cells
+
+    def solve(self, start, end, algo="AStar"):
+        """
+        在压缩图上寻路
+
+        参数:
+            start, end: 起点、终点坐标 (x, y)
+            algo: PathFinder中的算法名，映射关系见 ALGORITHMS
+
+        返回:
+            (path, stats) 元组，path为坐标元组列表，失败为None
+        """
+        if algo not in self.ALGORITHMS:
+            raise ValueError(f"未知的寻路算法: {algo}")
+        mode = self.ALGORITHMS[algo]
+
+        grid = self.maze
+        w = grid.width
+        s = grid.index(*start)
+        e = grid.index(*end)
+        self.stats = {'expanded': 0, 'pushes': 0, 'peak_frontier': 0}
+        if grid.cells[s] or grid.cells[e]:
+            return None, dict(self.stats)
+        if s == e:
+            return [start], dict(self.stats)
+
+        # 起点/终点若不在节点上，则作为临时节点接入（临时边只存在于本次查询）
+        node_id = self.node_id
+        node_cells = list(self.node_cells)
+        ids = {}
+        for p in (s, e):
+            if node_id[p] != -1:
+                ids[p] = node_id[p]
+            else:
+                ids[p] = len(node_cells)
+                node_cells.append(p)
+
+        extra = {}
+        for p, other in ((s, e), (e, s)):
+            if node_id[p] != -1:
+                continue
+            for first in grid.neighbors(p):
+                end_cell, length, last = self._walk_corridor(node_id, p, first, stop=other)
+                if end_cell == p:  # 不含任何节点的环形通道
+                    continue
+                # 另一端是真实节点时补上反向边；另一端是临时节点时由它自己的遍历补上
+                if node_id[end_cell] != -1:
+                    to = node_id[end_cell]
+                    extra.setdefault(to, []).append((ids[p], length, last))
+                else:
+                    to = ids[end_cell]
+                extra.setdefault(ids[p], []).append((to, length, first))
+
+        source = ids[s]
+        target = ids[e]
+
+        came_from, came_first = self._search(node_cells, extra, source, target, mode)
+        if came_from is None:
+            return None, dict(self.stats)
+
+        # 沿前驱节点回溯，并展开每一条边
+        hops = []
+        cur = target
+        while cur != source:
+            hops.append((came_from[cur], came_first[cur], cur))
+            cur = came_from[cur]
+        hops.reverse()
+
+        path = [s]
+        for u, first, v in hops:
+            path.extend(self._expand_edge(node_cells[u], first, node_cells[v]))
+        return [(i % w, i // w) for i in path], dict(self.stats)
+
+    def _search(self, node_cells, extra, source, target, mode):
+        """在压缩图上搜索，返回 (前驱节点数组, 前驱边的第一个格点数组)，失败返回 (None, None)"""
+        w = self.maze.width
+        edge_start = self.edge_start
+        edge_to = self.edge_to
+        edge_weight = self.edge_weight
+        edge_first = self.edge_first
+        base_count = len(self.node_cells)
+        n = len(node_cells)
+
+        end_y, end_x = divmod(node_cells[target], w)
+
+        def heuristic(u):
+            """曼哈顿距离（不超过通道长度，可采纳）"""
+            y, x = divmod(node_cells[u], w)
+            return abs(x - end_x) + abs(y - end_y)
+
+        def edges(u):
+            if u < base_count:
+                for k in range(edge_start[u], edge_start[u + 1]):
+                    yield edge_to[k], edge_weight[k], edge_first[k]
+            yield from extra.get(u, ())
+
+        came_from = array('i', [-1]) * n
+        came_first = array('i', [-1]) * n
+        g_score = array('i', [-1]) * n
+        closed = bytearray(n)
+        g_score[source] = 0
+        expanded = pushes = peak = 0
+
+        if mode == "dfs":
+            stack = [source]
+            while stack:
+                peak = max(peak, len(stack))
+                u = stack.pop()
+                if closed[u]:
+                    continue
+                closed[u] = 1
+                if u == target:
+                    break
+                expanded += 1
+                for v, weight, first in edges(u):
+                    if not closed[v]:
+                        came_from[v] = u
+                        came_first[v] = first
+                        stack.append(v)
+                        pushes += 1
+        else:
+            open_set = [(0, source)]
+            while open_set:
+                peak = max(peak, len(open_set))
+                _, u = heapq.heappop(open_set)
+                if closed[u]:
+                    continue
+                closed[u] = 1
+                if u == target:
+                    break
+                expanded += 1
+                for v, weight, first in edges(u):
+                    if closed[v]:
+                        continue
+                    new_cost = g_score[u] + weight
+                    if mode == "gbfs":
+                        if g_score[v] != -1:
+                            continue
+                    elif g_score[v] != -1 and new_cost >= g_score[v]:
+                        continue
+                    g_score[v] = new_cost
+                    came_from[v] = u
+                    came_first[v] = first
+                    if mode == "dijkstra":
+                        priority = new_cost
+                    elif mode == "astar":
+                        priority = new_cost + heuristic(v)
+                    else:
+                        priority = heuristic(v)
+                    heapq.heappush(open_set, (priority, v))
+                    pushes += 1
+
+        self.stats = {'expanded': expanded, 'pushes': pushes, 'peak_frontier': peak}
+        if not closed[target]:
+            return None, None
+        return came_from, came_first
@@ -1,84 +1,192 @@
 import base64
+import binascii
+from maze_grid import MazeGrid, as_grid
+from maze_generator import MazeGenerator
+
+# 单元格字节 <-> 比特字符 的转换表
+_CELL_TO_BIT = bytes.maketrans(b'\x00\x01', b'01')
+_BIT_TO_CELL = bytes.maketrans(b'01', b'\x00\x01')
+
 
 def encode_maze_to_base64(maze):
     """
     将迷宫编码为Base64字符串
-    
+
     参数:
-        maze: 二维列表，0（地面），1（墙壁）
-    
+        maze: MazeGrid或二维列表，0（地面），1（墙壁）
+
     返回:
         Base64编码字符串（包含尺寸信息）
-    
+
     编码格式：width,height,base64_data
     """
-    height = len(maze)
-    width = len(maze[0]) if height > 0 else 0
-    
-    # 将迷宫展平为一维比特数组
-    bits = []
-    for row in maze:
-        for cell in row:
-            bits.append(cell)
-    
-    # 转换为字节数组
-    byte_array = bytearray()
-    
-    # 每8个比特打包成一个字节
-    for i in range(0, len(bits), 8):
-        byte_val = 0
-        # 处理当前字节的8个比特
-        for j in range(8):
-            if i + j < len(bits):
-                if bits[i + j] == 1:
-                    byte_val |= (1 << (7 - j))  # 设置对应位
-        byte_array.append(byte_val)
-    
+    grid = as_grid(maze)
+    width, height = grid.width, grid.height
+
+    # 将迷宫展平为比特串，并补齐到8的倍数
+    bits = bytes(grid.cells).translate(_CELL_TO_BIT)
+    padding = -len(bits) % 8
+    bits += b'0' * padding
+
+    # 每8个比特打包成一个字节（高位在前）
+    byte_array = int(bits, 2).to_bytes(len(bits) // 8, 'big') if bits else b''
+
     # Base64编码
     base64_data = base64.b64encode(byte_array).decode('ascii')
-    
+
     # 返回包含尺寸信息的字符串
     return f"{width},{height},{base64_data}"
 
 
-def decode_base64_to_maze(encoded_str):
+def _check_max_size(width, height, max_size):
+    """尺寸超过max_size时抛出ValueError（max_size为None表示不限制）"""
+    if max_size is not None and (width > max_size or height > max_size):
+        raise ValueError(f"迷宫尺寸最大为{max_size}")
+
+
+def decode_base64_to_maze(encoded_str, max_size=None):
     """
     将Base64字符串解码为迷宫
-    
+
     参数:
         encoded_str: 编码字符串，格式为 width,height,base64_data
-    
+        max_size: 允许的最大边长，None表示不限制
+
     返回:
-        (maze, (width, height)) 元组
+        (maze, (width, height)) 元组，maze为MazeGrid
     """
     # 解析尺寸信息
     parts = encoded_str.split(',', 2)
-    
+
     width = int(parts[0])
     height = int(parts[1])
     base64_data = parts[2]
-    
+    _check_max_size(width, height, max_size)
+
     # Base64解码
     byte_array = base64.b64decode(base64_data)
-    
+
     # 将字节转换回比特
     total_bits = width * height
-    bits = []
-    
-    for byte in byte_array:
-        # 提取一个字节的8个比特
-        for i in range(7, -1, -1):
-            bits.append((byte >> i) & 1)
-    
+    if len(byte_array) * 8 < total_bits:
+        raise ValueError("编码数据长度不足")
+    bits = format(int.from_bytes(byte_array, 'big'), 'b').zfill(len(byte_array) * 8) if byte_array else ''
+
     # 只取需要的比特数（去掉填充）
-    bits = bits[:total_bits]
-    
-    # 重建迷宫二维数组
-    maze = []
-    for i in range(height):
-        start_idx = i * width
-        end_idx = start_idx + width
-        row = bits[start_idx:end_idx]
-        maze.append(row)
-    
-    return maze, (width, height)
+    cells = bits[:total_bits].encode('ascii').translate(_BIT_TO_CELL)
+
+    return MazeGrid(width, height, cells), (width, height)
+
+
+def write_rows_as_base64(rows, width, height, out, chunk_rows=64):
+    """
+    流式编码：逐行读取迷宫并把编码字符串写入out，结果与 encode_maze_to_base64 相同
+
+    参数:
+        rows: 按行产出的可迭代对象，每行为长度width的bytes（如 MazeGenerator.iter_eller_rows）
+        width, height: 迷宫尺寸
+        out: 文本文件对象（具有write方法）
+        chunk_rows: 每次编码的行数，内存占用约为 chunk_rows * width
+
+    返回:
+        写入的行数
+    """
+    out.write(f"{width},{height},")
+    pending = b''  # 尚未编码的比特字符（不足24个比特时留到下一批）
+    chunk = []
+    count = 0
+
+    def flush(bits, final=False):
+        if final:
+            bits += b'0' * (-len(bits) % 8)
+            usable = len(bits)
+        else:
+            usable = len(bits) - len(bits) % 24  # 3个字节对应4个Base64字符，保证拼接后与整体编码一致
+        if usable:
+            data = int(bits[:usable], 2).to_bytes(usable // 8, 'big')
+            out.write(binascii.b2a_base64(data, newline=False).decode('ascii'))
+        return bits[usable:]
+
+    for row in rows:
+        if len(row) != width:
+            raise ValueError("行长度与迷宫宽度不一致")
+        chunk.append(bytes(row).translate(_CELL_TO_BIT))
+        count += 1
+        if len(chunk) >= chunk_rows:
+            pending = flush(pending + b''.join(chunk))
+            chunk = []
+    if count != height:
+        raise ValueError("行数与迷宫高度不一致")
+    flush(pending + b''.join(chunk), final=True)
+    return count
+
+
+def encode_maze_to_seed(algo, width, height, seed):
+    """
+    种子编码：只记录生成算法、尺寸与随机种子，解码时重新生成迷宫
+
+    参数:
+        algo: 生成算法名（见 MazeGenerator.ALGORITHMS）
+        width, height: 迷宫尺寸
+        seed: 整数随机种子
+
+    返回:
+        编码字符串，格式为 algo:宽x高:seed，例如 DFS:101x101:42
+    """
+    if algo not in MazeGenerator.ALGORITHMS:
+        raise ValueError(f"未知的生成算法: {algo}")
+    return f"{algo}:{width}x{height}:{int(seed)}"
+
+
+def parse_maze_seed(encoded_str, max_size=None):
+    """
+    解析种子编码（不生成迷宫）
+
+    参数:
+        encoded_str: 编码字符串，格式为 algo:宽x高:seed（算法名不区分大小写）
+        max_size: 允许的最大边长，None表示不限制
+
+    返回:
+        (algo, width, height, seed) 元组，algo为 MazeGenerator.ALGORITHMS 中的算法名
+    """
+    parts = encoded_str.strip().split(':')
+    if len(parts) != 3:
+        raise ValueError("种子编码格式应为 algo:宽x高:seed")
+    name, size, seed = parts
+
+    names = {algo.lower(): algo for algo in MazeGenerator.ALGORITHMS}
+    if name.lower() not in names:
+        raise ValueError(f"未知的生成算法: {name}")
+    width, height = (int(v) for v in size.lower().split('x'))
+    if width % 2 == 0 or height % 2 == 0 or width < 3 or height < 3:
+        raise ValueError("迷宫尺寸必须为不小于3的奇数")
+    _check_max_size(width, height, max_size)
+    return names[name.lower()], width, height, int(seed)
+
+
+def decode_seed_to_maze(encoded_str, max_size=None):
+    """
+    解码种子编码并重新生成迷宫
+
+    参数:
+        encoded_str: 编码字符串，格式为 algo:宽x高:seed（算法名不区分大小写）
+        max_size: 允许的最大边长，None表示不限制（超过时在生成之前抛出ValueError）
+
+    返回:
+        (maze, (width, height)) 元组，maze为MazeGrid
+    """
+    algo, width, height, seed = parse_maze_seed(encoded_str, max_size)
+    grid = MazeGrid.bordered(width, height)
+    MazeGenerator(grid, width, height, seed=seed).generate(algo)
+    return grid, (width, height)
+
+
+def decode_maze_code(encoded_str, max_size=None):
+    """
+    自动识别编码格式（种子编码 algo:宽x高:seed 或 Base64编码 width,height,data）并解码
+
+    max_size为允许的最大边长，None表示不限制
+    """
+    if ':' in encoded_str:
+        return decode_seed_to_maze(encoded_str, max_size)
+    return decode_base64_to_maze(encoded_str, max_size)
@@ -1,234 +1,638 @@
+from array import array
 import random
+import struct
+from maze_grid import as_grid
+from algorithm_events import run_events
+
+try:
+    import numpy as np
+except ImportError:  # NumPy为可选依赖，缺失时使用纯Python实现
+    np = None
 
 
 class MazeGenerator:
-    def __init__(self, maze, width, height, update_cell):
-        self.maze = maze
+    # 算法名 -> 生成方法名
+    ALGORITHMS = {
+        "DFS": "generate_dfs",
+        "Prim": "generate_prim",
+        "Kruskal": "generate_kruskal",
+        "Recursive": "generate_recursive",
+        "Eller": "generate_eller",
+        "BinaryTree": "generate_binary_tree",
+        "Sidewinder": "generate_sidewinder",
+        "GrowingTree": "generate_growing_tree",
+    }
+    # 算法名 -> 事件生成器方法名
+    EVENT_METHODS = {
+        "DFS": "iter_dfs",
+        "Prim": "iter_prim",
+        "Kruskal": "iter_kruskal",
+        "Recursive": "iter_recursive",
+        "Eller": "iter_eller",
+        "BinaryTree": "iter_binary_tree",
+        "Sidewinder": "iter_sidewinder",
+        "GrowingTree": "iter_growing_tree",
+    }
+    # 生长树算法的格点选择策略
+    GROWING_TREE_POLICIES = ("newest", "random", "oldest", "mixed")
+
+    def __init__(self, maze, width, height, update_cell=None, seed=None):
+        """
+        参数:
+            maze: MazeGrid（二维列表会被转换为新的MazeGrid，结果通过 self.maze 读取）
+            width, height: 迷宫尺寸
+            update_cell: 单元格状态变化回调 update_cell(x, y, cell_type)，
+                         为None时以无界面模式运行，生成过程中不产生任何回调
+            seed: 随机种子；所有随机数都来自 self.rng = random.Random(seed)，
+                  相同的算法、尺寸与种子总是生成相同的迷宫（与是否有回调、是否安装NumPy无关）。
+                  为None时使用系统随机源
+
+        算法实现在 iter_* 事件生成器中（见 algorithm_events），产出 (x, y, state) 事件；
+        generate 与 generate_* 用 update_cell 驱动它们，执行完毕才返回；iter_events 把事件流直接交给调用方
+        """
+        self.maze = as_grid(maze)
         self.width = width
         self.height = height
         self.update_cell = update_cell
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.growing_tree_policy = "mixed"  # 生长树算法的选择策略，见 GROWING_TREE_POLICIES
+        self.growing_tree_bias = 0.5  # mixed策略下选择最新格点的概率
+
+    def generate(self, algo):
+        """按算法名生成迷宫，算法名见 ALGORITHMS"""
+        if algo not in self.ALGORITHMS:
+            raise ValueError(f"未知的生成算法: {algo}")
+        getattr(self, self.ALGORITHMS[algo])()
+        return self.maze
+
+    def iter_events(self, algo):
+        """
+        按算法名生成迷宫，返回 (x, y, state) 事件的生成器（不使用 update_cell）
+
+        迭代结束后迷宫生成完毕，结果在 self.maze 中；未迭代完时迷宫处于中间状态
+        """
+        if algo not in self.EVENT_METHODS:
+            raise ValueError(f"未知的生成算法: {algo}")
+        return getattr(self, self.EVENT_METHODS[algo])(emit=True)
+
+    def _run(self, events_method):
+        """用 update_cell 驱动事件生成器方法直到结束，没有回调时不产出事件"""
+        update = self.update_cell
+        return run_events(events_method(emit=update is not None), update)
 
     def generate_dfs(self):
-        """深度优先算法生成迷宫"""
+        """深度优先算法生成迷宫（见 iter_dfs）"""
+        self._run(self.iter_dfs)
+
+    def generate_prim(self):
+        """Prim算法生成迷宫（见 iter_prim）"""
+        self._run(self.iter_prim)
+
+    def generate_kruskal(self):
+        """Kruskal算法生成迷宫（见 iter_kruskal）"""
+        self._run(self.iter_kruskal)
+
+    def generate_recursive(self):
+        """递归分割算法生成迷宫（见 iter_recursive）"""
+        self._run(self.iter_recursive)
+
+    def generate_binary_tree(self):
+        """二叉树算法生成迷宫（见 iter_binary_tree）"""
+        self._run(self.iter_binary_tree)
+
+    def generate_sidewinder(self):
+        """Sidewinder算法生成迷宫（见 iter_sidewinder）"""
+        self._run(self.iter_sidewinder)
+
+    def generate_growing_tree(self):
+        """生长树算法生成迷宫（见 iter_growing_tree）"""
+        self._run(self.iter_growing_tree)
+
+    def generate_eller(self):
+        """Eller算法生成迷宫（见 iter_eller）"""
+        self._run(self.iter_eller)
+
+    def _build_lattice(self, emit):
+        """
+        生成所有墙壁（内部行列坐标为偶数的格子），
+        并返回格点访问标记：非格点位置预先标记为已访问，
+        这样越界、落在墙上的邻居都会被"已访问"检查自然排除
+        """
         x_size, y_size = self.width, self.height
+        cells = self.maze.cells
 
-        # 生成所有墙壁
+        column = b'\x01' * (y_size - 2)
         for i in range(2, x_size - 1, 2):
-            for j in range(1, y_size - 1):
-                self.maze[j][i] = 1
-                self.update_cell(i, j, 'wall')
+            cells[x_size + i:(y_size - 1) * x_size + i:x_size] = column
+            if emit:
+                for j in range(1, y_size - 1):
+                    yield i, j, 'wall'
 
+        row = b'\x01' * (x_size - 2)
         for i in range(2, y_size - 1, 2):
-            for j in range(1, x_size - 1):
-                self.maze[i][j] = 1
-                self.update_cell(j, i, 'wall')
+            cells[i * x_size + 1:(i + 1) * x_size - 1] = row
+            if emit:
+                for j in range(1, x_size - 1):
+                    yield j, i, 'wall'
+
+        visited = bytearray(b'\x01') * self.maze.size
+        row_cells = bytes(len(range(1, x_size - 1, 2)))
+        for y in range(1, y_size - 1, 2):
+            visited[y * x_size + 1:(y + 1) * x_size - 1:2] = row_cells
+        return visited
 
-        start = (random.randrange(1, x_size - 1, 2), random.randrange(1, y_size - 1, 2))
+    def iter_dfs(self, emit=True):
+        """深度优先算法生成迷宫"""
+        x_size, y_size = self.width, self.height
+        cells = self.maze.cells
+        size = self.maze.size
+
+        visited = yield from self._build_lattice(emit)
+
+        start_x, start_y = self.rng.randrange(1, x_size - 1, 2), self.rng.randrange(1, y_size - 1, 2)
+        start = start_y * x_size + start_x
 
         stack = [start]
-        visited = {start}
+        visited[start] = 1
 
-        direction = [
-            lambda x, y: (x - 2, y),
-            lambda x, y: (x, y - 2),
-            lambda x, y: (x + 2, y),
-            lambda x, y: (x, y + 2)
-        ]
+        # 左、上、右、下方向相隔一堵墙的格点偏移
+        direction = [-2, -2 * x_size, 2, 2 * x_size]
 
         while stack:
             cur_point = stack[-1]
-            x1, y1 = cur_point
-            self.update_cell(*cur_point, 'visited')
+            y1, x1 = divmod(cur_point, x_size)
+            if emit:
+                yield x1, y1, 'visited'
 
-            random.shuffle(direction)
+            self.rng.shuffle(direction)
             for dir_ in direction:
-                next_point = dir_(x1, y1)
-                x2, y2 = next_point
+                next_point = cur_point + dir_
 
-                if 0 < x2 < x_size - 1 and 0 < y2 < y_size - 1 and next_point not in visited:
+                if 0 <= next_point < size and not visited[next_point]:
                     # 打通墙壁
-                    wall_x = (x1 + x2) // 2
-                    wall_y = (y1 + y2) // 2
-                    self.maze[wall_y][wall_x] = 0
+                    wall = cur_point + dir_ // 2
+                    cells[wall] = 0
 
-                    self.update_cell(wall_x, wall_y, 'path')
-                    self.update_cell(x2, y2, 'current')
+                    if emit:
+                        y2, x2 = divmod(next_point, x_size)
+                        yield (x1 + x2) // 2, (y1 + y2) // 2, 'path'
+                        yield x2, y2, 'current'
 
                     stack.append(next_point)
-                    visited.add(next_point)
+                    visited[next_point] = 1
                     break
             else:
                 stack.pop()
-                self.update_cell(*cur_point, 'path')
+                if emit:
+                    yield x1, y1, 'path'
 
-    def generate_prim(self):
+    def iter_prim(self, emit=True):
         """Prim算法生成迷宫"""
         x_size, y_size = self.width, self.height
+        cells = self.maze.cells
+        size = self.maze.size
 
-        # 生成所有墙壁
-        for i in range(2, x_size - 1, 2):
-            for j in range(1, y_size - 1):
-                self.maze[j][i] = 1
-                self.update_cell(i, j, 'wall')
-
-        for i in range(2, y_size - 1, 2):
-            for j in range(1, x_size - 1):
-                self.maze[i][j] = 1
-                self.update_cell(j, i, 'wall')
+        visited = yield from self._build_lattice(emit)
 
-        start = (random.randrange(1, x_size - 1, 2), random.randrange(1, y_size - 1, 2))
+        start_x, start_y = self.rng.randrange(1, x_size - 1, 2), self.rng.randrange(1, y_size - 1, 2)
+        start = start_y * x_size + start_x
 
         sequence = []
-        visited = {start}
+        visited[start] = 1
 
-        direction = [
-            lambda x, y: (x - 1, y),
-            lambda x, y: (x, y - 1),
-            lambda x, y: (x + 1, y),
-            lambda x, y: (x, y + 1)
-        ]
+        direction = self.maze.offsets
 
         # 将起点周围的墙加入候选序列，并记录打通方向
         for dir_ in direction:
-            neighbor = dir_(*start)
-            x, y = neighbor
+            neighbor = start + dir_
+            x, y = neighbor % x_size, neighbor // x_size
             if 0 < x < x_size - 1 and 0 < y < y_size - 1:
                 sequence.append((neighbor, dir_))
-                self.update_cell(*neighbor, 'frontier')
+                if emit:
+                    yield x, y, 'frontier'
 
         while sequence:
-            ind = random.randrange(len(sequence))
+            ind = self.rng.randrange(len(sequence))
             wall, dir_ = sequence[ind]
-            x1, y1 = wall
+            y1, x1 = divmod(wall, x_size)
             sequence[ind] = sequence[-1]
             sequence.pop()
-            self.update_cell(x1, y1, 'current')
-            connect_point = dir_(x1, y1)
-            if connect_point not in visited:
-                self.maze[y1][x1] = 0
-                visited.add(connect_point)
+            if emit:
+                yield x1, y1, 'current'
+            connect_point = wall + dir_
+            if not visited[connect_point]:
+                cells[wall] = 0
+                visited[connect_point] = 1
                 for dir_ in direction:
-                    neighbor = dir_(*connect_point)
-                    x2, y2 = neighbor
-                    if 0 < x2 < x_size - 1 and 0 < y2 < y_size - 1 and dir_(*neighbor) not in visited:
+                    neighbor = connect_point + dir_
+                    beyond = neighbor + dir_
+                    if 0 <= beyond < size and not visited[beyond]:
                         sequence.append((neighbor, dir_))
-                        self.update_cell(*neighbor, 'frontier')
-                self.update_cell(x1, y1, 'path')
+                        if emit:
+                            yield neighbor % x_size, neighbor // x_size, 'frontier'
+                if emit:
+                    yield x1, y1, 'path'
             else:
-                self.update_cell(x1, y1, 'wall')
-
-    def generate_kruskal(self):
-        """Kruskal算法生成迷宫"""
+                if emit:
+                    yield x1, y1, 'wall'
+
+    def iter_kruskal(self, emit=True):
+        """
+        Kruskal算法生成迷宫
+
+        格点编号为 (y // 2) * 每行格点数 + x // 2；并查集为 array('i') 父节点数组，
+        按秩合并、迭代路径减半，不会触及递归深度限制。
+        候选墙壁用其扁平下标表示（array('i')），两端格点由墙壁所在行的奇偶决定：
+        奇数行的墙连接左右两个格点，偶数行的墙连接上下两个格点。
+        """
         x_size, y_size = self.width, self.height
+        cells = self.maze.cells
 
         # 生成所有墙壁
-        for i in range(2, x_size - 1, 2):
-            for j in range(1, y_size - 1):
-                self.maze[j][i] = 1
-                self.update_cell(i, j, 'wall')
-
-        for i in range(2, y_size - 1, 2):
-            for j in range(1, x_size - 1):
-                self.maze[i][j] = 1
-                self.update_cell(j, i, 'wall')
-
-        # 标记可通行的单元格（所有奇数坐标的点）
-        cells = set()
-        for y in range(1, y_size - 1, 2):
-            for x in range(1, x_size - 1, 2):
-                cells.add((x, y))
-
-        # 初始化并查集
-        parent = {}
-
-        def find(cell):
-            """查找集合根节点（路径压缩）"""
-            if parent[cell] != cell:
-                parent[cell] = find(parent[cell])
-            return parent[cell]
-
-        def union(cell1, cell2):
-            """合并两个集合（按秩合并）"""
-            root1 = find(cell1)
-            root2 = find(cell2)
-            if root1 != root2:
-                parent[root1] = root2
-
-        # 初始化每个单元格的父节点为自己
-        for cell in cells:
-            parent[cell] = cell
-
-        # 收集所有可能的墙壁（相邻单元格之间的墙）
-        walls = []
-
-        for cell in cells:
-            x, y = cell
-            # 检查水平方向的墙
-            nx, ny = x + 2, y  # 右侧2格的单元格
-            if nx < x_size - 1 and (nx, ny) in cells:
-                wall_x, wall_y = x + 1, y  # 中间的墙
-                walls.append(((cell, (nx, ny)), (wall_x, wall_y)))
-
-            # 检查垂直方向的墙
-            nx, ny = x, y + 2  # 下方2格的单元格
-            if ny < y_size - 1 and (nx, ny) in cells:
-                wall_x, wall_y = x, y + 1  # 中间的墙
-                walls.append(((cell, (nx, ny)), (wall_x, wall_y)))
+        yield from self._build_lattice(emit)
+
+        # 初始化并查集：每个格点的父节点为自己
+        row_cells = (x_size - 1) // 2
+        parent = array('i', range(row_cells * ((y_size - 1) // 2)))
+        rank = bytearray(len(parent))
+
+        # 收集所有可能的墙壁（相邻格点之间的墙）
+        walls = array('i')
+        for y in range(1, y_size - 1):
+            if y % 2:
+                walls.extend(range(y * x_size + 2, (y + 1) * x_size - 2, 2))
+            else:
+                walls.extend(range(y * x_size + 1, (y + 1) * x_size - 1, 2))
 
         # 随机打乱墙壁顺序
-        random.shuffle(walls)
-
-        # 遍历所有墙壁，如果两端单元格属于不同集合，则打通
-        for (cell1, cell2), (wall_x, wall_y) in walls:
-            self.update_cell(wall_x, wall_y, 'current')
-            if find(cell1) != find(cell2):
-                # 打通墙壁
-                self.maze[wall_y][wall_x] = 0
-                # 合并两个集合
-                union(cell1, cell2)
-
-                self.update_cell(wall_x, wall_y, 'path')
+        self.rng.shuffle(walls)
+
+        # 遍历所有墙壁，如果两端格点属于不同集合，则打通
+        for wall in walls:
+            wall_y, wall_x = divmod(wall, x_size)
+            if emit:
+                yield wall_x, wall_y, 'current'
+            if wall_y % 2:
+                root1 = (wall_y >> 1) * row_cells + ((wall_x - 1) >> 1)
+                root2 = root1 + 1
             else:
-                self.update_cell(wall_x, wall_y, 'wall')
+                root1 = ((wall_y - 1) >> 1) * row_cells + (wall_x >> 1)
+                root2 = root1 + row_cells
 
-    def generate_recursive(self):
-        """递归分割算法生成迷宫"""
+            # 查找集合根节点（路径减半）
+            while parent[root1] != root1:
+                parent[root1] = parent[parent[root1]]
+                root1 = parent[root1]
+            while parent[root2] != root2:
+                parent[root2] = parent[parent[root2]]
+                root2 = parent[root2]
 
-        def generate_partition(x1, x2, y1, y2):
+            if root1 != root2:
+                # 打通墙壁
+                cells[wall] = 0
+                # 合并两个集合（按秩合并）
+                if rank[root1] < rank[root2]:
+                    parent[root1] = root2
+                elif rank[root1] > rank[root2]:
+                    parent[root2] = root1
+                else:
+                    parent[root2] = root1
+                    rank[root1] += 1
+
+                if emit:
+                    yield wall_x, wall_y, 'path'
+            elif emit:
+                yield wall_x, wall_y, 'wall'
+
+    def iter_recursive(self, emit=True):
+        """
+        递归分割算法生成迷宫
+
+        用显式栈代替递归（子空间按原递归顺序处理），不受递归深度限制；
+        十字墙壁按整段切片写入，无界面模式下每个子空间只有常数次Python操作
+        """
+        cells = self.maze.cells
+        width = self.width
+        rand = self.rng.random
+        wall_line = b'\x01' * max(self.width, self.height)
+
+        stack = [(0, self.width - 1, 0, self.height - 1)]
+        while stack:
+            x1, x2, y1, y2 = stack.pop()
             if x2 - x1 < 4 or y2 - y1 < 4:
-                return
+                continue
 
-            # 随机选择分割位置
-            partition_x = random.randrange(x1 + 2, x2, 2)
-            partition_y = random.randrange(y1 + 2, y2, 2)
+            # 随机选择分割位置（x1 + 2 到 x2 - 2 之间的偶数坐标）
+            partition_x = x1 + 2 + 2 * int(rand() * ((x2 - x1) // 2 - 1))
+            partition_y = y1 + 2 + 2 * int(rand() * ((y2 - y1) // 2 - 1))
 
             # 生成十字墙壁
-            for i in range(y1 + 1, y2):
-                self.maze[i][partition_x] = 1
-                self.update_cell(partition_x, i, 'wall')
-
-            for j in range(x1 + 1, x2):
-                self.maze[partition_y][j] = 1
-                self.update_cell(j, partition_y, 'wall')
-
-            # 随机打通三面墙
-            walls = [
-                (random.randrange(x1 + 1, partition_x, 2), partition_y),
-                (partition_x, random.randrange(y1 + 1, partition_y, 2)),
-                (random.randrange(partition_x + 1, x2, 2), partition_y),
-                (partition_x, random.randrange(partition_y + 1, y2, 2))
-            ]
-
-            for wall in random.sample(walls, 3):
-                x, y = wall
-                self.maze[y][x] = 0
-                self.update_cell(x, y, 'current')
-                self.update_cell(x, y, 'path')
-
-            # 递归处理子空间
-            generate_partition(x1, partition_x, y1, partition_y)
-            generate_partition(partition_x, x2, y1, partition_y)
-            generate_partition(x1, partition_x, partition_y, y2)
-            generate_partition(partition_x, x2, partition_y, y2)
-
-        generate_partition(0, self.width - 1, 0, self.height - 1)
+            cells[(y1 + 1) * width + partition_x:y2 * width + partition_x:width] = wall_line[:y2 - y1 - 1]
+            cells[partition_y * width + x1 + 1:partition_y * width + x2] = wall_line[:x2 - x1 - 1]
+            if emit:
+                for i in range(y1 + 1, y2):
+                    yield partition_x, i, 'wall'
+                for j in range(x1 + 1, x2):
+                    yield j, partition_y, 'wall'
+
+            # 四段墙上各取一个奇数坐标作为缺口，随机保留其中一段不打通
+            walls = (
+                (x1 + 1 + 2 * int(rand() * ((partition_x - x1) // 2)), partition_y),
+                (partition_x, y1 + 1 + 2 * int(rand() * ((partition_y - y1) // 2))),
+                (partition_x + 1 + 2 * int(rand() * ((x2 - partition_x) // 2)), partition_y),
+                (partition_x, partition_y + 1 + 2 * int(rand() * ((y2 - partition_y) // 2)))
+            )
+            skip = int(rand() * 4)
+            for k in range(4):
+                if k != skip:
+                    x, y = walls[k]
+                    cells[y * width + x] = 0
+                    if emit:
+                        yield x, y, 'current'
+                        yield x, y, 'path'
+
+            # 子空间逆序入栈，出栈顺序与递归版本一致
+            stack.append((partition_x, x2, partition_y, y2))
+            stack.append((x1, partition_x, partition_y, y2))
+            stack.append((partition_x, x2, y1, partition_y))
+            stack.append((x1, partition_x, y1, partition_y))
+
+    def iter_binary_tree(self, emit=True):
+        """
+        二叉树算法生成迷宫
+
+        每个格点随机向上或向左打通一面墙（第一行只能向左，第一列只能向上）。
+        所有格点的随机选择一次性生成（每格1个随机比特）；
+        无界面模式且NumPy可用时整体用数组运算打通，否则逐格处理，两种方式结果相同。
+        """
+        x_size, y_size = self.width, self.height
+        row_cells, rows = (x_size - 1) // 2, (y_size - 1) // 2
+
+        yield from self._build_lattice(emit)
+        count = row_cells * rows
+        draws = self.rng.getrandbits(count).to_bytes((count + 7) // 8, 'little') if count else b''
+
+        if np is not None and not emit:
+            grid = np.frombuffer(self.maze.cells, dtype=np.uint8).reshape(y_size, x_size)
+            up = np.unpackbits(np.frombuffer(draws, dtype=np.uint8), bitorder='little')[:count]
+            up = up.reshape(rows, row_cells).astype(bool)
+            up[:, 0] = True
+            up[0, :] = False
+            # 上方的墙在偶数行、奇数列；左侧的墙在奇数行、偶数列
+            grid[2:y_size - 1:2, 1:x_size - 1:2][up[1:]] = 0
+            grid[1:y_size - 1:2, 2:x_size - 1:2][~up[:, 1:]] = 0
+            return
+
+        cells = self.maze.cells
+        for r in range(rows):
+            y = 2 * r + 1
+            for c in range(row_cells):
+                x = 2 * c + 1
+                k = r * row_cells + c
+                if r == 0 and c == 0:
+                    continue
+                if c == 0 or (r > 0 and draws[k >> 3] >> (k & 7) & 1):
+                    wall_x, wall_y = x, y - 1
+                else:
+                    wall_x, wall_y = x - 1, y
+                cells[wall_y * x_size + wall_x] = 0
+                if emit:
+                    yield x, y, 'current'
+                    yield wall_x, wall_y, 'path'
+                    yield x, y, 'path'
+
+    def iter_sidewinder(self, emit=True):
+        """
+        Sidewinder算法生成迷宫
+
+        逐行扫描格点，维护一段连续的"行程"：随机决定继续向右打通，或结束行程并从行程中随机选一格向上打通。
+        第一行全部向右打通；每行最后一个格点总是结束行程。
+        每个格点一次性生成一个32位随机数：最低位决定是否继续向右，行程结束格点的其余位对行程长度取模选出向上打通的格点。
+        无界面模式且NumPy可用时整体用数组运算打通，否则逐格处理，两种方式结果相同。
+        """
+        x_size, y_size = self.width, self.height
+        row_cells, rows = (x_size - 1) // 2, (y_size - 1) // 2
+
+        yield from self._build_lattice(emit)
+        count = row_cells * rows
+        draws = self.rng.getrandbits(32 * count).to_bytes(4 * count, 'little') if count else b''
+
+        if np is not None and not emit:
+            grid = np.frombuffer(self.maze.cells, dtype=np.uint8).reshape(y_size, x_size)
+            words = np.frombuffer(draws, dtype='<u4').reshape(rows, row_cells)
+            east = (words & 1).astype(bool)
+            east[:, -1] = False
+            east[0, :-1] = True
+            grid[1:y_size - 1:2, 2:x_size - 1:2][east[:, :-1]] = 0
+
+            # 第二行起：行程在 east 为False的格点结束（每行最后一格必然结束，行程不会跨行）
+            ends = np.flatnonzero(~east[1:].ravel())
+            if len(ends):
+                starts = np.empty_like(ends)
+                starts[0] = 0
+                starts[1:] = ends[:-1] + 1
+                offsets = (words[1:].ravel()[ends] >> 1) % (ends - starts + 1)
+                chosen = starts + offsets + row_cells  # 展平后的格点编号（加回第一行）
+                r, c = np.divmod(chosen, row_cells)
+                grid[2 * r, 2 * c + 1] = 0
+            return
+
+        cells = self.maze.cells
+        words = struct.unpack(f'<{count}I', draws)
+        for r in range(rows):
+            y = 2 * r + 1
+            run_start = 0
+            for c in range(row_cells):
+                x = 2 * c + 1
+                word = words[r * row_cells + c]
+                if emit:
+                    yield x, y, 'current'
+                if c < row_cells - 1 and (r == 0 or word & 1):
+                    # 继续向右打通
+                    cells[y * x_size + x + 1] = 0
+                    if emit:
+                        yield x + 1, y, 'path'
+                elif r > 0:
+                    # 结束行程：随机选一格向上打通
+                    up_x = 2 * (run_start + (word >> 1) % (c - run_start + 1)) + 1
+                    cells[(y - 1) * x_size + up_x] = 0
+                    run_start = c + 1
+                    if emit:
+                        yield up_x, y - 1, 'path'
+                if emit:
+                    yield x, y, 'path'
+
+    def iter_growing_tree(self, emit=True):
+        """
+        生长树算法生成迷宫
+
+        维护一个活动格点列表，每步按策略从中选一个格点，随机打通到一个未访问的相邻格点并加入列表；
+        没有未访问邻居的格点移出列表。选择策略（self.growing_tree_policy）：
+            newest: 总选最新加入的格点，等价于DFS（长走廊、死路少）
+            random: 随机选择，纹理接近Prim（岔路多、死路短）
+            oldest: 总选最早加入的格点，呈放射状的长直走廊
+            mixed: 以 self.growing_tree_bias 的概率选最新格点，否则随机选择，在两者之间连续调节
+
+        各策略移出格点都是O(1)：newest弹出末尾；oldest只移动表头下标；
+        random用末尾元素填补空位（与Prim的候选墙列表相同）；
+        mixed需要保持加入顺序（否则"最新"不再是最新，偏向参数失去意义），
+        移出中间的格点时留下-1占位，随机选择时跳过占位，占位过半时整体压缩一次。
+        """
+        x_size = self.width
+        cells = self.maze.cells
+        policy = self.growing_tree_policy
+        if policy not in self.GROWING_TREE_POLICIES:
+            raise ValueError(f"未知的选择策略: {policy}")
+        bias = self.growing_tree_bias
+        rand = self.rng.random
+
+        visited = yield from self._build_lattice(emit)
+        # 末尾补两行"已访问"，向下越界的邻居落在补充区域，向上越界的负下标回绕到同一区域
+        visited += b'\x01' * (2 * x_size)
+
+        start_x, start_y = self.rng.randrange(1, x_size - 1, 2), self.rng.randrange(1, self.height - 1, 2)
+        start = start_y * x_size + start_x
+        visited[start] = 1
+        if emit:
+            yield start_x, start_y, 'current'
+
+        active = [start]
+        head = 0  # oldest策略下表头之前的格点都已移出
+        holes = 0  # mixed策略下的占位数
+        step = 2 * x_size
+        newest, oldest, mixed = policy == "newest", policy == "oldest", policy == "mixed"
+
+        while head < len(active):
+            if newest:
+                k = len(active) - 1
+            elif oldest:
+                k = head
+            elif mixed and rand() < bias:
+                k = len(active) - 1
+            else:
+                k = int(rand() * len(active))
+                while active[k] < 0:
+                    k = int(rand() * len(active))
+            cur = active[k]
+
+            choices = [n for n in (cur - 2, cur - step, cur + 2, cur + step) if not visited[n]]
+            if choices:
+                nxt = choices[int(rand() * len(choices))] if len(choices) > 1 else choices[0]
+                wall = (cur + nxt) >> 1
+                cells[wall] = 0
+                visited[nxt] = 1
+                active.append(nxt)
+                if emit:
+                    yield wall % x_size, wall // x_size, 'path'
+                    yield nxt % x_size, nxt // x_size, 'current'
+            else:
+                if oldest:
+                    head += 1
+                elif k == len(active) - 1:
+                    active.pop()
+                    while active and active[-1] < 0:
+                        active.pop()
+                        holes -= 1
+                elif mixed:
+                    active[k] = -1
+                    holes += 1
+                    if 2 * holes > len(active):
+                        active = [c for c in active if c >= 0]
+                        holes = 0
+                else:
+                    active[k] = active.pop()
+                if emit:
+                    yield cur % x_size, cur // x_size, 'path'
+
+    def iter_eller(self, emit=True):
+        """Eller算法生成迷宫（逐行生成，见 iter_eller_rows）"""
+        cells = self.maze.cells
+        width = self.width
+
+        for y, row in enumerate(self.iter_eller_rows(self.width, self.height, self.rng)):
+            cells[y * width:(y + 1) * width] = row
+            if emit and 0 < y < self.height - 1:
+                for x in range(1, width - 1):
+                    yield x, y, 'wall' if row[x] else 'path'
+
+    @staticmethod
+    def iter_eller_rows(width, height, rng=None):
+        """
+        Eller算法：逐行生成迷宫，依次产出每一行（长度为width的bytes，含上下边框行）
+        rng为random.Random实例（为None时新建一个使用系统随机源的实例）
+
+        只保存当前格点行中每个格点所属的集合，内存为O(width)，与高度无关，
+        产出的行可以直接写入文件或编码器（见 maze_codec.write_rows_as_base64），
+        从而生成任意高度的迷宫。
+
+        每个格点行：
+        1. 相邻且不属于同一集合的格点随机打通（最后一行全部打通），合并集合
+        2. 每个集合至少向下打通一处，向下打通的格点把集合带到下一行，其余格点在下一行获得新集合
+        """
+        rng = rng if rng is not None else random.Random()
+        row_cells = (width - 1) // 2
+        rows = (height - 1) // 2
+        border = b'\x01' * width
+
+        # 格点行模板：格点为地面，格点之间为墙
+        cell_row = bytearray(border)
+        cell_row[1:width - 1:2] = bytes(row_cells)
+
+        sets = list(range(row_cells))
+        next_label = row_cells
+
+        yield border
+        for r in range(rows):
+            last = r == rows - 1
+            row = bytearray(cell_row)
+
+            # 本行集合标签压缩为 0..k-1，在标签上做并查集
+            labels = {}
+            for c in range(row_cells):
+                sets[c] = labels.setdefault(sets[c], len(labels))
+            parent = list(range(len(labels)))
+
+            def find(a):
+                while parent[a] != a:
+                    parent[a] = parent[parent[a]]
+                    a = parent[a]
+                return a
+
+            # 1. 横向合并
+            bits = rng.getrandbits(row_cells) if row_cells else 0
+            for c in range(row_cells - 1):
+                if last or (bits >> c) & 1:
+                    a, b = find(sets[c]), find(sets[c + 1])
+                    if a != b:
+                        parent[b] = a
+                        row[2 * c + 2] = 0
+            for c in range(row_cells):
+                sets[c] = find(sets[c])
+
+            yield bytes(row)
+            if last:
+                break
+
+            # 2. 纵向打通：每个集合随机选择若干格点，未选中任何格点的集合随机补选一个
+            below = bytearray(border)
+            carved = bytearray(len(labels))
+            members = {}
+            bits = rng.getrandbits(row_cells)
+            for c in range(row_cells):
+                s = sets[c]
+                members.setdefault(s, []).append(c)
+                if (bits >> c) & 1:
+                    below[2 * c + 1] = 0
+                    carved[s] = 1
+            for s, cols in members.items():
+                if not carved[s]:
+                    below[2 * rng.choice(cols) + 1] = 0
+
+            # 未向下打通的格点在下一行属于新集合
+            for c in range(row_cells):
+                if below[2 * c + 1]:
+                    sets[c] = next_label
+                    next_label += 1
+            yield bytes(below)
+        yield border
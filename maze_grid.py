@@ -0,0 +1,110 @@
+"""
+扁平数组迷宫网格
+"""
+
+
+class MazeGrid:
+    """
+    以一维bytearray存储的迷宫，0（地面），1（墙壁）
+
+    单元格(x, y)对应的扁平下标为 y * width + x。
+    为兼容二维列表的写法，grid[y][x] 依然可用（grid[y] 返回该行的memoryview，可读可写），
+    但算法内部应直接操作 cells 与扁平下标。
+    """
+
+    __slots__ = ('width', 'height', 'size', 'cells', 'offsets')
+
+    def __init__(self, width, height, cells=None):
+        self.width = width
+        self.height = height
+        self.size = width * height
+
+        if cells is None:
+            self.cells = bytearray(self.size)
+        else:
+            self.cells = bytearray(cells)
+            if len(self.cells) != self.size:
+                raise ValueError(f"单元格数量 {len(self.cells)} 与尺寸 {width}x{height} 不符")
+
+        # 左、上、右、下四个方向的下标偏移
+        self.offsets = (-1, -width, 1, width)
+
+    @classmethod
+    def bordered(cls, width, height):
+        """创建四周为墙壁、内部为空地的迷宫"""
+        grid = cls(width, height)
+        cells = grid.cells
+        cells[:width] = b'\x01' * width
+        cells[grid.size - width:] = b'\x01' * width
+        cells[0::width] = b'\x01' * height
+        cells[width - 1::width] = b'\x01' * height
+        return grid
+
+    @classmethod
+    def from_rows(cls, rows):
+        """由二维列表创建迷宫"""
+        height = len(rows)
+        width = len(rows[0]) if height > 0 else 0
+        cells = bytearray()
+        for row in rows:
+            cells.extend(row)
+        return cls(width, height, cells)
+
+    def to_rows(self):
+        """转换为二维列表"""
+        w = self.width
+        return [list(self.cells[i:i + w]) for i in range(0, self.size, w)]
+
+    def copy(self):
+        return MazeGrid(self.width, self.height, self.cells)
+
+    def index(self, x, y):
+        """坐标 -> 扁平下标"""
+        return y * self.width + x
+
+    def coords(self, i):
+        """扁平下标 -> 坐标"""
+        y, x = divmod(i, self.width)
+        return x, y
+
+    def get(self, x, y):
+        return self.cells[y * self.width + x]
+
+    def set(self, x, y, value):
+        self.cells[y * self.width + x] = value
+
+    def neighbors(self, i):
+        """返回下标i四周可通行的相邻下标（顺序：左、上、右、下）"""
+        cells = self.cells
+        w = self.width
+        x = i % w
+        result = []
+        if x > 0 and not cells[i - 1]:
+            result.append(i - 1)
+        if i >= w and not cells[i - w]:
+            result.append(i - w)
+        if x < w - 1 and not cells[i + 1]:
+            result.append(i + 1)
+        if i + w < self.size and not cells[i + w]:
+            result.append(i + w)
+        return result
+
+    def __len__(self):
+        return self.height
+
+    def __getitem__(self, y):
+        if not 0 <= y < self.height:
+            raise IndexError("迷宫行下标越界")
+        w = self.width
+        return memoryview(self.cells)[y * w:(y + 1) * w]
+
+    def __iter__(self):
+        for y in range(self.height):
+            yield self[y]
+
+
+def as_grid(maze):
+    """将二维列表或MazeGrid统一转换为MazeGrid（MazeGrid原样返回）"""
+    if isinstance(maze, MazeGrid):
+        return maze
+    return MazeGrid.from_rows(maze)
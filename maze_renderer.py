@@ -0,0 +1,174 @@
+"""
+迷宫画布渲染器
+
+两种渲染器接口相同：
+    draw(width, height, cell_size, offset_x, offset_y, colors)  全量绘制，colors为按扁平下标排列的颜色列表
+    show_region(x0, y0, x1, y1)                                  可见区域（画布坐标）变化
+    rescale(cell_size, offset_x, offset_y)                       缩放：变换已绘制的内容，不重新创建
+    update(x, y, color)                                          更新单个单元格的颜色
+RESCALE_IS_EXACT 为False时，rescale之后的坐标可能有浮点误差，调用方应在缩放结束后重新draw一次。
+
+RectRenderer 为单元格创建矩形图元（白色描边形成网格线），只为可见区域内的单元格创建，适合小迷宫；
+RasterRenderer 把整个迷宫画在一张 PhotoImage 上，画布中只有一个图元，
+单元格更新只改写对应的像素块，图元数量与迷宫大小无关。
+"""
+from array import array
+import tkinter as tk
+
+
+class RectRenderer:
+    """
+    每个单元格一个矩形图元，只为可见区域（外加 MARGIN 个单元格的余量）内的单元格创建
+
+    图元编号按扁平下标记录在 self.items（array('i')，0表示没有图元）中，更新单元格时直接按下标取得图元，
+    不需要为每个图元设置标签，也不需要按标签查找（每次查找都是一次字符串格式化加Tcl调用）。
+    可见区域变化时，移出区域的图元隐藏后放回回收池，新进入区域的单元格优先复用池中的图元，
+    图元数量与绘制耗时只与屏幕大小有关，与迷宫大小无关。
+    单元格颜色保存在 self.colors 中（update时同步修改），重新进入可见区域的单元格按它着色。
+    """
+
+    # 可见区域四周额外创建图元的单元格数，小幅平移时不需要创建图元
+    MARGIN = 8
+    # canvas.scale 之后图元坐标为浮点数，缩放结束后需要重建一次
+    RESCALE_IS_EXACT = False
+
+    def __init__(self, canvas):
+        self.canvas = canvas
+        self.width = 0
+        self.height = 0
+        self.cell_size = 1
+        self.offset = (0, 0)
+        self.colors = []
+        self.items = array('i')
+        self.pool = []  # 隐藏的可复用图元
+        self.region = (0, 0, 0, 0)  # 已创建图元的单元格范围 [x0, x1) × [y0, y1)，记为 (x0, y0, x1, y1)
+
+    def draw(self, width, height, cell_size, offset_x, offset_y, colors):
+        # 画布已被清空，图元在 show_region 中按需创建
+        self.width = width
+        self.height = height
+        self.cell_size = cell_size
+        self.offset = (offset_x, offset_y)
+        self.colors = colors
+        self.items = array('i', [0]) * (width * height)
+        self.pool = []
+        self.region = (0, 0, 0, 0)
+
+    def show_region(self, x0, y0, x1, y1):
+        size = self.cell_size
+        offset_x, offset_y = self.offset
+        margin = self.MARGIN
+        cx0 = max(0, int((x0 - offset_x) // size) - margin)
+        cy0 = max(0, int((y0 - offset_y) // size) - margin)
+        cx1 = min(self.width, int((x1 - offset_x) // size) + 1 + margin)
+        cy1 = min(self.height, int((y1 - offset_y) // size) + 1 + margin)
+        if (cx0, cy0, cx1, cy1) == self.region:
+            return
+
+        canvas = self.canvas
+        width = self.width
+        items = self.items
+        colors = self.colors
+        pool = self.pool
+
+        # 回收移出范围的图元
+        ox0, oy0, ox1, oy1 = self.region
+        for y in range(oy0, oy1):
+            row_inside = cy0 <= y < cy1
+            for x in range(ox0, ox1):
+                if row_inside and cx0 <= x < cx1:
+                    continue
+                i = y * width + x
+                if items[i]:
+                    canvas.itemconfig(items[i], state='hidden')
+                    pool.append(items[i])
+                    items[i] = 0
+
+        # 为进入范围的单元格复用或创建图元
+        create = canvas.create_rectangle
+        for y in range(cy0, cy1):
+            top = offset_y + y * size
+            for x in range(cx0, cx1):
+                i = y * width + x
+                if items[i]:
+                    continue
+                left = offset_x + x * size
+                if pool:
+                    item = pool.pop()
+                    canvas.coords(item, left, top, left + size, top + size)
+                    canvas.itemconfig(item, fill=colors[i], state='normal')
+                else:
+                    item = create(left, top, left + size, top + size, fill=colors[i], outline='white', width=1)
+                items[i] = item
+        self.region = (cx0, cy0, cx1, cy1)
+
+    def rescale(self, cell_size, offset_x, offset_y):
+        """用 canvas.scale 与 canvas.move 一次变换全部已有图元（两次Tcl调用，与图元数量无关）"""
+        factor = cell_size / self.cell_size
+        old_x, old_y = self.offset
+        self.canvas.scale('all', 0, 0, factor, factor)
+        self.canvas.move('all', offset_x - old_x * factor, offset_y - old_y * factor)
+        self.cell_size = cell_size
+        self.offset = (offset_x, offset_y)
+
+    def update(self, x, y, color):
+        if 0 <= x < self.width and 0 <= y < self.height:
+            i = y * self.width + x
+            self.colors[i] = color
+            if self.items[i]:
+                self.canvas.itemconfig(self.items[i], fill=color)
+
+
+class RasterRenderer:
+    """
+    整个迷宫画在一张 PhotoImage 上
+
+    先按每格1像素写入底图（一次put），再用 zoom 放大到单元格大小得到显示用的图像；
+    更新单元格时同时改写底图中的像素与显示图像中用 put(color, to=区域) 填充的像素块。
+    缩放只需从底图重新 zoom 一次，不需要重新生成颜色数据。
+    位图内存为 4 字节 × 像素数，因此单元格大小受 MAX_SIDE 限制（见 max_cell_size）。
+    """
+
+    # 位图的最大边长（像素）
+    MAX_SIDE = 4096
+    # 缩放由底图重新放大得到，与完整重绘的结果相同
+    RESCALE_IS_EXACT = True
+
+    def __init__(self, canvas):
+        self.canvas = canvas
+        self.base = None  # 每格1像素的底图
+        self.image = None  # 显示用的图像（cell_size为1时即底图）
+        self.item = None
+        self.cell_size = 1
+
+    @classmethod
+    def max_cell_size(cls, width, height):
+        """位图渲染时允许的最大单元格大小"""
+        return max(1, cls.MAX_SIDE // max(width, height))
+
+    def draw(self, width, height, cell_size, offset_x, offset_y, colors):
+        base = tk.PhotoImage(master=self.canvas, width=width, height=height)
+        base.put(' '.join('{' + ' '.join(colors[i:i + width]) + '}' for i in range(0, width * height, width)))
+        self.base = base
+        self.image = base.zoom(cell_size) if cell_size > 1 else base  # 保留引用，否则图像会被回收
+        self.cell_size = cell_size
+        self.item = self.canvas.create_image(offset_x, offset_y, image=self.image, anchor=tk.NW)
+
+    def show_region(self, x0, y0, x1, y1):
+        """位图始终完整绘制，与可见区域无关"""
+
+    def rescale(self, cell_size, offset_x, offset_y):
+        if self.base is None:
+            return
+        self.image = self.base.zoom(cell_size) if cell_size > 1 else self.base
+        self.cell_size = cell_size
+        self.canvas.itemconfig(self.item, image=self.image)
+        self.canvas.coords(self.item, offset_x, offset_y)
+
+    def update(self, x, y, color):
+        if self.base is None:
+            return
+        self.base.put(color, to=(x, y))
+        if self.image is not self.base:
+            size = self.cell_size
+            self.image.put(color, to=(x * size, y * size, (x + 1) * size, (y + 1) * size))
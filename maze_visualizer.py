@@ -3,14 +3,22 @@
 """
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog
+from collections import deque
+import random
 import threading
 import time
 import webbrowser
+import inspect
 import sys
 import os
+from maze_grid import MazeGrid
 from maze_generator import MazeGenerator
 from path_finder import PathFinder
-from maze_codec import encode_maze_to_base64, decode_base64_to_maze
+from solution_cache import SolutionCache, maze_digest
+from incremental_planner import IncrementalPlanner
+from tree_index import TreeIndex
+from maze_codec import encode_maze_to_base64, encode_maze_to_seed, decode_maze_code, parse_maze_seed
+from maze_renderer import RectRenderer, RasterRenderer
 from texts import ALGORITHM_INFO, ABOUT_INFO
 
 
@@ -20,6 +28,18 @@ def resource_path(relative_path):
     return os.path.join(base_path, relative_path)
 
 
+def source_url(func):
+    """获取函数在GitHub上的源码链接（附带行号范围）"""
+    base_url = ABOUT_INFO["github_url"] + "/blob/main/"
+    try:
+        filename = os.path.basename(inspect.getsourcefile(func))
+        lines, first = inspect.getsourcelines(func)
+    except (OSError, TypeError):
+        # 打包后无法读取源码，仅链接到文件
+        return base_url + func.__module__ + ".py"
+    return f"{base_url}{filename}#L{first}-L{first + len(lines) - 1}"
+
+
 class MazeVisualizer:
     """迷宫算法可视化"""
 
@@ -29,15 +49,39 @@ class MazeVisualizer:
         self.root.geometry("1200x800")
 
         # 迷宫参数
-        self.maze = []
+        self.maze = None
         self.width = 25
         self.height = 25
         self.base_cell_size = 25  # 基础单元格大小
+        self.fit_side = 2600  # 大迷宫自动缩小单元格，使缩放100%时迷宫边长不超过该像素数
+        self.max_size = 1001  # 迷宫最大尺寸
+        self.rect_limit = 101  # 超过该尺寸的迷宫总是使用位图渲染
+        self.renderer = None
+        self._viewport_pending = False  # 是否已安排可见区域刷新
+        self._zoom_rebuild_job = None  # 缩放结束后重建画布的延迟任务
+        self.zoom_rebuild_delay = 250  # ms，连续缩放（滚轮）停止这么久之后才重建
         self.start = (1, 1)
         self.end = (self.width - 2, self.height - 2)
         self.cell_states = {}  # 记录每个单元格的状态
         self.drag_toggle_to = None  # 拖拽时单向切换目标
 
+        # 寻路结果缓存（迷宫内容哈希在编辑/生成/解码后失效，按需重新计算）
+        self.solution_cache = SolutionCache()
+        self.solution_cache_dir = os.path.join(os.path.expanduser('~'), '.maze_visualizer', 'solutions')
+        self._maze_digest = None
+
+        # 增量重规划（开启后编辑墙壁会就地修复上一次求出的路径）
+        self.planner = None
+
+        # 树索引（完美迷宫上O(log n)查询任意两格距离，None表示需要重建，False表示迷宫不是树）
+        # 在后台线程中对迷宫副本建立；迷宫每次变化版本号加一，建立完成时版本号已变化的结果直接丢弃
+        self._tree_index = None
+        self._tree_version = 0
+        self._tree_build_version = None  # 正在建立的索引对应的版本号
+
+        # 种子编码（刚生成、未经编辑的迷宫可以只用 算法:尺寸:种子 表示）
+        self._seed_code = None
+
         # 缩放参数
         self.zoom_level = 1.0  # 当前缩放级别
         self.min_zoom = 0.3  # 最小缩放
@@ -53,6 +97,11 @@ class MazeVisualizer:
         self.pause_event.set()  # 初始为非暂停状态
         self.animation_speed = 100  # ms
 
+        # 算法线程产生的单元格更新先放入队列（deque的append/popleft是线程安全的），
+        # 主线程每帧取出一次，同一单元格只保留最后的状态后统一绘制
+        self._pending_updates = deque()
+        self.frame_interval = 16  # ms，约60帧/秒
+
         # 颜色配置
         self.colors = {
             'wall': '#2c3e50',
@@ -76,6 +125,8 @@ class MazeVisualizer:
         self.maze = self.init_maze(self.width, self.height)
         self.draw_maze()
 
+        self.root.after(self.frame_interval, self._flush_updates)
+
     def setup_ui(self):
         """初始化界面"""
         # 主框架布局
@@ -149,7 +200,9 @@ class MazeVisualizer:
         scroll_x = ttk.Scrollbar(canvas_frame, orient=tk.HORIZONTAL, command=self.canvas.xview)
         scroll_x.pack(side=tk.BOTTOM, fill=tk.X)
 
-        self.canvas.configure(xscrollcommand=scroll_x.set, yscrollcommand=scroll_y.set)
+        # 视图变化（平移、滚动、缩放、改变窗口大小）时画布会调用滚动命令，借此更新可见区域
+        self.canvas.configure(xscrollcommand=lambda *args: self._on_canvas_scroll(scroll_x, *args),
+                              yscrollcommand=lambda *args: self._on_canvas_scroll(scroll_y, *args))
         self.canvas.pack(fill=tk.BOTH, expand=True)
 
         # ===== 以下所有控件都放在 control_frame 中 =====
@@ -174,6 +227,19 @@ class MazeVisualizer:
         height_entry = ttk.Entry(height_frame, textvariable=self.height_var, width=8)
         height_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
 
+        # 随机种子（留空则随机选取，相同种子生成相同迷宫）
+        seed_frame = ttk.Frame(size_frame)
+        seed_frame.pack(fill=tk.X, pady=2)
+        ttk.Label(seed_frame, text="种子 (可留空):").pack(side=tk.LEFT, padx=(0, 5))
+        self.seed_var = tk.StringVar(value="")
+        seed_entry = ttk.Entry(seed_frame, textvariable=self.seed_var, width=8)
+        seed_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
+
+        # 位图渲染（整个迷宫画在一张图上，大迷宫自动启用）
+        self.raster_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(size_frame, text=f"位图渲染（尺寸超过{self.rect_limit}时自动启用）",
+                        variable=self.raster_var, command=self.draw_maze).pack(anchor=tk.W, pady=(4, 0))
+
         # 生成算法选择
         algo_frame = ttk.LabelFrame(control_frame, text="生成算法", padding=5)
         algo_frame.pack(fill=tk.X, pady=(0, 10))
@@ -183,7 +249,11 @@ class MazeVisualizer:
             ("深度优先 (DFS)", "DFS"),
             ("Prim算法", "Prim"),
             ("Kruskal算法", "Kruskal"),
-            ("递归分割", "Recursive")
+            ("递归分割", "Recursive"),
+            ("Eller算法", "Eller"),
+            ("二叉树算法", "BinaryTree"),
+            ("Sidewinder算法", "Sidewinder"),
+            ("生长树算法", "GrowingTree")
         ]
 
         for text, value in algorithms:
@@ -204,12 +274,24 @@ class MazeVisualizer:
             ("贪心最佳优先 (GBFS)", "GBFS"),
             ("A*算法", "AStar"),
             ("双向深度优先 (D-DFS)", "D-DFS"),
-            ("双向广度优先 (D-BFS)", "D-BFS")
+            ("双向广度优先 (D-BFS)", "D-BFS"),
+            ("双向A*算法 (D-A*)", "D-AStar"),
+            ("跳点搜索 (JPS)", "JPS")
         ]
 
         for text, value in find_algorithms:
             ttk.Radiobutton(find_frame, text=text, variable=self.find_algo_var, value=value).pack(anchor=tk.W, pady=2)
 
+        # 磁盘缓存开关（内存缓存始终启用）
+        self.disk_cache_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(find_frame, text="结果缓存到磁盘", variable=self.disk_cache_var,
+                        command=self.toggle_disk_cache).pack(anchor=tk.W, pady=(6, 2))
+
+        # 增量重规划开关（LPA*，编辑墙壁后自动修复路径）
+        self.incremental_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(find_frame, text="增量重规划（编辑后自动修复路径）", variable=self.incremental_var,
+                        command=self.toggle_incremental).pack(anchor=tk.W, pady=2)
+
         # 寻路按钮
         ttk.Button(control_frame, text="开始寻路", command=self.find_path).pack(fill=tk.X, pady=(0, 10))
 
@@ -221,6 +303,11 @@ class MazeVisualizer:
         ttk.Scale(speed_frame, from_=0, to=200, variable=self.speed_var, orient=tk.HORIZONTAL,
                   command=self.update_speed).pack(fill=tk.X)
 
+        # 跳过动画（直接算出结果后一次性绘制，大迷宫自动跳过）
+        self.skip_animation_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(speed_frame, text=f"跳过动画（尺寸超过{self.rect_limit}时自动跳过）",
+                        variable=self.skip_animation_var).pack(anchor=tk.W, pady=(4, 0))
+
         # 执行控制按钮
         button_frame1 = ttk.Frame(control_frame)
         button_frame1.pack(fill=tk.X, pady=(0, 5))
@@ -426,17 +513,55 @@ class MazeVisualizer:
 
     def init_maze(self, width, height):
         """初始化迷宫"""
-        maze = []
-        for i in range(height):
-            maze.append([])
-            for j in range(width):
-                if i == 0 or i == height - 1:
-                    maze[i].append(1)
-                elif j == 0 or j == width - 1:
-                    maze[i].append(1)
-                else:
-                    maze[i].append(0)
-        return maze
+        return MazeGrid.bordered(width, height)
+
+    def _use_raster(self):
+        """是否使用位图渲染"""
+        return self.raster_var.get() or max(self.maze.width, self.maze.height) > self.rect_limit
+
+    def _animate(self, width, height):
+        """
+        生成与寻路是否播放动画
+
+        动画每个事件至少等待1ms，1001×1001的DFS迷宫有约225万个事件，
+        因此大迷宫（与位图渲染同一阈值）或勾选跳过动画时不带回调运行算法，完成后一次性绘制
+        """
+        return not self.skip_animation_var.get() and max(width, height) <= self.rect_limit
+
+    def _cell_size(self):
+        """缩放后的单元格大小（像素）"""
+        width, height = self.maze.width, self.maze.height
+        base = min(self.base_cell_size, self.fit_side / max(width, height))
+        cell_size = max(1, int(base * self.zoom_level))
+        if self._use_raster():
+            cell_size = min(cell_size, RasterRenderer.max_cell_size(width, height))
+        return cell_size
+
+    def _offsets(self, cell_size):
+        """迷宫小于画布时居中显示的偏移量"""
+        total_width = self.maze.width * cell_size
+        total_height = self.maze.height * cell_size
+        canvas_width = self.canvas.winfo_width()
+        canvas_height = self.canvas.winfo_height()
+        offset_x = (canvas_width - total_width) // 2 if total_width < canvas_width else 0
+        offset_y = (canvas_height - total_height) // 2 if total_height < canvas_height else 0
+        return offset_x, offset_y
+
+    def _cell_colors(self):
+        """按扁平下标排列的单元格颜色（优先使用保存的状态，其次为墙壁、起点、终点、路径）"""
+        width, height = self.maze.width, self.maze.height
+        cells = self.maze.cells
+        colors = self.colors
+
+        palette = (colors['path'], colors['wall'])
+        result = [palette[c] for c in cells]
+        for (x, y), name in ((self.end, 'end'), (self.start, 'start')):
+            if 0 <= x < width and 0 <= y < height and cells[y * width + x] == 0:
+                result[y * width + x] = colors[name]
+        for (x, y), cell_type in self.cell_states.items():
+            if 0 <= x < width and 0 <= y < height:
+                result[y * width + x] = colors[cell_type]
+        return result
 
     def draw_maze(self):
         """绘制迷宫"""
@@ -445,61 +570,43 @@ class MazeVisualizer:
         if not self.maze:
             return
 
-        width = len(self.maze[0])
-        height = len(self.maze)
+        width = self.maze.width
+        height = self.maze.height
+
+        # 计算缩放后的单元格大小与居中偏移
+        cell_size = self._cell_size()
+        offset_x, offset_y = self._offsets(cell_size)
 
-        # 计算缩放后的单元格大小
-        cell_size = int(self.base_cell_size * self.zoom_level)
+        renderer_class = RasterRenderer if self._use_raster() else RectRenderer
+        if not isinstance(self.renderer, renderer_class):
+            self.renderer = renderer_class(self.canvas)
+        self.renderer.draw(width, height, cell_size, offset_x, offset_y, self._cell_colors())
 
-        # 计算总尺寸
-        total_width = width * cell_size
-        total_height = height * cell_size
+        self._update_scrollregion(cell_size)
+        self._refresh_viewport()
 
-        # 居中计算
+    def _update_scrollregion(self, cell_size):
+        """按单元格大小更新滚动区域"""
         canvas_width = self.canvas.winfo_width()
         canvas_height = self.canvas.winfo_height()
-
-        # 计算居中的偏移量
-        if total_width < canvas_width:
-            offset_x = (canvas_width - total_width) // 2
-        else:
-            offset_x = 0
-
-        if total_height < canvas_height:
-            offset_y = (canvas_height - total_height) // 2
-        else:
-            offset_y = 0
-
-        # 绘制每个单元格
-        for y in range(height):
-            for x in range(width):
-                x1 = offset_x + x * cell_size
-                y1 = offset_y + y * cell_size
-                x2 = x1 + cell_size
-                y2 = y1 + cell_size
-
-                # 确定单元格颜色（优先使用保存的状态）
-                cell_type = self.cell_states.get((x, y))
-
-                if cell_type:
-                    color = self.colors[cell_type]
-                elif self.maze[y][x] == 1:  # 墙壁
-                    color = self.colors['wall']
-                elif (x, y) == self.start:
-                    color = self.colors['start']
-                elif (x, y) == self.end:
-                    color = self.colors['end']
-                else:
-                    color = self.colors['path']
-
-                # 绘制单元格
-                cell_id = self.canvas.create_rectangle(x1, y1, x2, y2, fill=color, outline='white', width=1)
-
-                # 存储单元格信息
-                self.canvas.itemconfig(cell_id, tags=(f"cell_{x}_{y}", f"x_{x}_y_{y}"))
-
-        # 更新滚动区域
-        self.canvas.configure(scrollregion=(0, 0, max(total_width, canvas_width), max(total_height, canvas_height)))
+        self.canvas.configure(scrollregion=(0, 0, max(self.maze.width * cell_size, canvas_width),
+                                            max(self.maze.height * cell_size, canvas_height)))
+
+    def _on_canvas_scroll(self, scrollbar, first, last):
+        """画布视图变化：同步滚动条，并安排刷新可见区域"""
+        scrollbar.set(first, last)
+        if not self._viewport_pending:
+            self._viewport_pending = True
+            self.root.after_idle(self._refresh_viewport)
+
+    def _refresh_viewport(self):
+        """把当前可见区域（画布坐标）告知渲染器，按需创建或回收图元"""
+        self._viewport_pending = False
+        if self.renderer is None:
+            return
+        canvas = self.canvas
+        self.renderer.show_region(canvas.canvasx(0), canvas.canvasy(0),
+                                  canvas.canvasx(canvas.winfo_width()), canvas.canvasy(canvas.winfo_height()))
 
     def update_cell(self, x, y, cell_type):
         """更新单元格显示"""
@@ -507,8 +614,8 @@ class MazeVisualizer:
             # 主线程（手动编辑）：直接更新
             self._do_update_cell(x, y, cell_type)
         else:
-            # 子线程（算法动画）：调度到主线程更新（确保线程安全），并延迟一段时间
-            self.root.after_idle(self._do_update_cell, x, y, cell_type)
+            # 子线程（算法动画）：放入更新队列，由主线程按帧绘制（确保线程安全），并延迟一段时间
+            self._pending_updates.append((x, y, cell_type))
             self.check_pause()
             if self.is_step_mode:  # 单步模式下每步结束后重新暂停，不设置延迟
                 self.is_step_mode = False
@@ -516,14 +623,35 @@ class MazeVisualizer:
             else:
                 time.sleep(self.animation_speed / 1000)
 
+    def _flush_updates(self):
+        """
+        每帧执行一次（主线程）：绘制队列中积累的更新
+
+        不论算法线程产生更新有多快，每帧的绘制量都不超过迷宫的单元格数，界面不会积压大量待执行的回调
+        """
+        self._apply_pending_updates()
+        self.root.after(self.frame_interval, self._flush_updates)
+
+    def _apply_pending_updates(self):
+        """取出队列中已有的更新，同一单元格只保留最后的状态，一次性绘制（在主线程中调用）"""
+        queue = self._pending_updates
+        if not queue:
+            return
+        latest = {}
+        popleft = queue.popleft
+        for _ in range(len(queue)):
+            x, y, cell_type = popleft()
+            latest[(x, y)] = cell_type
+        for (x, y), cell_type in latest.items():
+            self._do_update_cell(x, y, cell_type)
+
     def _do_update_cell(self, x, y, cell_type):
         """执行GUI更新"""
         # 保存状态
         self.cell_states[(x, y)] = cell_type
 
-        cell_id = self.canvas.find_withtag(f"cell_{x}_{y}")
-        if cell_id:
-            self.canvas.itemconfig(cell_id[0], fill=self.colors[cell_type])
+        if self.renderer is not None:
+            self.renderer.update(x, y, self.colors[cell_type])
 
     def generate_maze(self):
         """生成迷宫"""
@@ -544,8 +672,22 @@ class MazeVisualizer:
             if width < 5 or height < 5:
                 messagebox.showerror("错误", "迷宫尺寸至少为5")
                 return
-            if width > 101 or height > 101:
-                messagebox.showerror("错误", "迷宫尺寸最大为101")
+            if width > self.max_size or height > self.max_size:
+                messagebox.showerror("错误", f"迷宫尺寸最大为{self.max_size}")
+                return
+
+            seed_text = self.seed_var.get().strip()
+            seed = int(seed_text) if seed_text else random.randrange(2 ** 32)
+
+            algo = self.gen_algo_var.get()
+            if not self._animate(width, height):
+                # 不播放动画：在新线程中生成新的迷宫，完成后一次性绘制
+                self.is_generating = True
+                self.status_label.config(text="正在生成迷宫...", foreground="orange")
+                thread = threading.Thread(target=self._generate_headless_thread,
+                                          args=(algo, width, height, seed, "迷宫生成完成"))
+                thread.daemon = True
+                thread.start()
                 return
 
             self.width = width
@@ -554,14 +696,13 @@ class MazeVisualizer:
             self.reset_maze()
 
             # 在新线程中生成迷宫
-            algo = self.gen_algo_var.get()
-            thread = threading.Thread(target=self._generate_maze_thread, args=(algo,))
+            thread = threading.Thread(target=self._generate_maze_thread, args=(algo, seed))
             thread.daemon = True
             thread.start()
         except ValueError:
             messagebox.showerror("错误", "请输入有效的数字")
 
-    def _generate_maze_thread(self, algo):
+    def _generate_maze_thread(self, algo, seed):
         """生成迷宫的线程函数"""
         self.is_generating = True
         self.is_paused = False
@@ -571,15 +712,10 @@ class MazeVisualizer:
 
         start_time = time.time()
 
-        generator = MazeGenerator(self.maze, self.width, self.height, self.update_cell)
-        if algo == "DFS":
-            generator.generate_dfs()
-        elif algo == "Prim":
-            generator.generate_prim()
-        elif algo == "Kruskal":
-            generator.generate_kruskal()
-        elif algo == "Recursive":
-            generator.generate_recursive()
+        generator = MazeGenerator(self.maze, self.width, self.height, self.update_cell, seed=seed)
+        generator.generate(algo)
+        self._on_maze_changed()
+        self._seed_code = encode_maze_to_seed(algo, self.width, self.height, seed)
 
         # 设置起点和终点
         self.update_cell(*self.start, 'start')
@@ -610,48 +746,63 @@ class MazeVisualizer:
 
     def _find_path_thread(self, algo):
         """寻路的线程函数"""
+        animate = self._animate(self.width, self.height)
         self.is_finding = True
         self.is_paused = False
         self.pause_event.set()
-        self.root.after(0, lambda: self.enable_pause_button(True))
+        if animate:
+            self.root.after(0, lambda: self.enable_pause_button(True))
         self.root.after(0, lambda: self.status_label.config(text="正在寻路...", foreground="orange"))
 
         start_time = time.time()
 
-        finder = PathFinder(self.maze, self.width, self.height, self.start, self.end, self.update_cell)
-        path = None
-        if algo == "DFS":
-            path = finder.find_path_dfs()
-        elif algo == "BFS":
-            path = finder.find_path_bfs()
-        elif algo == "Dijkstra":
-            path = finder.find_path_dijkstra()
-        elif algo == "GBFS":
-            path = finder.find_path_gbfs()
-        elif algo == "AStar":
-            path = finder.find_path_astar()
-        elif algo == "D-DFS":
-            path = finder.find_path_bidirectional_dfs()
-        elif algo == "D-BFS":
-            path = finder.find_path_bidirectional_bfs()
+        cached = None
+        if self.incremental_var.get():
+            # 增量模式：由LPA*求解并保留搜索状态，供之后的编辑修复路径（不播放搜索动画）
+            self.planner = IncrementalPlanner(self.maze, self.start, self.end)
+            path, stats = self.planner.solve()
+        else:
+            # 相同迷宫、起终点与算法直接使用缓存结果，跳过搜索动画
+            digest = self._current_maze_digest()
+            cached = self.solution_cache.get(digest, self.start, self.end, algo)
+            if cached is not None:
+                path, stats = cached
+            else:
+                update_cell = self.update_cell if animate else None
+                finder = PathFinder(self.maze, self.width, self.height, self.start, self.end, update_cell)
+                path, stats = finder.solve(algo)
+                self.solution_cache.put(digest, self.start, self.end, algo, path, stats)
 
         elapsed = time.time() - start_time
+        cache_note = " (缓存)" if cached is not None else ""
 
         if path:
-            # 显示解路径
-            for x, y in path:
-                if (x, y) != self.start and (x, y) != self.end:
-                    self.update_cell(x, y, 'solution')
+            if animate:
+                # 显示解路径
+                for x, y in path:
+                    if (x, y) != self.start and (x, y) != self.end:
+                        self.update_cell(x, y, 'solution')
+            else:
+                # 不播放动画：由主线程一次性绘制解路径
+                self.root.after(0, lambda: self._show_solution(path))
 
-            self.root.after(0, lambda: self.status_label.config(text=f"寻路成功 ({len(path)}步)", foreground="green"))
+            self.root.after(0, lambda: self.status_label.config(text=f"寻路成功 ({len(path)}步){cache_note}",
+                                                                foreground="green"))
             self.root.after(0, lambda: self.steps_label.config(text=f"步数: {len(path)}"))
         else:
-            self.root.after(0, lambda: self.status_label.config(text="寻路失败", foreground="red"))
+            self.root.after(0, lambda: self.status_label.config(text=f"寻路失败{cache_note}", foreground="red"))
 
         self.is_finding = False
         self.root.after(0, lambda: self.time_label.config(text=f"耗时: {elapsed:.2f}s"))
         self.root.after(0, lambda: self.enable_pause_button(False))
 
+    def _show_solution(self, path):
+        """标记解路径并重绘一次（在主线程中调用）"""
+        for cell in path:
+            if cell != self.start and cell != self.end:
+                self.cell_states[cell] = 'solution'
+        self.draw_maze()
+
     def clear_path(self):
         """清除路径标记"""
         if not self.maze or self.is_generating or self.is_finding:
@@ -663,14 +814,11 @@ class MazeVisualizer:
                 messagebox.showerror("警告", "请先生成迷宫")
             return
 
-        x_size, y_size = self.width, self.height
-
-        # 清除路径相关的状态
-        for x in range(x_size):
-            for y in range(y_size):
-                if (x, y) in self.cell_states:
-                    if self.cell_states[(x, y)] in {'visited', 'current', 'solution', 'frontier'}:
-                        del self.cell_states[(x, y)]
+        # 先绘制上一次动画尚未绘制的更新，再清除路径相关的状态（只遍历有状态的单元格，与迷宫大小无关）
+        self._apply_pending_updates()
+        for cell, cell_type in list(self.cell_states.items()):
+            if cell_type in {'visited', 'current', 'solution', 'frontier'}:
+                del self.cell_states[cell]
 
         # 重绘迷宫
         self.draw_maze()
@@ -688,8 +836,9 @@ class MazeVisualizer:
 
         self.start = (1, 1)
         self.end = (self.width - 2, self.height - 2)
-        self.maze = []
         self.maze = self.init_maze(self.width, self.height)
+        self._on_maze_changed()
+        self._pending_updates.clear()  # 丢弃上一次动画尚未绘制的更新
         self.cell_states.clear()
         self.draw_maze()
 
@@ -708,7 +857,8 @@ class MazeVisualizer:
                 messagebox.showerror("警告", "请先生成迷宫")
             return
 
-        encoded = encode_maze_to_base64(self.maze)
+        # 迷宫生成后未经编辑时输出种子编码，否则输出完整的Base64编码
+        encoded = self._seed_code or encode_maze_to_base64(self.maze)
         self.code_var.set(encoded)
 
         # 复制到剪贴板
@@ -731,23 +881,154 @@ class MazeVisualizer:
             return
 
         try:
-            self.reset_maze()
-            self.maze, (self.width, self.height) = decode_base64_to_maze(encoded)
-
-            # 设置起点和终点
-            self.start = (1, 1)
-            self.end = (self.width - 2, self.height - 2)
+            if ':' in encoded:
+                # 种子编码：先检查尺寸，再在新线程中不带动画地重新生成，完成后一次性绘制
+                algo, width, height, seed = parse_maze_seed(encoded, max_size=self.max_size)
+                self.is_generating = True
+                self.status_label.config(text="正在解码迷宫...", foreground="orange")
+                thread = threading.Thread(target=self._generate_headless_thread,
+                                          args=(algo, width, height, seed, "迷宫解码成功"))
+                thread.daemon = True
+                thread.start()
+                return
 
-            self.cell_states.clear()
-            self.draw_maze()
+            maze, (width, height) = decode_maze_code(encoded, max_size=self.max_size)
+            self._set_maze(maze)
             self.status_label.config(text="迷宫解码成功", foreground="green")
         except Exception as e:
             messagebox.showerror("解码错误", f"解码失败:\n{str(e)}")
 
+    def _generate_headless_thread(self, algo, width, height, seed, done_text):
+        """不播放动画地生成迷宫的线程函数（在新的迷宫上生成，完成后交给主线程一次性绘制）"""
+        start_time = time.time()
+        try:
+            maze = MazeGrid.bordered(width, height)
+            MazeGenerator(maze, width, height, seed=seed).generate(algo)
+        except Exception as e:
+            error = str(e)
+            self.root.after(0, lambda: self._generate_headless_failed(error))
+            return
+        elapsed = time.time() - start_time
+        self.root.after(0, lambda: self._generate_headless_done(maze, algo, seed, elapsed, done_text))
+
+    def _generate_headless_done(self, maze, algo, seed, elapsed, done_text):
+        """显示不带动画生成的迷宫（在主线程中调用）"""
+        self.is_generating = False
+        self._set_maze(maze)
+        self._seed_code = encode_maze_to_seed(algo, maze.width, maze.height, seed)
+        self.status_label.config(text=done_text, foreground="green")
+        self.time_label.config(text=f"耗时: {elapsed:.2f}s")
+
+    def _generate_headless_failed(self, error):
+        """不带动画生成失败（在主线程中调用）"""
+        self.is_generating = False
+        self.status_label.config(text="就绪", foreground="green")
+        messagebox.showerror("错误", f"生成迷宫失败:\n{error}")
+
+    def _set_maze(self, maze):
+        """替换当前迷宫，起点与终点回到默认位置，清除所有单元格状态并重绘（在主线程中调用）"""
+        self.maze, self.width, self.height = maze, maze.width, maze.height
+        self._on_maze_changed()
+
+        # 设置起点和终点
+        self.start = (1, 1)
+        self.end = (self.width - 2, self.height - 2)
+
+        self._pending_updates.clear()
+        self.cell_states.clear()
+        self.draw_maze()
+        self.steps_label.config(text="步数: 0")
+        self.time_label.config(text="耗时: 0.0s")
+
     def update_speed(self, value):
         """更新动画速度"""
         self.animation_speed = 201 - self.speed_var.get()
 
+    def _on_maze_changed(self, cell=None):
+        """
+        迷宫内容变化（编辑、生成、解码、重置）后使依赖迷宫内容的缓存失效
+
+        参数:
+            cell: 被编辑的单元格坐标；为None表示整个迷宫被替换
+        """
+        self._maze_digest = None
+        self._tree_index = None
+        self._tree_version += 1
+        self._seed_code = None
+        if self.planner is None:
+            return
+        if cell is None:
+            self.planner = None
+        else:
+            self.planner.notify_changed(*cell)
+            self._replan()
+
+    def _replan(self):
+        """增量修复路径并刷新显示（在主线程中调用）"""
+        start_time = time.time()
+        path, stats = self.planner.solve()
+        elapsed = time.time() - start_time
+
+        for (x, y), state in list(self.cell_states.items()):
+            if state == 'solution':
+                self.update_cell(x, y, 'path')
+        if path:
+            for x, y in path:
+                if (x, y) != self.start and (x, y) != self.end:
+                    self.update_cell(x, y, 'solution')
+            self.status_label.config(text=f"增量重规划 ({len(path)}步, 扩展{stats['expanded']}格)",
+                                     foreground="green")
+            self.steps_label.config(text=f"步数: {len(path)}")
+        else:
+            self.status_label.config(text="增量重规划: 无可达路径", foreground="red")
+            self.steps_label.config(text="步数: 0")
+        self.time_label.config(text=f"耗时: {elapsed * 1000:.1f}ms")
+
+    def toggle_incremental(self):
+        """切换增量重规划模式"""
+        self.planner = None
+        if self.incremental_var.get():
+            self.status_label.config(text="增量重规划已开启，寻路后编辑墙壁将自动修复路径", foreground="green")
+
+    def _current_maze_digest(self):
+        """当前迷宫的内容哈希（迷宫未变化时复用上次结果）"""
+        if self._maze_digest is None:
+            self._maze_digest = maze_digest(self.maze)
+        return self._maze_digest
+
+    def _current_tree_index(self):
+        """
+        当前迷宫的树索引，迷宫不是树（存在环路或不连通）或索引尚未建立完成时返回None
+
+        不会在主线程中建立索引（1001×1001的迷宫需要数百毫秒）：索引未就绪时启动后台线程建立，
+        拖拽编辑、生成与寻路期间迷宫仍在变化，不启动建立
+        """
+        if self._tree_index is None and self._tree_build_version != self._tree_version \
+                and self.drag_toggle_to is None and not self.is_generating and not self.is_finding:
+            self._tree_build_version = self._tree_version
+            thread = threading.Thread(target=self._build_tree_index_thread,
+                                      args=(self.maze.copy(), self._tree_version))
+            thread.daemon = True
+            thread.start()
+        return self._tree_index or None
+
+    def _build_tree_index_thread(self, maze, version):
+        """建立树索引的线程函数（maze为迷宫副本）"""
+        try:
+            index = TreeIndex(maze)
+        except ValueError:
+            index = False
+        self.root.after(0, lambda: self._set_tree_index(index, version))
+
+    def _set_tree_index(self, index, version):
+        """保存后台建立的树索引（在主线程中调用），迷宫在建立期间已变化时丢弃"""
+        if version == self._tree_version:
+            self._tree_index = index
+
+    def toggle_disk_cache(self):
+        """切换寻路结果的磁盘缓存"""
+        self.solution_cache.cache_dir = self.solution_cache_dir if self.disk_cache_var.get() else None
+
     def on_canvas_resize(self, event):
         """画布大小改变时重绘迷宫"""
         if self.maze:
@@ -758,17 +1039,10 @@ class MazeVisualizer:
         x = self.canvas.canvasx(event.x)
         y = self.canvas.canvasy(event.y)
 
-        width = len(self.maze[0])
-        height = len(self.maze)
-        cell_size = int(self.base_cell_size * self.zoom_level)
-
-        canvas_width = self.canvas.winfo_width()
-        canvas_height = self.canvas.winfo_height()
-        total_width = width * cell_size
-        total_height = height * cell_size
-
-        offset_x = (canvas_width - total_width) // 2 if total_width < canvas_width else 0
-        offset_y = (canvas_height - total_height) // 2 if total_height < canvas_height else 0
+        width = self.maze.width
+        height = self.maze.height
+        cell_size = self._cell_size()
+        offset_x, offset_y = self._offsets(cell_size)
 
         cell_x = int((x - offset_x) // cell_size)
         cell_y = int((y - offset_y) // cell_size)
@@ -784,14 +1058,15 @@ class MazeVisualizer:
         cell = self._get_cell_at(event)
         if cell and cell != self.start and cell != self.end:
             cell_x, cell_y = cell
-            if self.maze[cell_y][cell_x] == 0:
-                self.maze[cell_y][cell_x] = 1
+            if self.maze.get(cell_x, cell_y) == 0:
+                self.maze.set(cell_x, cell_y, 1)
                 self.update_cell(cell_x, cell_y, 'wall')
                 self.drag_toggle_to = 'wall'
             else:
-                self.maze[cell_y][cell_x] = 0
+                self.maze.set(cell_x, cell_y, 0)
                 self.update_cell(cell_x, cell_y, 'path')
                 self.drag_toggle_to = 'path'
+            self._on_maze_changed(cell)
 
     def on_canvas_right_click(self, event):
         """画布右键点击事件"""
@@ -801,12 +1076,14 @@ class MazeVisualizer:
         if cell is None:
             return
         cell_x, cell_y = cell
-        if self.maze[cell_y][cell_x] == 0 and cell != self.start and cell != self.end:
+        if self.maze.get(cell_x, cell_y) == 0 and cell != self.start and cell != self.end:
             choice = simpledialog.askstring(
                 "设置点",
                 f"在({cell_x}, {cell_y})设置:\n1. 起点\n2. 终点",
                 parent=self.root
             )
+            if choice in ('1', '2'):
+                self.planner = None  # 起点/终点变化后需要重新完整求解
             if choice == '1':
                 self.update_cell(*self.start, 'path')
                 self.start = (cell_x, cell_y)
@@ -825,12 +1102,14 @@ class MazeVisualizer:
         cell = self._get_cell_at(event)
         if cell and cell != self.start and cell != self.end:
             cell_x, cell_y = cell
-            if self.drag_toggle_to == 'wall' and self.maze[cell_y][cell_x] == 0:
-                self.maze[cell_y][cell_x] = 1
+            if self.drag_toggle_to == 'wall' and self.maze.get(cell_x, cell_y) == 0:
+                self.maze.set(cell_x, cell_y, 1)
                 self.update_cell(cell_x, cell_y, 'wall')
-            elif self.drag_toggle_to == 'path' and self.maze[cell_y][cell_x] == 1:
-                self.maze[cell_y][cell_x] = 0
+                self._on_maze_changed(cell)
+            elif self.drag_toggle_to == 'path' and self.maze.get(cell_x, cell_y) == 1:
+                self.maze.set(cell_x, cell_y, 0)
                 self.update_cell(cell_x, cell_y, 'path')
+                self._on_maze_changed(cell)
         self.on_canvas_motion(event)
 
     def on_canvas_release(self, event):
@@ -868,7 +1147,13 @@ class MazeVisualizer:
             return
         cell = self._get_cell_at(event)
         if cell:
-            self.coord_label.config(text=f"{cell[0]}, {cell[1]}")
+            text = f"{cell[0]}, {cell[1]}"
+            # 完美迷宫上显示到起点的距离（由树索引直接算出，无需搜索；索引在后台建立，就绪之前不显示）
+            if not self.is_generating and self.maze.get(*cell) == 0 and self.maze.get(*self.start) == 0:
+                index = self._current_tree_index()
+                if index is not None:
+                    text += f"  距起点 {index.distance(self.start, cell)} 步"
+            self.coord_label.config(text=text)
         else:
             self.coord_label.config(text="")
 
@@ -895,8 +1180,9 @@ class MazeVisualizer:
     def _do_zoom(self, zoom_change, event=None):
         """缩放处理"""
         # 获取当前总尺寸
-        old_total_width = len(self.maze[0]) * int(self.base_cell_size * self.zoom_level)
-        old_total_height = len(self.maze) * int(self.base_cell_size * self.zoom_level)
+        old_cell_size = self._cell_size()
+        old_total_width = self.maze.width * old_cell_size
+        old_total_height = self.maze.height * old_cell_size
 
         # 获取缩放中心点的比例
         if event:
@@ -916,11 +1202,11 @@ class MazeVisualizer:
 
         # 执行缩放
         self.zoom_level = max(self.min_zoom, min(self.max_zoom, self.zoom_level + zoom_change))
-        self.draw_maze()
+        self._rescale(old_cell_size)
 
         # 缩放后的总尺寸
-        new_total_width = len(self.maze[0]) * int(self.base_cell_size * self.zoom_level)
-        new_total_height = len(self.maze) * int(self.base_cell_size * self.zoom_level)
+        new_total_width = self.maze.width * self._cell_size()
+        new_total_height = self.maze.height * self._cell_size()
 
         # 用比例算新位置
         new_x = ratio_x * new_total_width
@@ -940,6 +1226,28 @@ class MazeVisualizer:
 
         self.update_zoom_display()
 
+    def _rescale(self, old_cell_size):
+        """
+        缩放已绘制的内容（不重新创建图元），滚轮连续缩放时每一格只做一次整体变换；
+        变换有误差的渲染器在缩放停止 zoom_rebuild_delay 毫秒后完整重绘一次
+        """
+        cell_size = self._cell_size()
+        if self.renderer is None or cell_size == old_cell_size:
+            return
+        offset_x, offset_y = self._offsets(cell_size)
+        self.renderer.rescale(cell_size, offset_x, offset_y)
+        self._update_scrollregion(cell_size)
+
+        if not self.renderer.RESCALE_IS_EXACT:
+            if self._zoom_rebuild_job is not None:
+                self.root.after_cancel(self._zoom_rebuild_job)
+            self._zoom_rebuild_job = self.root.after(self.zoom_rebuild_delay, self._finish_zoom)
+
+    def _finish_zoom(self):
+        """缩放手势结束后重绘一次，消除图元的浮点坐标误差"""
+        self._zoom_rebuild_job = None
+        self.draw_maze()
+
     def reset_zoom(self):
         """重置缩放"""
         if not self.maze:
@@ -1036,7 +1344,11 @@ class MazeVisualizer:
             "dfs",
             "prim",
             "kruskal",
-            "recursive"
+            "recursive",
+            "eller",
+            "binary_tree",
+            "sidewinder",
+            "growing_tree"
         ]
 
         for algo_key in gen_algorithms:
@@ -1072,10 +1384,14 @@ class MazeVisualizer:
             github_link.pack(side=tk.LEFT)
 
             github_urls = {
-                'dfs': 'https://github.com/awa-obli/MazeAlgorithmVisualizer/blob/main/maze_generator.py#L11-L62',
-                'prim': 'https://github.com/awa-obli/MazeAlgorithmVisualizer/blob/main/maze_generator.py#L64-L118',
-                'kruskal': 'https://github.com/awa-obli/MazeAlgorithmVisualizer/blob/main/maze_generator.py#L120-L192',
-                'recursive': 'https://github.com/awa-obli/MazeAlgorithmVisualizer/blob/main/maze_generator.py#L194-L234'
+                'dfs': source_url(MazeGenerator.iter_dfs),
+                'prim': source_url(MazeGenerator.iter_prim),
+                'kruskal': source_url(MazeGenerator.iter_kruskal),
+                'recursive': source_url(MazeGenerator.iter_recursive),
+                'eller': source_url(MazeGenerator.iter_eller_rows),
+                'binary_tree': source_url(MazeGenerator.iter_binary_tree),
+                'sidewinder': source_url(MazeGenerator.iter_sidewinder),
+                'growing_tree': source_url(MazeGenerator.iter_growing_tree)
             }
 
             def make_link_handler(url):
@@ -1095,7 +1411,9 @@ class MazeVisualizer:
             "gbfs",
             "astar",
             "d-dfs",
-            "d-bfs"
+            "d-bfs",
+            "d-astar",
+            "jps"
         ]
 
         for algo_key in find_algorithms:
@@ -1130,13 +1448,15 @@ class MazeVisualizer:
             github_link.pack(side=tk.LEFT)
 
             github_urls = {
-                'dfs': 'https://github.com/awa-obli/MazeAlgorithmVisualizer/blob/main/path_finder.py#L21-L51',
-                'bfs': 'https://github.com/awa-obli/MazeAlgorithmVisualizer/blob/main/path_finder.py#L53-L90',
-                'dijkstra': 'https://github.com/awa-obli/MazeAlgorithmVisualizer/blob/main/path_finder.py#L92-L132',
-                'gbfs': 'https://github.com/awa-obli/MazeAlgorithmVisualizer/blob/main/path_finder.py#L134-L178',
-                'astar': 'https://github.com/awa-obli/MazeAlgorithmVisualizer/blob/main/path_finder.py#L180-L225',
-                'd-dfs': 'https://github.com/awa-obli/MazeAlgorithmVisualizer/blob/main/path_finder.py#L227-L308',
-                'd-bfs': 'https://github.com/awa-obli/MazeAlgorithmVisualizer/blob/main/path_finder.py#L310-L387'
+                'dfs': source_url(PathFinder.iter_dfs),
+                'bfs': source_url(PathFinder.iter_bfs),
+                'dijkstra': source_url(PathFinder.iter_dijkstra),
+                'gbfs': source_url(PathFinder.iter_gbfs),
+                'astar': source_url(PathFinder.iter_astar),
+                'd-dfs': source_url(PathFinder.iter_bidirectional_dfs),
+                'd-bfs': source_url(PathFinder.iter_bidirectional_bfs),
+                'd-astar': source_url(PathFinder.iter_bidirectional_astar),
+                'jps': source_url(PathFinder.iter_jps)
             }
 
             def make_link_handler(url):
@@ -1,391 +1,837 @@
+from array import array
 from collections import deque
 import heapq
+from maze_grid import as_grid
+from priority_queue import QUEUES
+from algorithm_events import run_events
 
 
 class PathFinder:
-    DIRECTIONS = [
-            lambda x, y: (x - 1, y),
-            lambda x, y: (x, y - 1),
-            lambda x, y: (x + 1, y),
-            lambda x, y: (x, y + 1)
-        ]
-
-    def __init__(self, maze, width, height, start, end, update_cell):
-        self.maze = maze
+    # 算法名 -> 寻路方法名
+    ALGORITHMS = {
+        "DFS": "find_path_dfs",
+        "BFS": "find_path_bfs",
+        "Dijkstra": "find_path_dijkstra",
+        "GBFS": "find_path_gbfs",
+        "AStar": "find_path_astar",
+        "D-DFS": "find_path_bidirectional_dfs",
+        "D-BFS": "find_path_bidirectional_bfs",
+        "D-AStar": "find_path_bidirectional_astar",
+        "JPS": "find_path_jps",
+    }
+    # 算法名 -> 事件生成器方法名
+    EVENT_METHODS = {
+        "DFS": "iter_dfs",
+        "BFS": "iter_bfs",
+        "Dijkstra": "iter_dijkstra",
+        "GBFS": "iter_gbfs",
+        "AStar": "iter_astar",
+        "D-DFS": "iter_bidirectional_dfs",
+        "D-BFS": "iter_bidirectional_bfs",
+        "D-AStar": "iter_bidirectional_astar",
+        "JPS": "iter_jps",
+    }
+    # 使用优先队列、可通过 solve(queue=...) 选择队列实现的算法
+    QUEUE_ALGORITHMS = ("Dijkstra", "GBFS", "AStar")
+
+    def __init__(self, maze, width, height, start, end, update_cell=None):
+        """
+        参数:
+            maze: MazeGrid或二维列表，0（地面），1（墙壁）
+            width, height: 迷宫尺寸
+            start, end: 起点、终点坐标 (x, y)
+            update_cell: 单元格状态变化回调 update_cell(x, y, cell_type)，
+                         为None时以无界面模式运行，搜索循环中不产生任何回调
+
+        各寻路方法返回坐标元组列表形式的路径，失败返回None；
+        搜索统计信息（扩展节点数、入队次数、边界峰值）记录在 self.stats 中。
+        算法实现在 iter_* 事件生成器中（见 algorithm_events），产出 (x, y, state) 事件，返回值为路径；
+        solve 与 find_path_* 用 update_cell 驱动它们，iter_events 把事件流直接交给调用方
+        """
+        self.maze = as_grid(maze)
         self.width = width
         self.height = height
         self.start = start
         self.end = end
         self.update_cell = update_cell
+        self.stats = {'expanded': 0, 'pushes': 0, 'peak_frontier': 0}
+        self.queue = "heap"  # Dijkstra/GBFS/A*使用的优先队列，见 priority_queue.QUEUES
+
+    def solve(self, algo, queue="heap"):
+        """
+        按算法名寻路
+
+        参数:
+            algo: 算法名，见 ALGORITHMS
+            queue: Dijkstra/GBFS/A*使用的优先队列（heap/bucket/radix），其他算法忽略；
+                   GBFS的优先级不单调，不能使用基数堆
+
+        返回:
+            (path, stats) 元组
+        """
+        path = self._run(self._prepare(algo, queue))
+        return path, dict(self.stats)
+
+    def iter_events(self, algo, queue="heap"):
+        """
+        按算法名寻路，返回 (x, y, state) 事件的生成器（不使用 update_cell）
+
+        生成器的返回值为 (path, stats) 元组，可以用 yield from 或 algorithm_events.run_events 取得
+        """
+        method = self._prepare(algo, queue)
+
+        def events():
+            path = yield from method(emit=True)
+            return path, dict(self.stats)
+        return events()
+
+    def _prepare(self, algo, queue):
+        """检查算法名与队列名，返回事件生成器方法"""
+        if algo not in self.ALGORITHMS:
+            raise ValueError(f"未知的寻路算法: {algo}")
+        if queue not in QUEUES:
+            raise ValueError(f"未知的优先队列: {queue}")
+        if queue == "radix" and algo == "GBFS":
+            raise ValueError("GBFS的优先级不单调，不能使用基数堆")
+        self.queue = queue
+        return getattr(self, self.EVENT_METHODS[algo])
+
+    def _run(self, events_method):
+        """用 update_cell 驱动事件生成器方法直到结束，没有回调时不产出事件；返回路径"""
+        update = self.update_cell
+        return run_events(events_method(emit=update is not None), update)
 
     def find_path_dfs(self):
-        """深度优先寻路"""
-        stack = [self.start]
-        visited = {self.start}
+        """深度优先寻路（见 iter_dfs）"""
+        return self._run(self.iter_dfs)
 
-        while stack:
-            cur_point = stack[-1]
-            if cur_point != self.start and cur_point != self.end:
-                self.update_cell(*cur_point, 'visited')
+    def find_path_bfs(self):
+        """广度优先寻路（见 iter_bfs）"""
+        return self._run(self.iter_bfs)
+
+    def find_path_dijkstra(self):
+        """Dijkstra算法寻路（见 iter_dijkstra）"""
+        return self._run(self.iter_dijkstra)
+
+    def find_path_gbfs(self):
+        """GBFS算法寻路（见 iter_gbfs）"""
+        return self._run(self.iter_gbfs)
 
-            for dir_ in self.DIRECTIONS:
-                next_point = dir_(*cur_point)
-                x, y = next_point
+    def find_path_astar(self):
+        """A*算法寻路（见 iter_astar）"""
+        return self._run(self.iter_astar)
 
-                if 0 <= x < self.width and 0 <= y < self.height and self.maze[y][x] == 0:
-                    if next_point not in visited:
-                        stack.append(next_point)
-                        visited.add(next_point)
+    def find_path_jps(self):
+        """跳点搜索（JPS）寻路（见 iter_jps）"""
+        return self._run(self.iter_jps)
 
-                        if next_point != self.start and next_point != self.end:
-                            self.update_cell(x, y, 'current')
+    def find_path_bidirectional_dfs(self):
+        """双向DFS寻路（见 iter_bidirectional_dfs）"""
+        return self._run(self.iter_bidirectional_dfs)
 
-                        if next_point == self.end:
-                            return stack
-                        break
+    def find_path_bidirectional_bfs(self):
+        """双向BFS寻路（见 iter_bidirectional_bfs）"""
+        return self._run(self.iter_bidirectional_bfs)
+
+    def find_path_bidirectional_astar(self):
+        """双向A*寻路（见 iter_bidirectional_astar）"""
+        return self._run(self.iter_bidirectional_astar)
+
+    def _record(self, expanded, pushes, peak_frontier):
+        """记录搜索统计"""
+        self.stats = {'expanded': expanded, 'pushes': pushes, 'peak_frontier': peak_frontier}
+
+    def _to_path(self, indices):
+        """扁平下标序列 -> 坐标路径"""
+        w = self.maze.width
+        return [(i % w, i // w) for i in indices]
+
+    def _trace_back(self, came_from, end):
+        """沿前驱数组回溯路径"""
+        path = []
+        cur = end
+        while cur != -1:
+            path.append(cur)
+            cur = came_from[cur]
+        path.reverse()
+        return self._to_path(path)
+
+    def iter_dfs(self, emit=True):
+        """深度优先寻路"""
+        grid = self.maze
+        w = grid.width
+        start = grid.index(*self.start)
+        end = grid.index(*self.end)
+
+        expanded = pushes = peak = 0
+
+        stack = [start]
+        visited = bytearray(grid.size)
+        visited[start] = 1
+
+        while stack:
+            cur_point = stack[-1]
+            expanded += 1
+            if len(stack) > peak:
+                peak = len(stack)
+            if emit and cur_point != start and cur_point != end:
+                yield cur_point % w, cur_point // w, 'visited'
+
+            for next_point in grid.neighbors(cur_point):
+                if not visited[next_point]:
+                    stack.append(next_point)
+                    visited[next_point] = 1
+                    pushes += 1
+
+                    if emit and next_point != start and next_point != end:
+                        yield next_point % w, next_point // w, 'current'
+
+                    if next_point == end:
+                        self._record(expanded, pushes, max(peak, len(stack)))
+                        return self._to_path(stack)
+                    break
             else:
                 stack.pop()
-                if cur_point != self.start and cur_point != self.end:
-                    self.update_cell(*cur_point, 'path')
+                if emit and cur_point != start and cur_point != end:
+                    yield cur_point % w, cur_point // w, 'path'
 
+        self._record(expanded, pushes, peak)
         return None
 
-    def find_path_bfs(self):
+    def iter_bfs(self, emit=True):
         """广度优先寻路"""
-        queue = deque([self.start])
-        came_from = {self.start: None}
-        visited = {self.start}
+        grid = self.maze
+        w = grid.width
+        start = grid.index(*self.start)
+        end = grid.index(*self.end)
+
+        expanded = pushes = peak = 0
+
+        queue = deque([start])
+        came_from = array('i', [-1]) * grid.size
+        visited = bytearray(grid.size)
+        visited[start] = 1
 
         while queue:
+            if len(queue) > peak:
+                peak = len(queue)
             cur_point = queue.popleft()
 
-            if cur_point == self.end:
+            if cur_point == end:
                 # 回溯路径
-                path = []
-                cur = self.end
-                while cur is not None:
-                    path.append(cur)
-                    cur = came_from[cur]
-                path.reverse()
-                return path
-
-            if cur_point != self.start and cur_point != self.end:
-                self.update_cell(*cur_point, 'current')
+                self._record(expanded, pushes, peak)
+                return self._trace_back(came_from, end)
 
-            for dir_ in self.DIRECTIONS:
-                next_point = dir_(*cur_point)
-                x, y = next_point
+            expanded += 1
+            if emit and cur_point != start:
+                yield cur_point % w, cur_point // w, 'current'
 
-                if 0 <= x < self.width and 0 <= y < self.height and self.maze[y][x] == 0 and next_point not in visited:
+            for next_point in grid.neighbors(cur_point):
+                if not visited[next_point]:
                     queue.append(next_point)
                     came_from[next_point] = cur_point
-                    visited.add(next_point)
-
-                    if next_point != self.start and next_point != self.end:
-                        self.update_cell(x, y, 'frontier')
+                    visited[next_point] = 1
+                    pushes += 1
 
-            if cur_point != self.start and cur_point != self.end:
-                self.update_cell(*cur_point, 'visited')
+                    if emit and next_point != end:
+                        yield next_point % w, next_point // w, 'frontier'
+            if emit and cur_point != start:
+                yield cur_point % w, cur_point // w, 'visited'
 
+        self._record(expanded, pushes, peak)
         return None
 
-    def find_path_dijkstra(self):
+    def iter_dijkstra(self, emit=True):
         """Dijkstra算法寻路"""
-        open_set = []
-        heapq.heappush(open_set, (0, self.start))
+        grid = self.maze
+        w = grid.width
+        start = grid.index(*self.start)
+        end = grid.index(*self.end)
 
-        came_from = {self.start: None}
-        g_score = {self.start: 0}
+        expanded = pushes = peak = 0
 
-        while open_set:
-            current_f, current = heapq.heappop(open_set)
+        open_set = QUEUES[self.queue]()
+        open_set.push(0, start)
 
-            if current == self.end:
-                # 回溯路径
-                path = []
-                cur = self.end
-                while cur is not None:
-                    path.append(cur)
-                    cur = came_from[cur]
-                path.reverse()
-                return path
-
-            if current != self.start and current != self.end:
-                self.update_cell(*current, 'current')
-
-            for dir_ in self.DIRECTIONS:
-                neighbor = dir_(*current)
-                x, y = neighbor
-
-                if 0 <= x < self.width and 0 <= y < self.height and self.maze[y][x] == 0:
-                    new_cost = g_score[current] + 1
-                    if neighbor not in g_score or new_cost < g_score[neighbor]:
-                        came_from[neighbor] = current
-                        g_score[neighbor] = new_cost
-                        heapq.heappush(open_set, (new_cost, neighbor))
-
-                        if neighbor != self.start and neighbor != self.end:
-                            self.update_cell(x, y, 'frontier')
-            if current != self.start and current != self.end:
-                self.update_cell(*current, 'visited')
+        came_from = array('i', [-1]) * grid.size
+        g_score = array('i', [-1]) * grid.size
+        g_score[start] = 0
+        closed = bytearray(grid.size)
 
+        while open_set:
+            if len(open_set) > peak:
+                peak = len(open_set)
+            current_f, current = open_set.pop()
+            if closed[current]:  # 二叉堆中的过期条目
+                continue
+            closed[current] = 1
+
+            if current == end:
+                # 回溯路径
+                self._record(expanded, pushes, peak)
+                return self._trace_back(came_from, end)
+
+            expanded += 1
+            if emit and current != start:
+                yield current % w, current // w, 'current'
+
+            new_cost = g_score[current] + 1
+            for neighbor in grid.neighbors(current):
+                old_cost = g_score[neighbor]
+                if old_cost == -1 or new_cost < old_cost:
+                    came_from[neighbor] = current
+                    g_score[neighbor] = new_cost
+                    if old_cost == -1:
+                        open_set.push(new_cost, neighbor)
+                    else:
+                        open_set.decrease(neighbor, old_cost, new_cost)
+                    pushes += 1
+
+                    if emit and neighbor != start and neighbor != end:
+                        yield neighbor % w, neighbor // w, 'frontier'
+            if emit and current != start:
+                yield current % w, current // w, 'visited'
+
+        self._record(expanded, pushes, peak)
         return None
 
-    def find_path_gbfs(self):
+    def iter_gbfs(self, emit=True):
         """GBFS算法寻路"""
-        def heuristic(a, b):
-            """曼哈顿距离"""
-            return abs(a[0] - b[0]) + abs(a[1] - b[1])
+        grid = self.maze
+        w = grid.width
+        start = grid.index(*self.start)
+        end = grid.index(*self.end)
+        end_x, end_y = self.end
 
-        open_set = []
-        heapq.heappush(open_set, (heuristic(self.start, self.end), self.start))
+        expanded = pushes = peak = 0
 
-        came_from = {self.start: None}
-        visited = {self.start}
+        open_set = QUEUES[self.queue]()
+        open_set.push(0, start)
+
+        came_from = array('i', [-1]) * grid.size
+        visited = bytearray(grid.size)
+        visited[start] = 1
 
         while open_set:
-            current_f, current = heapq.heappop(open_set)
+            if len(open_set) > peak:
+                peak = len(open_set)
+            current_f, current = open_set.pop()
 
-            if current == self.end:
+            if current == end:
                 # 回溯路径
-                path = []
-                cur = self.end
-                while cur is not None:
-                    path.append(cur)
-                    cur = came_from[cur]
-                path.reverse()
-                return path
+                self._record(expanded, pushes, peak)
+                return self._trace_back(came_from, end)
+
+            expanded += 1
+            if emit and current != start:
+                yield current % w, current // w, 'current'
+
+            for neighbor in grid.neighbors(current):
+                if not visited[neighbor]:
+                    came_from[neighbor] = current
+                    visited[neighbor] = 1
+                    y, x = divmod(neighbor, w)
+                    # 曼哈顿距离
+                    priority = abs(x - end_x) + abs(y - end_y)
+                    open_set.push(priority, neighbor)
+                    pushes += 1
+
+                    if emit and neighbor != end:
+                        yield x, y, 'frontier'
+            if emit and current != start:
+                yield current % w, current // w, 'visited'
+
+        self._record(expanded, pushes, peak)
+        return None
 
-            if current != self.start and current != self.end:
-                self.update_cell(*current, 'current')
+    def iter_astar(self, emit=True):
+        """A*算法寻路"""
+        grid = self.maze
+        w = grid.width
+        start = grid.index(*self.start)
+        end = grid.index(*self.end)
+        end_x, end_y = self.end
 
-            for dir_ in self.DIRECTIONS:
-                neighbor = dir_(*current)
-                x, y = neighbor
+        expanded = pushes = peak = 0
 
-                if 0 <= x < self.width and 0 <= y < self.height and self.maze[y][x] == 0:
-                    if neighbor not in visited:
-                        came_from[neighbor] = current
-                        visited.add(neighbor)
-                        priority = heuristic(neighbor, self.end)
-                        heapq.heappush(open_set, (priority, neighbor))
+        open_set = QUEUES[self.queue]()
+        open_set.push(0, start)
 
-                        if neighbor != self.start and neighbor != self.end:
-                            self.update_cell(x, y, 'frontier')
-            if current != self.start and current != self.end:
-                self.update_cell(*current, 'visited')
+        came_from = array('i', [-1]) * grid.size
+        g_score = array('i', [-1]) * grid.size
+        g_score[start] = 0
+        closed = bytearray(grid.size)
 
+        while open_set:
+            if len(open_set) > peak:
+                peak = len(open_set)
+            current_f, current = open_set.pop()
+            if closed[current]:  # 二叉堆中的过期条目
+                continue
+            closed[current] = 1
+
+            if current == end:
+                # 回溯路径
+                self._record(expanded, pushes, peak)
+                return self._trace_back(came_from, end)
+
+            expanded += 1
+            if emit and current != start:
+                yield current % w, current // w, 'current'
+
+            new_cost = g_score[current] + 1
+            for neighbor in grid.neighbors(current):
+                old_cost = g_score[neighbor]
+                if old_cost == -1 or new_cost < old_cost:
+                    came_from[neighbor] = current
+                    g_score[neighbor] = new_cost
+                    y, x = divmod(neighbor, w)
+                    # 曼哈顿距离
+                    priority = new_cost + abs(x - end_x) + abs(y - end_y)
+                    if old_cost == -1:
+                        open_set.push(priority, neighbor)
+                    else:
+                        open_set.decrease(neighbor, priority + old_cost - new_cost, priority)
+                    pushes += 1
+
+                    if emit and neighbor != start and neighbor != end:
+                        yield x, y, 'frontier'
+            if emit and current != start:
+                yield current % w, current // w, 'visited'
+
+        self._record(expanded, pushes, peak)
         return None
 
-    def find_path_astar(self):
-        """A*算法寻路"""
-        def heuristic(a, b):
-            """曼哈顿距离"""
-            return abs(a[0] - b[0]) + abs(a[1] - b[1])
+    def iter_jps(self, emit=True):
+        """跳点搜索（JPS）寻路"""
+        grid = self.maze
+        cells = grid.cells
+        w, h = grid.width, grid.height
+        start = grid.index(*self.start)
+        end = grid.index(*self.end)
+        end_x, end_y = self.end
+
+        expanded = pushes = peak = 0
+
+        # 水平跳跃的结果按 (起始格点, 方向) 缓存，-2表示未计算。
+        # 从扫描途经的任意一格出发，结果都与从扫描起点出发相同，一次扫描填满途经的所有起点；
+        # 竖直跳跃每一步都要向左右各做一次水平探测，不缓存时开阔区域的代价接近平方级
+        jump_cache = {1: array('i', [-2]) * grid.size, -1: array('i', [-2]) * grid.size}
+
+        def jump_horizontal(x, y, dx):
+            """从(x, y)沿水平方向dx跳跃，返回跳点下标，无跳点返回-1"""
+            first = i = y * w + x
+            # 紧邻墙壁（走廊中的大多数探测）直接返回，不查缓存
+            if not 0 <= x + dx < w or cells[i + dx]:
+                return -1
+            cache = jump_cache[dx]
+            while True:
+                if cache[i] != -2:
+                    result = cache[i]
+                    break
+                x += dx
+                if not 0 <= x < w:
+                    result = -1
+                    break
+                i += dx
+                if cells[i]:
+                    result = -1
+                    break
+                if i == end:
+                    result = i
+                    break
+                # 强迫邻居：上/下方可通行，而来时方向的上/下方是墙
+                if y > 0 and not cells[i - w] and cells[i - w - dx]:
+                    result = i
+                    break
+                if y < h - 1 and not cells[i + w] and cells[i + w - dx]:
+                    result = i
+                    break
+            # 此次扫描的起点 first, first + dx, ..., i - dx 结果相同；
+            # 只走了一步的扫描（迷宫走廊中最常见）重新计算与查表一样快，不写入缓存
+            count = (i - first) * dx
+            if count > 1:
+                cache[first:i:dx] = array('i', [result]) * count
+            return result
+
+        def jump_vertical(x, y, dy):
+            """从(x, y)沿竖直方向dy跳跃，返回跳点下标，无跳点返回-1"""
+            step = dy * w
+            while True:
+                y += dy
+                if not 0 <= y < h:
+                    return -1
+                i = y * w + x
+                if cells[i]:
+                    return -1
+                if i == end:
+                    return i
+                # 强迫邻居：左/右方可通行，而来时方向的左/右方是墙
+                left_open = x > 0 and not cells[i - 1]
+                right_open = x < w - 1 and not cells[i + 1]
+                if left_open and cells[i - 1 - step]:
+                    return i
+                if right_open and cells[i + 1 - step]:
+                    return i
+                # 竖直移动时，若水平方向上能找到跳点，当前格点也是跳点（紧邻墙壁的一侧不必探测）
+                if right_open and jump_horizontal(x, y, 1) != -1 or left_open and jump_horizontal(x, y, -1) != -1:
+                    return i
 
         open_set = []
-        heapq.heappush(open_set, (0, self.start))
+        heapq.heappush(open_set, (0, start))
 
-        came_from = {self.start: None}
-        g_score = {self.start: 0}
+        came_from = array('i', [-1]) * grid.size
+        g_score = array('i', [-1]) * grid.size
+        g_score[start] = 0
+        closed = bytearray(grid.size)
 
         while open_set:
+            if len(open_set) > peak:
+                peak = len(open_set)
             current_f, current = heapq.heappop(open_set)
-
-            if current == self.end:
-                # 回溯路径
-                path = []
-                cur = self.end
-                while cur is not None:
-                    path.append(cur)
+            if closed[current]:
+                continue
+            closed[current] = 1
+
+            if current == end:
+                # 回溯跳点，并补全跳点之间的直线段
+                jump_points = []
+                cur = end
+                while cur != -1:
+                    jump_points.append(cur)
                     cur = came_from[cur]
-                path.reverse()
-                return path
-
-            if current != self.start and current != self.end:
-                self.update_cell(*current, 'current')
-
-            for dir_ in self.DIRECTIONS:
-                neighbor = dir_(*current)
-                x, y = neighbor
-
-                if 0 <= x < self.width and 0 <= y < self.height and self.maze[y][x] == 0:
-                    new_cost = g_score[current] + 1
-                    if neighbor not in g_score or new_cost < g_score[neighbor]:
-                        came_from[neighbor] = current
-                        g_score[neighbor] = new_cost
-                        priority = new_cost + heuristic(neighbor, self.end)
-                        heapq.heappush(open_set, (priority, neighbor))
-
-                        if neighbor != self.start and neighbor != self.end:
-                            self.update_cell(x, y, 'frontier')
-            if current != self.start and current != self.end:
-                self.update_cell(*current, 'visited')
-
+                jump_points.reverse()
+
+                path = [start]
+                for a, b in zip(jump_points, jump_points[1:]):
+                    step = (1 if b > a else -1) * (1 if a // w == b // w else w)
+                    path.extend(range(a + step, b + step, step))
+                self._record(expanded, pushes, peak)
+                return self._to_path(path)
+
+            expanded += 1
+            y, x = divmod(current, w)
+            if emit and current != start:
+                yield x, y, 'current'
+
+            # 按到达方向裁剪需要跳跃的方向
+            parent = came_from[current]
+            if parent == -1:
+                directions = ((-1, 0), (0, -1), (1, 0), (0, 1))
+            else:
+                py, px = divmod(parent, w)
+                dx = (x > px) - (x < px)
+                dy = (y > py) - (y < py)
+                if dx:
+                    directions = ((0, -1), (0, 1), (dx, 0))
+                else:
+                    directions = ((-1, 0), (1, 0), (0, dy))
+
+            for dx, dy in directions:
+                if dx:
+                    jump_point = jump_horizontal(x, y, dx)
+                else:
+                    jump_point = jump_vertical(x, y, dy)
+                if jump_point == -1 or closed[jump_point]:
+                    continue
+
+                jy, jx = divmod(jump_point, w)
+                new_cost = g_score[current] + abs(jx - x) + abs(jy - y)
+                if g_score[jump_point] == -1 or new_cost < g_score[jump_point]:
+                    came_from[jump_point] = current
+                    g_score[jump_point] = new_cost
+                    # 曼哈顿距离
+                    priority = new_cost + abs(jx - end_x) + abs(jy - end_y)
+                    heapq.heappush(open_set, (priority, jump_point))
+                    pushes += 1
+
+                    if emit and jump_point != end:
+                        yield jx, jy, 'frontier'
+            if emit and current != start:
+                yield x, y, 'visited'
+
+        self._record(expanded, pushes, peak)
         return None
 
-    def find_path_bidirectional_dfs(self):
+    def iter_bidirectional_dfs(self, emit=True):
         """双向DFS寻路"""
+        grid = self.maze
+        start = grid.index(*self.start)
+        end = grid.index(*self.end)
+
         # 初始化两个方向的栈和访问记录
         # 前向搜索(从起点开始)
-        stack_forward = [self.start]
-        visited_forward = {self.start}
-        parent_forward = {self.start: None}  # 记录前驱节点
+        stack_forward = [start]
+        visited_forward = bytearray(grid.size)
+        visited_forward[start] = 1
+        parent_forward = array('i', [-1]) * grid.size  # 记录前驱节点
 
         # 后向搜索(从终点开始)
-        stack_backward = [self.end]
-        visited_backward = {self.end}
-        parent_backward = {self.end: None}  # 记录后继节点
+        stack_backward = [end]
+        visited_backward = bytearray(grid.size)
+        visited_backward[end] = 1
+        parent_backward = array('i', [-1]) * grid.size  # 记录后继节点
 
         # 相遇点
         meeting_point = None
+        self._record(0, 0, 0)
 
         # 开始双向搜索
-        while stack_forward and stack_backward and not meeting_point:
+        while stack_forward and stack_backward and meeting_point is None:
+            frontier = len(stack_forward) + len(stack_backward)
+            if frontier > self.stats['peak_frontier']:
+                self.stats['peak_frontier'] = frontier
             # 交替扩展，每次扩展一个节点
-            meeting_point = self._dfs_step(stack_forward, visited_forward, visited_backward, 
-                                        parent_forward, self.DIRECTIONS, is_forward=True)
+            meeting_point = yield from self._dfs_step(stack_forward, visited_forward, visited_backward,
+                                                      parent_forward, is_forward=True, emit=emit)
 
-            if not meeting_point:
-                meeting_point = self._dfs_step(stack_backward, visited_backward, visited_forward,
-                                            parent_backward, self.DIRECTIONS, is_forward=False)
+            if meeting_point is None:
+                meeting_point = yield from self._dfs_step(stack_backward, visited_backward, visited_forward,
+                                                          parent_backward, is_forward=False, emit=emit)
 
         # 构建完整路径
-        if meeting_point:
+        if meeting_point is not None:
             return self._construct_bidirectional_path(meeting_point, parent_forward, parent_backward)
 
         return None
 
-    def _dfs_step(self, stack, visited_self, visited_other, parent, directions, is_forward):
+    def _dfs_step(self, stack, visited_self, visited_other, parent, is_forward, emit=True):
         """
         DFS单步扩展
-        
+
         参数:
             stack: 当前方向的栈
-            visited_self: 当前方向的访问集合
-            visited_other: 相反方向的访问集合
-            parent: 父节点映射
-            directions: 方向向量
+            visited_self: 当前方向的访问标记
+            visited_other: 相反方向的访问标记
+            parent: 父节点数组
             is_forward: 是否为前向搜索
+            emit: 是否产出单元格状态事件
+
+        作为生成器使用（yield from），返回值为相遇点，未相遇时为None
         """
         if not stack:
             return None
 
+        grid = self.maze
+        w = grid.width
+        start = grid.index(*self.start)
+        end = grid.index(*self.end)
+
         current = stack[-1]  # 查看栈顶元素
+        self.stats['expanded'] += 1
 
         # 可视化当前节点
-        if current != self.start and current != self.end:
-            self.update_cell(*current, 'visited')
+        if emit and current != start and current != end:
+            yield current % w, current // w, 'visited'
 
         # 尝试找到未访问的邻居
-        for dir_ in directions:
-            nx, ny = dir_(*current)
-            neighbor = (nx, ny)
-
-            # 检查边界和墙壁
-            if (0 <= nx < self.width and 0 <= ny < self.height and 
-                self.maze[ny][nx] == 0 and neighbor not in visited_self):
+        for neighbor in grid.neighbors(current):
+            if not visited_self[neighbor]:
 
                 # 标记为已访问
-                visited_self.add(neighbor)
+                visited_self[neighbor] = 1
                 parent[neighbor] = current
                 stack.append(neighbor)
+                self.stats['pushes'] += 1
 
-                if neighbor != self.start and neighbor != self.end:
-                    self.update_cell(nx, ny, 'current')
+                if emit and neighbor != start and neighbor != end:
+                    yield neighbor % w, neighbor // w, 'current'
 
                 # 检查是否与另一方向相遇
-                if neighbor in visited_other:
+                if visited_other[neighbor]:
                     return neighbor
 
                 break
         else:
             # 如果没有未访问的邻居，回溯
             stack.pop()
-            if current != self.start and current != self.end:
-                self.update_cell(*current, 'path')
+            if emit and current != start and current != end:
+                yield current % w, current // w, 'path'
 
         return None
 
-    def find_path_bidirectional_bfs(self):
+    def iter_bidirectional_bfs(self, emit=True):
         """双向BFS寻路"""
+        grid = self.maze
+        start = grid.index(*self.start)
+        end = grid.index(*self.end)
+
         # 初始化两个方向的队列和访问记录
         # 前向搜索(从起点开始)
-        queue_forward = deque([self.start])
-        visited_forward = {self.start}
-        parent_forward = {self.start: None}  # 记录前驱节点
+        queue_forward = deque([start])
+        visited_forward = bytearray(grid.size)
+        visited_forward[start] = 1
+        parent_forward = array('i', [-1]) * grid.size  # 记录前驱节点
 
         # 后向搜索(从终点开始)
-        queue_backward = deque([self.end])
-        visited_backward = {self.end}
-        parent_backward = {self.end: None}  # 记录后继节点
+        queue_backward = deque([end])
+        visited_backward = bytearray(grid.size)
+        visited_backward[end] = 1
+        parent_backward = array('i', [-1]) * grid.size  # 记录后继节点
 
         # 相遇点
         meeting_point = None
+        self._record(0, 0, 0)
 
         # 开始双向搜索
-        while queue_forward and queue_backward and not meeting_point:
+        while queue_forward and queue_backward and meeting_point is None:
+            frontier = len(queue_forward) + len(queue_backward)
+            if frontier > self.stats['peak_frontier']:
+                self.stats['peak_frontier'] = frontier
             # 交替扩展,每次扩展一层
-            meeting_point = self._bfs_layer(queue_forward, visited_forward, visited_backward, 
-                                        parent_forward, self.DIRECTIONS, is_forward=True)
+            meeting_point = yield from self._bfs_layer(queue_forward, visited_forward, visited_backward,
+                                                       parent_forward, is_forward=True, emit=emit)
 
-            if not meeting_point:
-                meeting_point = self._bfs_layer(queue_backward, visited_backward, visited_forward,
-                                            parent_backward, self.DIRECTIONS, is_forward=False)
+            if meeting_point is None:
+                meeting_point = yield from self._bfs_layer(queue_backward, visited_backward, visited_forward,
+                                                           parent_backward, is_forward=False, emit=emit)
 
         # 构建完整路径
-        if meeting_point:
+        if meeting_point is not None:
             return self._construct_bidirectional_path(meeting_point, parent_forward, parent_backward)
 
         return None
 
-    def _bfs_layer(self, queue, visited_self, visited_other, parent, directions, is_forward):
+    def _bfs_layer(self, queue, visited_self, visited_other, parent, is_forward, emit=True):
         """
         扩展一层BFS
 
         参数:
             queue: 当前方向的队列
-            visited_self: 当前方向的访问集合
-            visited_other: 相反方向的访问集合
-            parent: 父节点映射
-            directions: 方向向量
+            visited_self: 当前方向的访问标记
+            visited_other: 相反方向的访问标记
+            parent: 父节点数组
             is_forward: 是否为前向搜索
+            emit: 是否产出单元格状态事件
+
+        作为生成器使用（yield from），返回值为相遇点，未相遇时为None
         """
+        grid = self.maze
+        w = grid.width
+        start = grid.index(*self.start)
+        end = grid.index(*self.end)
+
+        stats = self.stats
+
         # 记录当前层的节点数
         layer_size = len(queue)
 
         for _ in range(layer_size):
             current = queue.popleft()
+            stats['expanded'] += 1
 
-            if current != self.start and current != self.end:
-                self.update_cell(*current, 'current')
+            if emit and current != start and current != end:
+                yield current % w, current // w, 'current'
 
             # 探索四个方向
-            for dir_ in directions:
-                nx, ny = dir_(*current)
-                neighbor = (nx, ny)
-
-                # 检查边界和墙壁
-                if (0 <= nx < self.width and 0 <= ny < self.height and 
-                    self.maze[ny][nx] == 0 and neighbor not in visited_self):
+            for neighbor in grid.neighbors(current):
+                if not visited_self[neighbor]:
 
                     # 标记为已访问
-                    visited_self.add(neighbor)
+                    visited_self[neighbor] = 1
                     parent[neighbor] = current
                     queue.append(neighbor)
+                    stats['pushes'] += 1
 
-                    if neighbor != self.start and neighbor != self.end:
-                        self.update_cell(nx, ny, 'frontier')
+                    if emit and neighbor != start and neighbor != end:
+                        yield neighbor % w, neighbor // w, 'frontier'
 
                     # 检查是否与另一方向相遇
-                    if neighbor in visited_other:
+                    if visited_other[neighbor]:
                         return neighbor
 
-            if current != self.start and current != self.end:
-                self.update_cell(*current, 'visited')
+            if emit and current != start and current != end:
+                yield current % w, current // w, 'visited'
 
         return None
 
+    def iter_bidirectional_astar(self, emit=True):
+        """
+        双向A*寻路
+
+        两个方向的启发都由曼哈顿距离构成（front-to-end）：h_end 为到终点的距离，h_start 为到起点的距离。
+        直接各用一个启发时两侧的优先级互不相容，只能用很弱的停止条件，往往比单向A*扩展得更多；
+        这里改用平均势函数：前向优先级 2g + h_end - h_start，后向优先级 2g + h_start - h_end（均乘2以保持整数）。
+        它们对应同一组非负的约化边权，相当于约化图上的双向Dijkstra：
+        两侧都到达过的格点给出候选路径，记录最短长度 best，
+        当两侧堆顶优先级之和 >= 2 * best 时不存在更短的路径，可以停止，返回的路径是最短路径。
+        """
+        grid = self.maze
+        w = grid.width
+        start = grid.index(*self.start)
+        end = grid.index(*self.end)
+        start_x, start_y = self.start
+        end_x, end_y = self.end
+
+        expanded = pushes = peak = 0
+
+        # 前向搜索(从起点开始)
+        open_forward = [(0, start)]
+        g_forward = array('i', [-1]) * grid.size
+        g_forward[start] = 0
+        closed_forward = bytearray(grid.size)
+        parent_forward = array('i', [-1]) * grid.size
+
+        # 后向搜索(从终点开始)
+        open_backward = [(0, end)]
+        g_backward = array('i', [-1]) * grid.size
+        g_backward[end] = 0
+        closed_backward = bytearray(grid.size)
+        parent_backward = array('i', [-1]) * grid.size
+
+        best = 0 if start == end else -1
+        meeting_point = start if start == end else None
+
+        while open_forward and open_backward:
+            frontier = len(open_forward) + len(open_backward)
+            if frontier > peak:
+                peak = frontier
+            if best != -1 and open_forward[0][0] + open_backward[0][0] >= 2 * best:
+                break
+
+            # 扩展开放列表较小的一侧
+            if len(open_forward) <= len(open_backward):
+                open_set, g_self, g_other = open_forward, g_forward, g_backward
+                closed, parent, sign = closed_forward, parent_forward, 1
+            else:
+                open_set, g_self, g_other = open_backward, g_backward, g_forward
+                closed, parent, sign = closed_backward, parent_backward, -1
+
+            _, current = heapq.heappop(open_set)
+            if closed[current]:
+                continue
+            closed[current] = 1
+            expanded += 1
+            if emit and current != start and current != end:
+                yield current % w, current // w, 'current'
+
+            new_cost = g_self[current] + 1
+            for neighbor in grid.neighbors(current):
+                if g_self[neighbor] == -1 or new_cost < g_self[neighbor]:
+                    parent[neighbor] = current
+                    g_self[neighbor] = new_cost
+                    y, x = divmod(neighbor, w)
+                    potential = abs(x - end_x) + abs(y - end_y) - abs(x - start_x) - abs(y - start_y)
+                    heapq.heappush(open_set, (2 * new_cost + sign * potential, neighbor))
+                    pushes += 1
+
+                    if emit and neighbor != start and neighbor != end:
+                        yield x, y, 'frontier'
+
+                    # 另一方向也到达过 -> 候选路径
+                    if g_other[neighbor] != -1:
+                        total = new_cost + g_other[neighbor]
+                        if best == -1 or total < best:
+                            best = total
+                            meeting_point = neighbor
+            if emit and current != start and current != end:
+                yield current % w, current // w, 'visited'
+
+        self._record(expanded, pushes, peak)
+        if meeting_point is None:
+            return None
+        return self._construct_bidirectional_path(meeting_point, parent_forward, parent_backward)
+
     def _construct_bidirectional_path(self, meeting_point, parent_forward, parent_backward):
         """
         构建双向搜索的完整路径
@@ -393,22 +839,17 @@ class PathFinder:
         # 从起点到相遇点的路径(正向)
         path_forward = []
         current = meeting_point
-        while current is not None:
+        while current != -1:
             path_forward.append(current)
-            current = parent_forward.get(current)
+            current = parent_forward[current]
         path_forward.reverse()  # 反转得到从起点到相遇点
-        
+
         # 从相遇点到终点的路径(反向,不包括相遇点)
         path_backward = []
-        current = parent_backward.get(meeting_point)
-        while current is not None:
+        current = parent_backward[meeting_point]
+        while current != -1:
             path_backward.append(current)
-            current = parent_backward.get(current)
-        
+            current = parent_backward[current]
+
         # 合并路径
-        full_path = path_forward + path_backward
-        
-        # 验证路径(可选)
-        # print(f"双向BFS找到路径长度: {len(full_path)}")
-        
-        return full_path
+        return self._to_path(path_forward + path_backward)
@@ -0,0 +1,144 @@
+"""
+寻路用的优先队列：二叉堆、桶队列（Dial）、基数堆
+
+三者接口相同：
+    push(priority, item)              入队
+    decrease(item, old, new)          把item的优先级从old降为new
+    pop() -> (priority, item)         取出优先级最小的条目
+    len(queue)                        队列中的条目数
+
+网格上的优先级都是不大的非负整数，桶队列与基数堆的入队为O(1)，
+并且支持原地降低优先级，不会像二叉堆那样为同一格点留下重复条目。
+"""
+import heapq
+
+
+class HeapQueue:
+    """二叉堆（heapq）。降低优先级时压入新条目，旧条目由调用方在出队时跳过"""
+
+    __slots__ = ('_heap',)
+
+    def __init__(self):
+        self._heap = []
+
+    def __len__(self):
+        return len(self._heap)
+
+    def push(self, priority, item):
+        heapq.heappush(self._heap, (priority, item))
+
+    def decrease(self, item, old, new):
+        heapq.heappush(self._heap, (new, item))
+
+    def pop(self):
+        return heapq.heappop(self._heap)
+
+
+class BucketQueue:
+    """
+    桶队列（Dial算法）：优先级为p的条目放在p号桶中，游标指向可能非空的最小桶
+
+    出队时游标只需向前扫描；优先级低于游标的入队（如GBFS）会把游标移回去，因此不要求单调。
+    桶用dict存放（条目 -> None），降低优先级时从旧桶删除再放入新桶；同一桶内后进先出。
+    桶按优先级存放在dict中，空桶随即删除，Dijkstra扫过的大量距离值不会留下空桶。
+    """
+
+    __slots__ = ('_buckets', '_cursor', '_size')
+
+    def __init__(self):
+        self._buckets = {}
+        self._cursor = 0
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def push(self, priority, item):
+        bucket = self._buckets.get(priority)
+        if bucket is None:
+            bucket = self._buckets[priority] = {}
+        bucket[item] = None
+        if priority < self._cursor:
+            self._cursor = priority
+        self._size += 1
+
+    def decrease(self, item, old, new):
+        bucket = self._buckets.get(old)
+        if bucket is not None and item in bucket:
+            del bucket[item]
+            if not bucket:
+                del self._buckets[old]
+            self._size -= 1
+        self.push(new, item)
+
+    def pop(self):
+        buckets = self._buckets
+        cursor = self._cursor
+        while cursor not in buckets:
+            cursor += 1
+        self._cursor = cursor
+        bucket = buckets[cursor]
+        item, _ = bucket.popitem()
+        if not bucket:
+            del buckets[cursor]
+        self._size -= 1
+        return cursor, item
+
+
+class RadixHeap:
+    """
+    基数堆：要求出队的优先级单调不减（Dijkstra、一致启发下的A*）
+
+    优先级为k的条目放在第 (k ^ last).bit_length() 个桶中，last为上一次出队的优先级。
+    0号桶为空时，把第一个非空桶按新的最小值重新分配到更低的桶中；
+    每个条目最多被重新分配约 log2(最大优先级) 次。
+    条目总是位于按当前last计算出的桶中，因此降低优先级时可以直接定位并原地移动。
+    """
+
+    __slots__ = ('_buckets', '_last', '_size')
+
+    def __init__(self):
+        self._buckets = [{} for _ in range(33)]
+        self._last = 0
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def push(self, priority, item):
+        if priority < self._last:
+            raise ValueError("基数堆要求优先级单调不减")
+        self._buckets[(priority ^ self._last).bit_length()][item] = priority
+        self._size += 1
+
+    def decrease(self, item, old, new):
+        if old >= self._last:
+            bucket = self._buckets[(old ^ self._last).bit_length()]
+            if item in bucket:
+                del bucket[item]
+                self._size -= 1
+        self.push(new, item)
+
+    def pop(self):
+        buckets = self._buckets
+        if not buckets[0]:
+            i = 1
+            while not buckets[i]:
+                i += 1
+            bucket = buckets[i]
+            last = min(bucket.values())
+            self._last = last
+            for item, priority in bucket.items():
+                buckets[(priority ^ last).bit_length()][item] = priority
+            bucket.clear()
+        item, priority = buckets[0].popitem()
+        self._size -= 1
+        return priority, item
+
+
+# 队列名 -> 队列类
+QUEUES = {
+    "heap": HeapQueue,
+    "bucket": BucketQueue,
+    "radix": RadixHeap,
+}
@@ -0,0 +1,155 @@
+"""
+寻路结果缓存
+"""
+from collections import OrderedDict
+import hashlib
+import json
+import os
+import threading
+from maze_grid import as_grid
+
+
+def maze_digest(maze):
+    """迷宫内容哈希（包含尺寸），用作缓存键的一部分"""
+    grid = as_grid(maze)
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f"{grid.width},{grid.height},".encode('ascii'))
+    h.update(grid.cells)
+    return h.hexdigest()
+
+
+class SolutionCache:
+    """
+    以 (迷宫内容哈希, 起点, 终点, 算法) 为键的LRU寻路结果缓存
+
+    内存层按最近使用顺序淘汰；设置 cache_dir 后启用磁盘层，
+    每条结果保存为一个JSON文件，程序重启后依然可以命中。
+    磁盘层最多保留 disk_capacity 个文件，超出时删除最久未使用（修改时间最早）的文件。
+    可在多个线程中使用。
+    """
+
+    def __init__(self, capacity=256, cache_dir=None, disk_capacity=1024):
+        self.capacity = capacity
+        self.cache_dir = cache_dir
+        self.disk_capacity = disk_capacity
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(digest, start, end, algo):
+        return f"{digest}:{start[0]},{start[1]}:{end[0]},{end[1]}:{algo}"
+
+    def _disk_path(self, key):
+        name = hashlib.blake2b(key.encode('utf-8'), digest_size=16).hexdigest()
+        return os.path.join(self.cache_dir, name + '.json')
+
+    def get(self, digest, start, end, algo):
+        """
+        查询缓存
+
+        返回:
+            (path, stats) 元组，未命中返回None
+        """
+        key = self.make_key(digest, start, end, algo)
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                path, stats = self._entries[key]
+                return (list(path) if path is not None else None), dict(stats)
+
+        entry = self._load(key)
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._store(key, entry)
+        path, stats = entry
+        return (list(path) if path is not None else None), dict(stats)
+
+    def put(self, digest, start, end, algo, path, stats):
+        """写入缓存（路径为None表示无解，同样会被缓存）"""
+        key = self.make_key(digest, start, end, algo)
+        entry = (tuple(path) if path is not None else None, dict(stats))
+        with self._lock:
+            self._store(key, entry)
+        self._save(key, entry)
+
+    def clear(self):
+        """清空内存层与磁盘层"""
+        with self._lock:
+            self._entries.clear()
+        for file_path in self._disk_files():
+            try:
+                os.remove(file_path)
+            except OSError:
+                pass
+
+    def _store(self, key, entry):
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
+
+    def _load(self, key):
+        if not self.cache_dir:
+            return None
+        try:
+            with open(self._disk_path(key), 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if data.get('key') != key:  # 文件名哈希冲突
+            return None
+        try:
+            os.utime(self._disk_path(key))  # 命中时更新修改时间，淘汰时按最近使用顺序
+        except OSError:
+            pass
+        path = data['path']
+        return (tuple(tuple(p) for p in path) if path is not None else None), data['stats']
+
+    def _save(self, key, entry):
+        if not self.cache_dir:
+            return
+        path, stats = entry
+        data = {'key': key, 'path': [list(p) for p in path] if path is not None else None, 'stats': stats}
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            file_path = self._disk_path(key)
+            tmp_path = f"{file_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, separators=(',', ':'))
+            os.replace(tmp_path, file_path)
+        except OSError:
+            pass  # 磁盘层只是加速手段，写入失败时忽略
+        self._evict_disk()
+
+    def _disk_files(self):
+        """磁盘层的所有缓存文件"""
+        if not self.cache_dir:
+            return []
+        try:
+            names = os.listdir(self.cache_dir)
+        except OSError:
+            return []
+        return [os.path.join(self.cache_dir, name) for name in names if name.endswith('.json')]
+
+    def _evict_disk(self):
+        """磁盘层文件数超过 disk_capacity 时删除修改时间最早的文件"""
+        files = self._disk_files()
+        if len(files) <= self.disk_capacity:
+            return
+        mtimes = {}
+        for file_path in files:
+            try:
+                mtimes[file_path] = os.stat(file_path).st_mtime_ns
+            except OSError:
+                pass  # 已被其他线程删除
+        for file_path in sorted(mtimes, key=mtimes.get)[:len(mtimes) - self.disk_capacity]:
+            try:
+                os.remove(file_path)
+            except OSError:
+                pass
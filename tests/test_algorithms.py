@@ -0,0 +1,218 @@
+"""
+生成、寻路、编码与结果缓存的测试（无界面运行）
+
+运行（在仓库根目录）:
+    python -m pytest -q
+    python -m unittest discover -s tests
+"""
+import io
+import os
+import random
+import tempfile
+import unittest
+from maze_grid import MazeGrid
+from maze_generator import MazeGenerator
+from path_finder import PathFinder
+from tree_index import TreeIndex
+from solution_cache import SolutionCache
+from algorithm_events import record_events
+from maze_codec import (encode_maze_to_base64, decode_base64_to_maze, encode_maze_to_seed, decode_seed_to_maze,
+                        decode_maze_code, parse_maze_seed, write_rows_as_base64)
+
+WIDTH, HEIGHT = 31, 21
+# 保证最短路径的寻路算法
+OPTIMAL_ALGORITHMS = ("BFS", "Dijkstra", "AStar", "D-BFS", "D-AStar", "JPS")
+
+
+def generate(algo, seed, width=WIDTH, height=HEIGHT, update_cell=None):
+    grid = MazeGrid.bordered(width, height)
+    MazeGenerator(grid, width, height, update_cell, seed=seed).generate(algo)
+    return grid
+
+
+def make_loopy_maze(seed=3):
+    """Prim迷宫上打通部分墙壁，得到有环路、有多条路径的迷宫"""
+    grid = generate("Prim", seed)
+    for i in range(0, grid.size, 7):
+        x, y = grid.coords(i)
+        if 0 < x < WIDTH - 1 and 0 < y < HEIGHT - 1:
+            grid.cells[i] = 0
+    return grid
+
+
+class GeneratorTest(unittest.TestCase):
+
+    def test_seeded_generation_is_deterministic(self):
+        for algo in MazeGenerator.ALGORITHMS:
+            with self.subTest(algo=algo):
+                self.assertEqual(generate(algo, 42).cells, generate(algo, 42).cells)
+
+    def test_generated_mazes_are_perfect(self):
+        for algo in MazeGenerator.ALGORITHMS:
+            with self.subTest(algo=algo):
+                TreeIndex(generate(algo, 7))  # 存在环路或不连通时抛出ValueError
+
+    def test_growing_tree_policies_are_perfect(self):
+        for policy in MazeGenerator.GROWING_TREE_POLICIES:
+            with self.subTest(policy=policy):
+                grid = MazeGrid.bordered(WIDTH, HEIGHT)
+                generator = MazeGenerator(grid, WIDTH, HEIGHT, seed=5)
+                generator.growing_tree_policy = policy
+                generator.generate("GrowingTree")
+                TreeIndex(grid)
+
+    def test_generate_matches_event_stream(self):
+        for algo in MazeGenerator.ALGORITHMS:
+            with self.subTest(algo=algo):
+                events = []
+                blocking = generate(algo, 11, update_cell=lambda x, y, state: events.append((x, y, state)))
+
+                grid = MazeGrid.bordered(WIDTH, HEIGHT)
+                streamed = list(MazeGenerator(grid, WIDTH, HEIGHT, seed=11).iter_events(algo))
+                self.assertEqual(streamed, events)
+                self.assertEqual(grid.cells, blocking.cells)
+                # 有无回调不影响结果
+                self.assertEqual(generate(algo, 11).cells, blocking.cells)
+
+    def test_algorithm_methods_block(self):
+        for algo, method in MazeGenerator.ALGORITHMS.items():
+            with self.subTest(algo=algo):
+                grid = MazeGrid.bordered(WIDTH, HEIGHT)
+                self.assertIsNone(getattr(MazeGenerator(grid, WIDTH, HEIGHT, seed=1), method)())
+                self.assertEqual(grid.cells, generate(algo, 1).cells)
+
+    def test_unknown_algorithm(self):
+        generator = MazeGenerator(MazeGrid.bordered(WIDTH, HEIGHT), WIDTH, HEIGHT)
+        with self.assertRaises(ValueError):
+            generator.generate("Nope")
+        with self.assertRaises(ValueError):
+            generator.iter_events("Nope")
+
+
+class PathFinderTest(unittest.TestCase):
+
+    def setUp(self):
+        self.grid = make_loopy_maze()
+        self.start, self.end = (1, 1), (WIDTH - 2, HEIGHT - 2)
+
+    def finder(self, update_cell=None):
+        return PathFinder(self.grid, WIDTH, HEIGHT, self.start, self.end, update_cell)
+
+    def cases(self):
+        for algo in PathFinder.ALGORITHMS:
+            queues = ("heap", "bucket", "radix") if algo in PathFinder.QUEUE_ALGORITHMS else ("heap",)
+            for queue in queues:
+                if not (algo == "GBFS" and queue == "radix"):
+                    yield algo, queue
+
+    def assert_valid_path(self, path):
+        self.assertEqual(path[0], self.start)
+        self.assertEqual(path[-1], self.end)
+        for (x1, y1), (x2, y2) in zip(path, path[1:]):
+            self.assertEqual(abs(x1 - x2) + abs(y1 - y2), 1)
+            self.assertEqual(self.grid.get(x2, y2), 0)
+
+    def test_solve_matches_event_stream(self):
+        for algo, queue in self.cases():
+            with self.subTest(algo=algo, queue=queue):
+                events = []
+                result = self.finder(lambda x, y, state: events.append((x, y, state))).solve(algo, queue)
+                streamed, streamed_result = record_events(self.finder().iter_events(algo, queue))
+                self.assertEqual(streamed, events)
+                self.assertEqual(streamed_result, result)
+                self.assertEqual(self.finder().solve(algo, queue), result)
+
+    def test_paths_are_valid_and_optimal(self):
+        shortest = len(self.finder().solve("BFS")[0])
+        for algo, queue in self.cases():
+            with self.subTest(algo=algo, queue=queue):
+                path, stats = self.finder().solve(algo, queue)
+                self.assert_valid_path(path)
+                self.assertGreater(stats['expanded'], 0)
+                if algo in OPTIMAL_ALGORITHMS:
+                    self.assertEqual(len(path), shortest)
+
+    def test_algorithm_methods_block(self):
+        for algo, method in PathFinder.ALGORITHMS.items():
+            with self.subTest(algo=algo):
+                path = getattr(self.finder(), method)()
+                self.assertEqual(path, self.finder().solve(algo)[0])
+
+    def test_unreachable(self):
+        self.grid.set(WIDTH - 3, HEIGHT - 2, 1)
+        self.grid.set(WIDTH - 2, HEIGHT - 3, 1)
+        for algo in PathFinder.ALGORITHMS:
+            with self.subTest(algo=algo):
+                self.assertIsNone(self.finder().solve(algo)[0])
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            self.finder().solve("Nope")
+        with self.assertRaises(ValueError):
+            self.finder().solve("AStar", queue="nope")
+        with self.assertRaises(ValueError):
+            self.finder().iter_events("GBFS", queue="radix")
+
+
+class CodecTest(unittest.TestCase):
+
+    def test_base64_round_trip(self):
+        for width, height in ((5, 5), (31, 21), (7, 3)):
+            with self.subTest(size=(width, height)):
+                grid = make_loopy_maze() if (width, height) == (WIDTH, HEIGHT) else generate("DFS", 0, width, height)
+                decoded, size = decode_base64_to_maze(encode_maze_to_base64(grid))
+                self.assertEqual(size, (width, height))
+                self.assertEqual(decoded.cells, grid.cells)
+
+    def test_streamed_encoding_matches(self):
+        rows = list(MazeGenerator.iter_eller_rows(WIDTH, HEIGHT, random.Random(2)))
+        out = io.StringIO()
+        write_rows_as_base64(rows, WIDTH, HEIGHT, out, chunk_rows=3)
+        self.assertEqual(out.getvalue(), encode_maze_to_base64(MazeGrid(WIDTH, HEIGHT, b''.join(rows))))
+
+    def test_seed_round_trip(self):
+        for algo in MazeGenerator.ALGORITHMS:
+            with self.subTest(algo=algo):
+                code = encode_maze_to_seed(algo, WIDTH, HEIGHT, 99)
+                self.assertEqual(parse_maze_seed(code.lower()), (algo, WIDTH, HEIGHT, 99))
+                decoded, size = decode_maze_code(code)
+                self.assertEqual(size, (WIDTH, HEIGHT))
+                self.assertEqual(decoded.cells, generate(algo, 99).cells)
+
+    def test_max_size(self):
+        grid = generate("DFS", 0)
+        self.assertEqual(decode_maze_code(encode_maze_to_base64(grid), max_size=WIDTH)[1], (WIDTH, HEIGHT))
+        with self.assertRaises(ValueError):
+            decode_maze_code(encode_maze_to_base64(grid), max_size=WIDTH - 2)
+        with self.assertRaises(ValueError):
+            decode_seed_to_maze("Recursive:100001x100001:1", max_size=1001)
+        with self.assertRaises(ValueError):
+            decode_maze_code("5,2000001,AAAA", max_size=1001)
+
+    def test_invalid_seed_codes(self):
+        for code in ("DFS:21x21", "Nope:21x21:1", "DFS:20x21:1", "DFS:1x1:1", "DFS:21:1"):
+            with self.subTest(code=code):
+                with self.assertRaises(ValueError):
+                    parse_maze_seed(code)
+
+
+class SolutionCacheTest(unittest.TestCase):
+
+    def test_disk_capacity_evicts_oldest(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache = SolutionCache(capacity=1, cache_dir=cache_dir, disk_capacity=3)
+            for i in range(5):
+                cache.put("digest", (1, 1), (i, i), "BFS", [(1, 1)], {'expanded': i})
+                file_path = cache._disk_path(cache.make_key("digest", (1, 1), (i, i), "BFS"))
+                os.utime(file_path, (i, i))
+            self.assertEqual(len(os.listdir(cache_dir)), 3)
+            self.assertIsNone(cache.get("digest", (1, 1), (1, 1), "BFS"))
+            self.assertEqual(cache.get("digest", (1, 1), (2, 2), "BFS"), ([(1, 1)], {'expanded': 2}))
+
+            cache.clear()
+            self.assertEqual(os.listdir(cache_dir), [])
+            self.assertIsNone(cache.get("digest", (1, 1), (3, 3), "BFS"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -70,6 +70,63 @@ ALGORITHM_INFO = {
    - 递归分割四个子空间
 
 特点：生成速度快，生成的迷宫结构规整，通常比较简单。"""
+        },
+        "eller": {
+            "title": "5. Eller算法",
+            "content": """核心思想：逐行生成，只记录当前行每个格点所属的集合，保证每个集合都能向下延伸，最后一行把所有集合连通。
+
+流程：
+1. 第一行的每个格点各自属于一个集合
+2. 对每一行：
+   - 随机打通相邻且不属于同一集合的格点之间的墙壁，合并集合
+   - 每个集合随机选择至少一个格点向下打通，被打通的格点在下一行沿用原集合
+   - 下一行中未被打通的格点各自属于新的集合
+3. 最后一行：打通所有相邻且不属于同一集合的格点，使迷宫连通
+
+特点：内存占用只与宽度有关，可以逐行输出任意高度的迷宫。"""
+        },
+        "binary_tree": {
+            "title": "6. 二叉树算法",
+            "content": """核心思想：每个格点独立地随机向上或向左打通一面墙，不需要记录任何访问状态。
+
+流程：
+1. 初始化迷宫，将所有内部行列坐标为偶数的格子设为墙壁
+2. 为每个格点生成一个随机比特（一次性整体生成）
+3. 对每个格点：
+   - 第一行只能向左打通，第一列只能向上打通（左上角格点不打通）
+   - 其余格点按随机比特向上或向左打通
+4. 安装NumPy时整体用数组运算打通墙壁
+
+特点：生成速度极快；第一行与第一列是贯通的长走廊，迷宫有明显的左上方向偏向。"""
+        },
+        "sidewinder": {
+            "title": "7. Sidewinder算法",
+            "content": """核心思想：逐行扫描，把相邻格点连成一段"行程"，行程结束时从中随机选一格向上打通。
+
+流程：
+1. 初始化迷宫，将所有内部行列坐标为偶数的格子设为墙壁
+2. 第一行全部向右打通
+3. 之后每一行从左到右：
+   - 随机决定继续向右打通（延长行程），或结束当前行程
+   - 结束行程时，在行程中随机选择一个格点向上打通，新的行程从下一格开始
+   - 每行最后一个格点总是结束行程
+4. 安装NumPy时整体用数组运算确定行程并打通墙壁
+
+特点：生成速度极快；第一行是贯通的长走廊，竖直方向上没有死路朝上的结构，偏向比二叉树小。"""
+        },
+        "growing_tree": {
+            "title": "8. 生长树算法",
+            "content": """核心思想：维护一个活动格点列表，按选择策略取出格点向外生长。DFS与Prim都是它的特例。
+
+流程：
+1. 初始化迷宫，将所有内部行列坐标为偶数的格子设为墙壁
+2. 随机选择起点加入活动列表
+3. 活动列表不为空：
+   - 按策略选择一个格点：最新（newest）、随机（random）、最早（oldest），或按比例混合最新与随机（mixed，默认各一半）
+   - 若它有未访问的相邻格点 → 随机打通其中一个，并把该格点加入列表
+   - 否则 → 从列表中移出（O(1)）
+
+特点：只用一个参数就能在DFS式的长走廊与Prim式的多岔路之间连续调节纹理。"""
         }
     },
 
@@ -186,6 +243,41 @@ ALGORITHM_INFO = {
 3. 构建完整路径（起点→相遇点→终点）
 
 特点：通常比单向bfs更高效，保证找到最短路径。"""
+        },
+        "d-astar": {
+            "title": "8. 双向A*算法 (D-A*)",
+            "content": """核心思想：从起点和终点同时进行A*搜索，两个方向在中间相遇，并用正确的停止条件保证路径最短。
+
+流程：
+1. 初始化两个优先队列，分别加入起点和终点
+2. 两个方向使用平均势函数作为启发（均由曼哈顿距离构成）：
+   - 前向优先级 = 2 × 已走步数 + 到终点距离 - 到起点距离
+   - 后向优先级 = 2 × 已走步数 + 到起点距离 - 到终点距离
+3. 每次扩展优先队列较小的一侧：
+   - 取出优先级最小的格点，遍历四个方向，按A*规则更新代价并入队
+   - 若相邻格点已被另一方向到达 → 得到候选路径，记录最短的长度
+4. 两侧队首优先级之和 ≥ 2 × 最短候选长度 → 不存在更短的路径，停止
+5. 构建完整路径（起点→相遇点→终点）
+
+特点：保证找到最短路径，在开阔区域或长通道中扩展的格点比单向A*更少。"""
+        },
+        "jps": {
+            "title": "9. 跳点搜索 (JPS)",
+            "content": """核心思想：在A*的基础上裁剪对称路径。沿直线方向"跳跃"前进，只有遇到终点或强迫邻居（侧面出现新的通路）时才停下，把该格点作为跳点加入优先队列。
+
+流程：
+1. 初始化优先队列，加入起点
+2. 优先队列不为空：
+   - 取出估计总代价最小的跳点作为当前格点
+   - 若当前格点为终点 → 回溯跳点，补全跳点之间的直线段并返回
+   - 按到达方向裁剪需要搜索的方向（不回头）
+   - 沿每个方向跳跃：
+       - 水平跳跃：遇到终点，或上/下方可通行而来时方向的上/下方是墙 → 跳点
+       - 竖直跳跃：同理检查左/右方，并且若水平方向能找到跳点 → 当前格点也是跳点
+   - 跳点的代价 = 当前代价 + 直线距离，按A*规则加入优先队列
+3. 优先队列空 → 寻路失败
+
+特点：路径最优，在开阔区域中大幅减少入队次数。水平跳跃的结果按起点缓存，竖直跳跃中的水平探测不会重复扫描同一段。"""
         }
     },
 
@@ -214,6 +306,26 @@ ALGORITHM_INFO = {
                     "algorithm": "递归分割",
                     "idea": "分治建墙挖洞",
                     "features": "• 结构规整\n• 生成速度快"
+                },
+                {
+                    "algorithm": "Eller",
+                    "idea": "逐行合并集合",
+                    "features": "• 内存只与宽度有关\n• 可流式生成超高迷宫"
+                },
+                {
+                    "algorithm": "二叉树",
+                    "idea": "每格随机向上/向左",
+                    "features": "• 生成极快，可向量化\n• 方向偏向明显"
+                },
+                {
+                    "algorithm": "Sidewinder",
+                    "idea": "逐行行程向上打通",
+                    "features": "• 生成极快，可向量化\n• 首行为长走廊"
+                },
+                {
+                    "algorithm": "生长树",
+                    "idea": "按策略选格点生长",
+                    "features": "• 涵盖DFS与Prim\n• 纹理可连续调节"
                 }
             ]
         },
@@ -255,6 +367,16 @@ ALGORITHM_INFO = {
                     "algorithm": "D-BFS",
                     "idea": "双向扩散",
                     "features": "• 两个方向同时扩散\n• 保证最短路径\n• 效率通常优于单向BFS"
+                },
+                {
+                    "algorithm": "D-A*",
+                    "idea": "双向启发",
+                    "features": "• 两个方向同时A*\n• 保证最短路径\n• 扩展节点通常少于单向A*"
+                },
+                {
+                    "algorithm": "JPS",
+                    "idea": "跳跃裁剪",
+                    "features": "• 直线跳过对称路径\n• 保证最短路径\n• 开阔区域入队次数少"
                 }
             ]
         }
@@ -272,17 +394,20 @@ ABOUT_INFO = {
 将算法以可视化的方式逐步执行，帮助学习者理解算法思想。
     """,
     "features": [
-        "• 多种迷宫生成算法：DFS、Prim、Kruskal、递归分割",
-        "• 多种寻路算法：DFS、BFS、Dijkstra、GBFS、A*、D-DFS、D-BFS",
+        "• 多种迷宫生成算法：DFS、Prim、Kruskal、递归分割、Eller、二叉树、Sidewinder、生长树",
+        "• 多种寻路算法：DFS、BFS、Dijkstra、GBFS、A*、D-DFS、D-BFS、D-A*、JPS",
         "• 实时可视化算法执行过程",
-        "• 自定义迷宫大小（最大101×101）",
+        "• 自定义迷宫大小（最大1001×1001，超过101×101时使用位图渲染）",
         "• 可编辑迷宫（左键切换墙壁/路径，支持拖拽编辑）",
         "• 自定义起点/终点（右键点击路径）",
         "• 自定义颜色",
-        "• 迷宫编码/解码，方便保存",
+        "• 迷宫编码/解码，方便保存（支持随机种子与种子编码）",
+        "• 增量重规划（LPA*，寻路后编辑墙壁即时修复路径）",
+        "• 完美迷宫树索引：鼠标悬停即显示到起点的距离",
         "• 缩放、平移查看功能",
         "• 可调节动画速度",
         "• 可暂停动画",
+        "• 可跳过动画（大迷宫自动跳过）",
         "• 支持单步执行（在暂停期间）",
     ],
     "tips": [
@@ -0,0 +1,167 @@
+"""
+分块并行生成超大迷宫（多进程，无界面运行，不依赖tkinter）
+
+把迷宫的格点按 tile×tile 分成若干块，每块在工作进程中用已有的生成算法独立生成一个完美迷宫，
+相邻两块共用一列（行）墙壁。然后在块之间随机选一棵生成树，
+每条树边在共用墙上打开一个缺口。每块内部是一棵树，块之间又以树的方式各连一次，
+所以拼接后的整个迷宫仍然连通且没有环路。
+代价是块边界处是一整条只有一个缺口的长墙，块越小，纹理上的"格子感"越明显。
+
+用法:
+    python tiled_generator.py --algo DFS --size 20001 --tile 1000 --seed 42 --workers 8 -o giant.txt
+"""
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from array import array
+import random
+import sys
+import time
+from maze_grid import MazeGrid
+from maze_generator import MazeGenerator
+from maze_codec import write_rows_as_base64
+
+
+def _split(count, tile):
+    """把count个格点按每块tile个分段，返回 [(起始格点, 格点数), ...]"""
+    return [(start, min(tile, count - start)) for start in range(0, count, tile)]
+
+
+def generate_tile(task):
+    """
+    生成单个块（在工作进程中执行）
+
+    参数:
+        task: (algo, width, height, seed) 元组，尺寸包含四周的墙
+
+    返回:
+        块的单元格字节
+    """
+    algo, width, height, seed = task
+    grid = MazeGrid.bordered(width, height)
+    MazeGenerator(grid, width, height, seed=seed).generate(algo)
+    return bytes(grid.cells)
+
+
+def generate_tiled(algo, width, height, tile=500, seed=None, workers=None):
+    """
+    分块并行生成迷宫
+
+    参数:
+        algo: 每块使用的生成算法名（见 MazeGenerator.ALGORITHMS）
+        width, height: 迷宫尺寸（奇数）
+        tile: 每块的边长（格点数，块的实际像素边长为 2 * tile + 1）
+        seed: 随机种子；块的种子与块间缺口都由它派生，结果与工作进程数无关
+        workers: 工作进程数，None表示CPU核心数；为1时在当前进程中生成
+
+    返回:
+        MazeGrid
+    """
+    if algo not in MazeGenerator.ALGORITHMS:
+        raise ValueError(f"未知的生成算法: {algo}")
+    if width % 2 == 0 or height % 2 == 0 or width < 3 or height < 3:
+        raise ValueError("迷宫尺寸必须为不小于3的奇数")
+    if tile < 1:
+        raise ValueError("块边长至少为1个格点")
+
+    rng = random.Random(seed)
+    columns = _split((width - 1) // 2, tile)
+    rows = _split((height - 1) // 2, tile)
+    tasks = [(algo, 2 * cw + 1, 2 * ch + 1, rng.getrandbits(64)) for _, ch in rows for _, cw in columns]
+
+    grid = MazeGrid(width, height)
+    cells = grid.cells
+
+    if workers == 1 or len(tasks) == 1:
+        results = map(generate_tile, tasks)
+        executor = None
+    else:
+        executor = ProcessPoolExecutor(max_workers=workers)
+        results = executor.map(generate_tile, tasks)
+    try:
+        # 按块顺序逐行拷入整个迷宫；相邻块共用的墙被写两次，都是墙
+        for k, tile_cells in enumerate(results):
+            r0, _ = rows[k // len(columns)]
+            c0, _ = columns[k % len(columns)]
+            _, tw, th, _ = tasks[k]
+            base = 2 * r0 * width + 2 * c0
+            for ty in range(th):
+                dst = base + ty * width
+                cells[dst:dst + tw] = tile_cells[ty * tw:(ty + 1) * tw]
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    _stitch(cells, width, rows, columns, rng)
+    return grid
+
+
+def _stitch(cells, width, rows, columns, rng):
+    """在块之间随机选一棵生成树（随机Kruskal），每条树边在共用墙上打开一个缺口"""
+    n_cols = len(columns)
+    n_tiles = len(rows) * n_cols
+
+    # 块之间的候选边：(块a, 块b, 是否为左右相邻)
+    edges = []
+    for r in range(len(rows)):
+        for c in range(n_cols):
+            k = r * n_cols + c
+            if c + 1 < n_cols:
+                edges.append((k, k + 1, True))
+            if r + 1 < len(rows):
+                edges.append((k, k + n_cols, False))
+    rng.shuffle(edges)
+
+    parent = array('i', range(n_tiles))
+
+    def find(a):
+        while parent[a] != a:
+            parent[a] = parent[parent[a]]
+            a = parent[a]
+        return a
+
+    for a, b, horizontal in edges:
+        ra, rb = find(a), find(b)
+        if ra == rb:
+            continue
+        parent[ra] = rb
+        if horizontal:
+            # 右侧块的左边界墙上，在该块行范围内选一个格点行
+            r0, ch = rows[b // n_cols]
+            x = 2 * columns[b % n_cols][0]
+            y = 2 * (r0 + rng.randrange(ch)) + 1
+        else:
+            # 下方块的上边界墙上，在该块列范围内选一个格点列
+            c0, cw = columns[b % n_cols]
+            x = 2 * (c0 + rng.randrange(cw)) + 1
+            y = 2 * rows[b // n_cols][0]
+        cells[y * width + x] = 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="分块并行生成超大迷宫")
+    parser.add_argument('--algo', default="DFS", choices=list(MazeGenerator.ALGORITHMS), help="每块使用的生成算法")
+    parser.add_argument('--size', type=int, default=None, help="迷宫边长（奇数），同时设置宽度和高度")
+    parser.add_argument('--width', type=int, default=2001, help="迷宫宽度（奇数）")
+    parser.add_argument('--height', type=int, default=2001, help="迷宫高度（奇数）")
+    parser.add_argument('--tile', type=int, default=500, help="每块的边长（格点数）")
+    parser.add_argument('--seed', type=int, default=None, help="随机种子")
+    parser.add_argument('--workers', type=int, default=None, help="工作进程数（默认CPU核心数）")
+    parser.add_argument('-o', '--output', required=True, help="输出文件路径（Base64编码）")
+    args = parser.parse_args(argv)
+
+    width = height = args.size
+    if args.size is None:
+        width, height = args.width, args.height
+
+    start_time = time.time()
+    grid = generate_tiled(args.algo, width, height, tile=args.tile, seed=args.seed, workers=args.workers)
+    elapsed = time.time() - start_time
+
+    cells = grid.cells
+    with open(args.output, 'w', encoding='ascii') as f:
+        write_rows_as_base64((cells[y * width:(y + 1) * width] for y in range(height)), width, height, f)
+    print(f"生成 {width}x{height} 耗时 {elapsed:.2f}s，已写入 {args.output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""
+完美迷宫的树索引：倍增法求最近公共祖先（LCA），无需搜索即可回答距离/路径查询
+"""
+from array import array
+from maze_grid import as_grid
+
+try:
+    import numpy as np
+except ImportError:  # NumPy为可选依赖，缺失时使用纯Python实现
+    np = None
+
+
+class TreeIndex:
+    """
+    生成算法（DFS/Prim/Kruskal/递归分割）得到的迷宫是一棵生成树，任意两格之间的路径唯一。
+    以某个格点为根建立一次索引后：
+        distance(a, b) = depth[a] + depth[b] - 2 * depth[lca(a, b)]，O(log n)
+        path(a, b) 沿父节点走到LCA，O(路径长度)
+
+    只对可通行格点编号（节点id），倍增表 up[k][v] 为v的第 2^k 个祖先。
+    迷宫存在环路或不连通时（例如编辑之后）构造函数抛出ValueError，调用方应退回普通寻路。
+    索引建立后与迷宫不再关联，迷宫被修改后需要重新建立。
+    """
+
+    def __init__(self, maze, root=None):
+        grid = as_grid(maze)
+        cells = grid.cells
+        w = grid.width
+        self.width = w
+
+        # 可通行格点编号；同时统计边数（每条边只在右/下方向计一次）
+        node_id = array('i', [-1]) * grid.size
+        node_cells = array('i')
+        edges = 0
+        for i in range(grid.size):
+            if not cells[i]:
+                node_id[i] = len(node_cells)
+                node_cells.append(i)
+                if i % w < w - 1 and not cells[i + 1]:
+                    edges += 1
+                if i + w < grid.size and not cells[i + w]:
+                    edges += 1
+        n = len(node_cells)
+        if n == 0:
+            raise ValueError("迷宫中没有可通行格点")
+        if edges != n - 1:
+            raise ValueError("迷宫存在环路或不连通，不是树")
+
+        # 从根开始BFS，得到父节点与深度
+        root_cell = grid.index(*root) if root is not None else node_cells[0]
+        if cells[root_cell]:
+            raise ValueError("根节点不是可通行格点")
+        parent = array('i', [-1]) * n
+        depth = array('i', [0]) * n
+        r = node_id[root_cell]
+        parent[r] = r
+        queue = [root_cell]
+        for cur in queue:
+            u = node_id[cur]
+            for nxt in grid.neighbors(cur):
+                v = node_id[nxt]
+                if parent[v] == -1:
+                    parent[v] = u
+                    depth[v] = depth[u] + 1
+                    queue.append(nxt)
+        if len(queue) != n:  # 边数为n-1但不连通 <=> 存在环路
+            raise ValueError("迷宫存在环路或不连通，不是树")
+
+        # 倍增表，层数只需覆盖最大深度
+        up = [parent]
+        levels = max(depth).bit_length()
+        if np is not None:
+            prev = np.frombuffer(parent, dtype=np.int32)
+            for _ in range(1, levels):
+                prev = prev[prev]
+                up.append(array('i', prev.tobytes()))
+        else:
+            for _ in range(1, levels):
+                prev = up[-1]
+                up.append(array('i', [prev[p] for p in prev]))
+
+        self.node_id = node_id
+        self.node_cells = node_cells
+        self.depth = depth
+        self.up = up
+
+    def _node(self, point):
+        x, y = point
+        i = y * self.width + x
+        if not (0 <= x < self.width and 0 <= i < len(self.node_id)) or self.node_id[i] == -1:
+            raise ValueError(f"{point} 不是可通行格点")
+        return self.node_id[i]
+
+    def _lca(self, u, v):
+        depth = self.depth
+        up = self.up
+        if depth[u] < depth[v]:
+            u, v = v, u
+        diff = depth[u] - depth[v]
+        k = 0
+        while diff:
+            if diff & 1:
+                u = up[k][u]
+            diff >>= 1
+            k += 1
+        if u == v:
+            return u
+        for k in range(len(up) - 1, -1, -1):
+            if up[k][u] != up[k][v]:
+                u = up[k][u]
+                v = up[k][v]
+        return up[0][u]
+
+    def lca(self, a, b):
+        """a、b两格在树上的最近公共祖先坐标"""
+        i = self.node_cells[self._lca(self._node(a), self._node(b))]
+        return i % self.width, i // self.width
+
+    def distance(self, a, b):
+        """a到b的路径步数（边数）"""
+        u, v = self._node(a), self._node(b)
+        depth = self.depth
+        return depth[u] + depth[v] - 2 * depth[self._lca(u, v)]
+
+    def path(self, a, b):
+        """a到b的唯一路径（坐标元组列表，包含两端）"""
+        u, v = self._node(a), self._node(b)
+        top = self._lca(u, v)
+        parent = self.up[0]
+
+        left = []
+        while u != top:
+            left.append(u)
+            u = parent[u]
+        right = []
+        while v != top:
+            right.append(v)
+            v = parent[v]
+        left.append(top)
+        left.extend(reversed(right))
+
+        w = self.width
+        node_cells = self.node_cells
+        return [(node_cells[u] % w, node_cells[u] // w) for u in left]